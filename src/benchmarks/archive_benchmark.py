@@ -0,0 +1,94 @@
+"""
+archive_benchmark.py - Einlesen der Textdateien gegen das Kurvenarchiv
+
+Erzeugt einen synthetischen Korpus, überführt ihn einmalig in ein Kurvenarchiv
+und misst für alle Messreihen:
+
+- Textdateien: MeasurementAnalyzer.read_all_measurements (SpecimenParser)
+- Archiv: CurveArchive öffnen und MeasurementAnalyzer.load_from_archive
+
+Die Kurven beider Wege werden auf Gleichheit geprüft (float64-Archiv).
+
+Aufruf: python -m src.benchmarks.archive_benchmark --series 20 --specimens 50
+"""
+
+# src/benchmarks/archive_benchmark.py
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+from src.benchmarks.synthetic_corpus import generate_corpus
+from src.config.settings import NamingInTheNameOf, SortOf
+from src.core.curve_archive import CurveArchive, build_archive
+from src.core.data_sorter import DataSorter
+from src.core.data_statistics import MeasurementAnalyzer
+from src.core.file_handler import FileHandler
+
+
+def read_text(folders: list[Path]) -> list[MeasurementAnalyzer]:
+    analyzers = []
+    for folder in folders:
+        naming = NamingInTheNameOf()
+        sorting = SortOf()
+        naming.update_paths(folder)
+        FileHandler.find_specimen_files(naming)
+        DataSorter.analyze_filenames(naming, sorting)
+        analyzer = MeasurementAnalyzer(1000.0, naming, sorting)
+        analyzer.read_all_measurements()
+        analyzers.append(analyzer)
+    return analyzers
+
+
+def read_archive(folders: list[Path], archive_path: Path) -> list[MeasurementAnalyzer]:
+    archive = CurveArchive(archive_path)
+    analyzers = []
+    for folder in folders:
+        analyzer = MeasurementAnalyzer(1000.0, NamingInTheNameOf(), SortOf())
+        analyzer.load_from_archive(archive, folder.name)
+        analyzers.append(analyzer)
+    return analyzers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des Kurvenarchivs")
+    parser.add_argument("--series", type=int, default=20, help="Anzahl der Messreihen")
+    parser.add_argument("--specimens", type=int, default=50, help="Proben pro Messreihe")
+    parser.add_argument("--samples", type=int, default=5000, help="Messpunkte pro Datei")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folders = generate_corpus(Path(tmp) / "korpus", n_series=args.series, n_specimens=args.specimens,
+                                  n_samples=args.samples, pool_size=64)
+        archive_path = Path(tmp) / "kurven.sfpa"
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            build_archive(folders, archive_path)
+            build_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            text_analyzers = read_text(folders)
+            text_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            archive_analyzers = read_archive(folders, archive_path)
+            archive_s = time.perf_counter() - start
+
+        for text, archived in zip(text_analyzers, archive_analyzers):
+            if (not np.array_equal(text.measurements_data.force, archived.measurements_data.force)
+                    or not np.array_equal(text.measurements_data.offsets, archived.measurements_data.offsets)
+                    or text.fiberdiameters != archived.fiberdiameters):
+                raise AssertionError(f"Abweichende Kurven in {text.naming.main_folder}")
+
+        n_files = args.series * args.specimens
+        print(f"{args.series} Messreihen, {n_files} Proben mit je {args.samples} Punkten")
+        print(f"Archiv erstellen:  {build_s:.2f} s ({archive_path.stat().st_size / 1e6:.1f} MB)")
+        print(f"Textdateien lesen: {text_s:.2f} s")
+        print(f"Archiv einbinden:  {archive_s:.3f} s ({text_s / archive_s:.0f}x schneller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+batch_kernel_benchmark.py - Kennwerte je Kurve gegen die gemeinsame Berechnung der Messreihe
+
+Vergleicht für synthetische Messreihen mit unterschiedlich langen Kurven:
+
+- je Kurve: metric_kernels.compute_curve_metrics in einer Python-Schleife
+- Messreihe: batch_kernels.compute_series_metrics auf dem MeasurementStore
+
+Alle gerundeten Kennwerte müssen übereinstimmen, die laufenden Arbeiten an den
+Intervallgrenzen bis auf die Rundung der Gleitkommaaddition. Mit --backend numba
+wird das numba-Backend gemessen; die erste Übersetzung wird nicht mitgemessen.
+Der genaue Abgleich der Backends steht in tests/test_kernel_backends.py.
+
+Aufruf: python -m src.benchmarks.batch_kernel_benchmark --specimens 20000 --samples 200 --backend numpy
+"""
+
+# src/benchmarks/batch_kernel_benchmark.py
+import argparse
+import time
+import numpy as np
+from src.benchmarks.synthetic_corpus import synthetic_curve
+from src.core.batch_kernels import KERNEL_BACKENDS, compute_series_metrics, resolve_kernel_backend
+from src.core.measurement_store import MeasurementStore
+from src.core.metric_kernels import compute_curve_metrics
+
+
+def compare(reference, batch) -> float:
+    """Prüft die Kennwerte und liefert die größte Abweichung der laufenden Arbeit."""
+    largest = 0.0
+    for i, (expected, actual) in enumerate(zip(reference, batch)):
+        cumulative = np.subtract(expected.cumulative_work, actual.cumulative_work)
+        largest = max(largest, float(np.max(np.abs(cumulative))))
+        if (expected.max_force, expected.max_force_index, expected.embedding_length, expected.work,
+                expected.work_before_fmax, expected.work_after_fmax, expected.work_intervals) != (
+                actual.max_force, actual.max_force_index, actual.embedding_length, actual.work,
+                actual.work_before_fmax, actual.work_after_fmax, actual.work_intervals):
+            raise AssertionError(f"Kennwerte von Kurve {i} weichen von der Einzelberechnung ab")
+    return largest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Kennwertberechnung einer Messreihe")
+    parser.add_argument("--specimens", type=int, default=20000, help="Anzahl der Kurven")
+    parser.add_argument("--samples", type=int, default=200, help="Mittlere Anzahl Messpunkte pro Kurve")
+    parser.add_argument("--intervals", type=int, default=10, help="Anzahl der Arbeitsintervalle")
+    parser.add_argument("--max-length", type=float, default=1000.0, help="Max. Einbetttiefe in µm")
+    parser.add_argument("--backend", choices=KERNEL_BACKENDS, default='numpy', help="Kernel-Backend der Messreihe")
+    args = parser.parse_args()
+    backend = resolve_kernel_backend(args.backend)
+
+    rng = np.random.default_rng(42)
+    sizes = rng.integers(max(args.samples // 2, 2), args.samples * 3 // 2 + 1, size=args.specimens)
+    store = MeasurementStore.from_curves(synthetic_curve(rng, int(size))[1:] for size in sizes)
+    print(f"{args.specimens} Kurven mit {sizes.min()}-{sizes.max()} Punkten ({len(store.force)} insgesamt)")
+
+    start = time.perf_counter()
+    reference = [compute_curve_metrics(distances, forces, args.max_length, args.intervals)
+                 for distances, forces in store]
+    loop_s = time.perf_counter() - start
+    print(f"{'je Kurve':<10} | {loop_s:>7.3f} s")
+
+    # Übersetzung (numba) vorab
+    compute_series_metrics(MeasurementStore.from_curves([store[0]]), args.max_length, args.intervals, backend=backend)
+    start = time.perf_counter()
+    batch = compute_series_metrics(store, args.max_length, args.intervals, backend=backend)
+    batch_s = time.perf_counter() - start
+    print(f"{'Messreihe':<10} | {batch_s:>7.3f} s | {loop_s / batch_s:>5.1f}x ({backend})")
+
+    largest = compare(reference, batch)
+    print(f"Kennwerte identisch, laufende Arbeit max. Abweichung {largest:.1e} µJ")
+
+
+if __name__ == "__main__":
+    main()
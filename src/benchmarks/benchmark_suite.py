@@ -0,0 +1,247 @@
+"""
+benchmark_suite.py - Reproduzierbare Laufzeitmessung der gesamten Auswertung
+
+Erzeugt mit synthetic_corpus einen Korpus im Laborformat (40 Kopfzeilen,
+Faserdurchmesser in Zeile 20, Zeit/Weg/Kraft tabulatorgetrennt; neues und
+altes Namensschema abwechselnd je Messreihe) und misst die Schritte getrennt:
+
+- Einlesen: Dateisuche, Sortierung, Einlesen und Faserdurchmesser
+- Kennwerte: calculate_all_metrics, flächennormierte Arbeit, normierte Intervalle
+- Statistik: Bootstrap und ANOVA über alle Messreihen (StatisticalAnalyzer)
+- Excel-Export: die fünf Einzeldateien des ExcelExporter
+- Plots: Kraft-Weg-, Box- und normierte Plots seriell (ohne Prozess-Pool)
+
+Jeder Durchlauf beginnt mit frischen Analyzern, gemeldet wird der Median über
+--repeat Durchläufe. Die Messwerte lassen sich als Baseline (JSON) speichern und
+spätere Läufe mit gleichen Korpus-Parametern dagegen vergleichen; ein Schritt
+gilt als langsamer, wenn er mehr als --tolerance (relativ) und mehr als
+--min-seconds (absolut) über der Baseline liegt. Baselines sind
+rechnerabhängig und sollten auf derselben Maschine verglichen werden.
+
+Aufruf:
+    python -m src.benchmarks.benchmark_suite --series 4 --specimens 20 --save-baseline baseline.json
+    python -m src.benchmarks.benchmark_suite --series 4 --specimens 20 --compare baseline.json
+"""
+
+# src/benchmarks/benchmark_suite.py
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+os.environ.setdefault("MPLBACKEND", "Agg")
+import numpy as np
+from src.benchmarks.synthetic_corpus import generate_corpus
+from src.config.settings import NamingInTheNameOf, SortOf
+from src.core.data_sorter import DataSorter
+from src.core.data_statistics import MeasurementAnalyzer
+from src.core.file_handler import FileHandler
+from src.utils.stage_profiler import StageProfiler
+
+STAGES = ('Einlesen', 'Kennwerte', 'Statistik', 'Excel-Export', 'Plots')
+BASELINE_VERSION = 1
+
+
+def ingest(series_folders: list[Path], max_length: float, read_workers: int = 8) -> dict:
+    """Liest alle Messreihen wie process_single_series ein (ohne Kennwerte)."""
+    analyzers = {}
+    for folder in series_folders:
+        naming = NamingInTheNameOf()
+        sorting = SortOf()
+        naming.update_paths(folder)
+        FileHandler.find_specimen_files(naming)
+        DataSorter.analyze_filenames(naming, sorting)
+        analyzer = MeasurementAnalyzer(naming=naming, sorting=sorting)
+        analyzer.max_allowed_length = max_length
+        analyzer.read_workers = read_workers
+        analyzer.read_all_measurements()
+        analyzer.process_all_fiberdiameters()
+        analyzers[folder.name] = analyzer
+    return analyzers
+
+
+def compute_metrics(analyzers: dict, max_length: float) -> None:
+    """Alle Kennwerte, die für Statistik, Export und Plots gebraucht werden."""
+    for analyzer in analyzers.values():
+        analyzer.calculate_all_metrics(max_allowed_length=max_length)
+        analyzer.calculate_area_normalized_works(max_allowed_length=max_length)
+        analyzer.calculate_area_normalized_work_segments(max_allowed_length=max_length)
+        analyzer.calculate_normed_intervals()
+        analyzer.calculate_interval_statistics()
+
+
+def run_statistics(analyzers: dict, folder: Path, bootstrap_n: int) -> None:
+    from src.core.statistical_analysis import StatisticalAnalyzer
+    StatisticalAnalyzer(logger=logging.getLogger('SFPO_Analyzer')).compare_groups(
+        analyzers, folder, bootstrap_n=bootstrap_n)
+
+
+def export_excel(analyzers: dict, folder: Path) -> int:
+    """Schreibt die Einzeldateien; liefert die Anzahl geschriebener Dateien."""
+    from src.core.excel_exporter import ExcelExporter
+    exporter = ExcelExporter(output_folder=folder)
+    for name, analyzer in analyzers.items():
+        exporter.add_measurement_series(name, analyzer)
+    paths = [exporter.save_to_excel(), exporter.save_work_intervals_to_excel(),
+             exporter.save_boxplot_data_to_excel(), exporter.save_area_normalized_work_to_excel(),
+             exporter.save_work_segments_to_excel()]
+    return sum(path is not None for path in paths)
+
+
+def render_plots(analyzers: dict, folder: Path, max_length: float) -> int:
+    """Rendert eine feste Auswahl an Plots seriell; liefert die Anzahl der Jobs."""
+    from src.core.plot_scheduler import PlotScheduler
+    scheduler = PlotScheduler(analyzers, parallel=False)
+    scheduler.add('save_plots_for_series', folder, max_embedding_length=max_length)
+    scheduler.add('create_boxplots', folder)
+    scheduler.add('create_work_interval_plots', folder)
+    scheduler.add('create_normalized_plots', folder)
+    return len(scheduler.run())
+
+
+def warm_up(stages: list[str]) -> None:
+    """Lädt die erst bei Bedarf importierten Module vorab, damit der erste Durchlauf nicht die Importe misst."""
+    if 'Statistik' in stages:
+        import src.core.statistical_analysis
+    if 'Excel-Export' in stages:
+        import src.core.excel_exporter
+    if 'Plots' in stages:
+        import src.core.plot_scheduler
+        import src.core.data_plotting
+
+
+def run_pipeline(series_folders: list[Path], output_folder: Path, profiler: StageProfiler,
+                 args: argparse.Namespace) -> None:
+    """Ein Durchlauf aller ausgewählten Schritte mit frischen Analyzern."""
+    n_specimens = args.series * args.specimens
+    with profiler.stage('Einlesen', args.series * (args.specimens + args.failed)):
+        analyzers = ingest(series_folders, args.max_length, args.read_workers)
+    with profiler.stage('Kennwerte', n_specimens):
+        compute_metrics(analyzers, args.max_length)
+    if 'Statistik' in args.stages:
+        with profiler.stage('Statistik', args.series):
+            run_statistics(analyzers, output_folder, args.bootstrap)
+    if 'Excel-Export' in args.stages:
+        with profiler.stage('Excel-Export') as stage:
+            stage.items = export_excel(analyzers, output_folder)
+    if 'Plots' in args.stages:
+        with profiler.stage('Plots') as stage:
+            stage.items = render_plots(analyzers, output_folder, args.max_length)
+
+
+def summarize(profiler: StageProfiler) -> dict:
+    """Median von Wand- und CPU-Zeit je Schritt über alle Durchläufe."""
+    summary = {}
+    for stage in STAGES:
+        records = [record for record in profiler.records if record.stage == stage]
+        if records:
+            summary[stage] = {'wall_s': statistics.median(record.wall_s for record in records),
+                              'cpu_s': statistics.median(record.cpu_s for record in records),
+                              'items': records[0].items, 'runs': len(records)}
+    return summary
+
+
+def corpus_parameters(args: argparse.Namespace) -> dict:
+    return {'series': args.series, 'specimens': args.specimens, 'failed': args.failed, 'samples': args.samples,
+            'seed': args.seed, 'bootstrap': args.bootstrap, 'max_length': args.max_length,
+            'read_workers': args.read_workers}
+
+
+def environment() -> dict:
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+            'machine': platform.machine(), 'cpus': os.cpu_count()}
+
+
+def compare(summary: dict, baseline: dict, tolerance: float, min_seconds: float) -> list[str]:
+    """Vergleicht die Wandzeiten mit der Baseline und liefert die langsameren Schritte."""
+    regressions = []
+    print(f"\n{'Schritt':<14} {'Baseline [s]':>12} {'Aktuell [s]':>12} {'Faktor':>7}")
+    for stage, current in summary.items():
+        reference = baseline['stages'].get(stage)
+        if reference is None:
+            print(f"{stage:<14} {'-':>12} {current['wall_s']:>12.3f} {'-':>7}")
+            continue
+        ratio = current['wall_s'] / reference['wall_s'] if reference['wall_s'] > 0 else float('inf')
+        slower = (current['wall_s'] > reference['wall_s'] * (1 + tolerance)
+                  and current['wall_s'] - reference['wall_s'] > min_seconds)
+        print(f"{stage:<14} {reference['wall_s']:>12.3f} {current['wall_s']:>12.3f} {ratio:>6.2f}x"
+              f"{'  LANGSAMER' if slower else ''}")
+        if slower:
+            regressions.append(stage)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark-Suite der SFPO-Auswertung")
+    parser.add_argument("--series", type=int, default=3, help="Anzahl der Messreihen")
+    parser.add_argument("--specimens", type=int, default=15, help="Erfolgreiche Proben je Messreihe (max. 100)")
+    parser.add_argument("--failed", type=int, default=2, help="Faserbrüche je Messreihe")
+    parser.add_argument("--samples", type=int, default=3000, help="Messpunkte je Probe")
+    parser.add_argument("--seed", type=int, default=42, help="Startwert des Zufallsgenerators")
+    parser.add_argument("--repeat", type=int, default=3, help="Anzahl der Durchläufe (Median)")
+    parser.add_argument("--bootstrap", type=int, default=200, help="Bootstrap-Stichproben im Statistik-Schritt")
+    parser.add_argument("--max-length", type=float, default=1000.0, help="Max. Einbetttiefe in µm")
+    parser.add_argument("--read-workers", type=int, default=8, help="Threads zum Einlesen je Messreihe")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES),
+                        help="Zu messende Schritte (Einlesen und Kennwerte laufen immer)")
+    parser.add_argument("--corpus", type=Path, default=None,
+                        help="Ordner für den Korpus (Standard: temporär, wird wieder gelöscht)")
+    parser.add_argument("--save-baseline", type=Path, default=None, metavar="DATEI",
+                        help="Ergebnisse als Baseline (JSON) speichern")
+    parser.add_argument("--compare", type=Path, default=None, metavar="DATEI",
+                        help="Mit einer gespeicherten Baseline vergleichen")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Erlaubte relative Verlangsamung")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Erlaubte absolute Verlangsamung in s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        corpus_root = args.corpus or Path(temp) / "korpus"
+        series_folders = generate_corpus(corpus_root, args.series, args.specimens, args.samples,
+                                         failed_per_series=args.failed, seed=args.seed)
+        print(f"Korpus: {args.series} Messreihen x {args.specimens + args.failed} Proben x "
+              f"{args.samples} Messpunkte in {corpus_root}")
+
+        warm_up(args.stages)
+        profiler = StageProfiler()
+        for run in range(args.repeat):
+            output_folder = Path(temp) / f"ergebnisse_{run}"
+            output_folder.mkdir()
+            # Ausgaben der Analyzer und Exporter unterdrücken
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_pipeline(series_folders, output_folder, profiler, args)
+    summary = summarize(profiler)
+
+    print(f"\n{'Schritt':<14} {'Wand [s]':>9} {'CPU [s]':>9} {'Elemente':>9}   (Median aus {args.repeat})")
+    for stage, values in summary.items():
+        print(f"{stage:<14} {values['wall_s']:>9.3f} {values['cpu_s']:>9.3f} {values['items'] or '-':>9}")
+
+    result = {'version': BASELINE_VERSION, 'created': datetime.now().isoformat(timespec='seconds'),
+              'parameters': corpus_parameters(args), 'environment': environment(), 'stages': summary}
+    if args.save_baseline is not None:
+        args.save_baseline.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\nBaseline gespeichert in {args.save_baseline}")
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+    if baseline.get('parameters') != result['parameters']:
+        print(f"\nWarnung: Korpus-Parameter der Baseline weichen ab: {baseline.get('parameters')}")
+    if baseline.get('environment') != result['environment']:
+        print(f"Warnung: Baseline wurde in anderer Umgebung erstellt: {baseline.get('environment')}")
+    regressions = compare(summary, baseline, args.tolerance, args.min_seconds)
+    if regressions:
+        print(f"\nLangsamer als die Baseline: {', '.join(regressions)}")
+        return 1
+    print("\nKeine Verlangsamung gegenüber der Baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
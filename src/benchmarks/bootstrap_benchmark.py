@@ -0,0 +1,59 @@
+"""
+bootstrap_benchmark.py - Schleifen-Bootstrap gegen die Matrix-Engine
+
+Vergleicht die frühere Python-Schleife (np.random.choice pro Stichprobe) mit
+bootstrap_statistics für typische Stichprobengrößen einer Messreihe.
+
+Aufruf: python -m src.benchmarks.bootstrap_benchmark --resamples 100000
+"""
+
+# src/benchmarks/bootstrap_benchmark.py
+import argparse
+import time
+import numpy as np
+from src.core.statistical_analysis import bootstrap_statistics, DEFAULT_BOOTSTRAP_MEMORY_MB
+
+
+def bootstrap_loop(data: np.ndarray, n_bootstrap: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bisherige Umsetzung: eine Stichprobe pro Schleifendurchlauf."""
+    n = len(data)
+    means = np.zeros(n_bootstrap)
+    medians = np.zeros(n_bootstrap)
+    stds = np.zeros(n_bootstrap)
+    for i in range(n_bootstrap):
+        sample = data[np.random.choice(n, size=n, replace=True)]
+        means[i] = np.mean(sample)
+        medians[i] = np.median(sample)
+        stds[i] = np.std(sample, ddof=1)
+    return means, medians, stds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Bootstrap-Engine")
+    parser.add_argument("--resamples", type=int, default=100000, help="Anzahl der Bootstrap-Stichproben")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 100], help="Stichprobengrößen")
+    parser.add_argument("--memory-mb", type=float, default=DEFAULT_BOOTSTRAP_MEMORY_MB,
+                        help="Speicherbudget pro Block in MB")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'n':>6} | {'Schleife [s]':>12} | {'Engine [s]':>10} | {'Faktor':>7} | CI Mittelwert (Engine)")
+    print("-" * 70)
+    for n in args.sizes:
+        data = rng.normal(0.15, 0.03, n)
+
+        start = time.perf_counter()
+        bootstrap_loop(data, args.resamples)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        means, _, _ = bootstrap_statistics(data, args.resamples, np.random.default_rng(42), args.memory_mb)
+        engine_time = time.perf_counter() - start
+
+        ci = np.percentile(means, [2.5, 97.5])
+        print(f"{n:>6} | {loop_time:>12.3f} | {engine_time:>10.3f} | {loop_time / engine_time:>6.1f}x | "
+              f"[{ci[0]:.4f}, {ci[1]:.4f}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+decimation_benchmark.py - Kraft-Weg-Plots mit und ohne Ausdünnung der Kurven
+
+Rendert eine synthetische Messreihe mit hoher Abtastrate über das
+CurvePlotTemplate einmal mit allen Punkten und einmal je Ausdünnungsverfahren.
+Gemeldet werden Punktzahl, Zeit pro Abbildung und der Anteil abweichender
+Pixel gegenüber der Abbildung mit allen Punkten.
+
+Aufruf: python -m src.benchmarks.decimation_benchmark --samples 200000
+"""
+
+# src/benchmarks/decimation_benchmark.py
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.image as mpimg
+import numpy as np
+from src.benchmarks.synthetic_corpus import synthetic_curve
+from src.core.curve_decimation import DECIMATION_METHODS, resolve_pixels, decimate_curves
+from src.core.data_plotting import DataPlotter
+from src.core.measurement_store import Curve
+from src.core.plot_templates import get_template, CurvePlotTemplate, SAVE_DPI
+
+
+def render(template: CurvePlotTemplate, curves: list[Curve], path: Path) -> float:
+    """Rendert die Kurven und gibt die Zeit in Sekunden zurück."""
+    start = time.perf_counter()
+    template.render(curves, path)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Kurven-Ausdünnung")
+    parser.add_argument("--samples", type=int, default=200000, help="Punkte pro Kurve")
+    parser.add_argument("--curves", type=int, default=10, help="Kurven pro Abbildung")
+    parser.add_argument("--pixels", type=int, default=None, help="Ausgabeauflösung (Standard: Breite der Abbildung)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    curves = [Curve(*synthetic_curve(rng, args.samples)[1:]) for _ in range(args.curves)]
+
+    DataPlotter.setup_plot_style()
+    template = get_template(CurvePlotTemplate, 1000.0)
+    pixels = resolve_pixels(template.figsize[0], SAVE_DPI, args.pixels)
+
+    print(f"{args.curves} Kurven mit je {args.samples} Punkten, Auflösung {pixels} Pixel")
+    print(f"{'Verfahren':<10} | {'Punkte':>9} | {'Ausdünnen [ms]':>14} | {'Plot [s]':>8} | {'abweichende Pixel':>17}")
+    with tempfile.TemporaryDirectory() as tmp:
+        reference_path = Path(tmp) / "reference.png"
+        reference_s = render(template, curves, reference_path)
+        reference = mpimg.imread(reference_path)
+        print(f"{'alle':<10} | {sum(len(c.force) for c in curves):>9} | {0.0:>14.1f} | {reference_s:>8.2f} | {0.0:>16.3f}%")
+
+        for method in DECIMATION_METHODS:
+            start = time.perf_counter()
+            decimated = decimate_curves(curves, method, pixels, template.x_range)
+            decimate_ms = (time.perf_counter() - start) * 1000
+            path = Path(tmp) / f"{method}.png"
+            render_s = render(template, decimated, path)
+            image = mpimg.imread(path)
+            differing = (np.abs(image - reference).max(axis=2) > 1 / 255).mean() * 100 \
+                if image.shape == reference.shape else float('nan')
+            print(f"{method:<10} | {sum(len(c.force) for c in decimated):>9} | {decimate_ms:>14.1f} | "
+                  f"{render_s:>8.2f} | {differing:>16.3f}%")
+
+
+if __name__ == "__main__":
+    main()
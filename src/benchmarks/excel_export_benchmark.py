@@ -0,0 +1,121 @@
+"""
+excel_export_benchmark.py - Einzel-Excel-Dateien gegen den gestreamten Gesamtexport
+
+Erzeugt synthetische Messreihen (Analyzer mit allen für den Export benötigten
+Kennwerten) und vergleicht:
+
+- bisher: fünf save_*-Aufrufe, je eine Datei über pd.ExcelWriter
+- Gesamtexport: alle Tabellen einmal aufgebaut, gestreamt mit xlsxwriter bzw. openpyxl
+
+Gemeldet werden Laufzeit und Spitzenbedarf an Python-Speicher (tracemalloc).
+
+Aufruf: python -m src.benchmarks.excel_export_benchmark --series 200
+"""
+
+# src/benchmarks/excel_export_benchmark.py
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+from src.config.settings import NamingInTheNameOf, SortOf
+from src.benchmarks.synthetic_corpus import synthetic_curve
+from src.core.data_statistics import MeasurementAnalyzer
+from src.core.excel_exporter import ExcelExporter
+from src.core.excel_streaming import STREAMING_ENGINES, available_engine
+from src.core.measurement_store import Curve
+from src.core.metric_kernels import compute_curve_metrics
+from src.core.specimen_parser import SpecimenHeader
+
+
+def synthetic_analyzers(n_series: int, n_specimens: int, n_samples: int = 1000, seed: int = 42) -> dict:
+    """Erzeugt Analyzer mit Kennwerten, Intervallen und flächennormierter Arbeit."""
+    rng = np.random.default_rng(seed)
+    pool = [Curve(*synthetic_curve(rng, n_samples)[1:]) for _ in range(4 * n_specimens)]
+    pool_metrics = [compute_curve_metrics(curve.displacement, curve.force, 1000.0) for curve in pool]
+
+    analyzers = {}
+    for s in range(n_series):
+        picks = rng.choice(len(pool), size=n_specimens, replace=False)
+        # Eigener Namens-/Sortierzustand je Messreihe, wie nach dem Einlesen eines Ordners
+        name = f"Serie_{s:03d}"
+        naming = NamingInTheNameOf()
+        naming.update_paths(Path(name))
+        sorting = SortOf(good_ones=[f"{i:02d}a_probe" for i in range(n_specimens)])
+        analyzer = MeasurementAnalyzer(1000.0, naming, sorting)
+        analyzer.load_specimens([pool[i] for i in picks],
+                                [SpecimenHeader(fiber_diameter=rng.uniform(6.0, 9.0)) for _ in picks],
+                                [pool_metrics[i] for i in picks])
+        analyzer.calculate_area_normalized_works(max_allowed_length=1000.0)
+        analyzer.calculate_area_normalized_work_segments(max_allowed_length=1000.0)
+        analyzer.calculate_normed_intervals()
+        analyzer.calculate_interval_statistics()
+        analyzers[name] = analyzer
+    return analyzers
+
+
+def export_separate(analyzers: dict, folder: Path) -> list[Path]:
+    exporter = _exporter(analyzers, folder)
+    return [exporter.save_to_excel(), exporter.save_work_intervals_to_excel(),
+            exporter.save_boxplot_data_to_excel(), exporter.save_area_normalized_work_to_excel(),
+            exporter.save_work_segments_to_excel()]
+
+
+def export_consolidated(analyzers: dict, folder: Path, engine: str) -> list[Path]:
+    return _exporter(analyzers, folder).save_consolidated(engine=engine)
+
+
+def _exporter(analyzers: dict, folder: Path) -> ExcelExporter:
+    exporter = ExcelExporter(output_folder=folder)
+    for name, analyzer in analyzers.items():
+        exporter.add_measurement_series(name, analyzer)
+    return exporter
+
+
+def measure(function, *args) -> tuple[float, float, int]:
+    """Führt function aus; liefert Laufzeit [s], Speicherspitze [MB] und Gesamtgröße der Dateien [kB]."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        paths = function(*args)
+        duration = time.perf_counter() - start
+
+        tracemalloc.start()
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    size = sum(path.stat().st_size for path in paths if path) // 1024
+    return duration, peak / 1e6, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des Excel-Exports")
+    parser.add_argument("--series", type=int, default=200, help="Anzahl der Messreihen")
+    parser.add_argument("--specimens", type=int, default=10, help="Proben pro Messreihe")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzers = synthetic_analyzers(args.series, args.specimens)
+    print(f"{args.series} Messreihen mit je {args.specimens} Proben")
+    print(f"{'Export':<26} | {'Zeit [s]':>8} | {'Speicher [MB]':>13} | {'Dateien [kB]':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [("5 Dateien (pd.ExcelWriter)", export_separate, ())]
+        for engine in STREAMING_ENGINES:
+            try:
+                available_engine(engine)
+            except ImportError:
+                print(f"{engine} nicht installiert, übersprungen")
+                continue
+            cases.append((f"Gesamtexport ({engine})", export_consolidated, (engine,)))
+
+        for i, (label, function, extra) in enumerate(cases):
+            folder = Path(tmp) / str(i)
+            duration, peak_mb, size_kb = measure(function, analyzers, folder, *extra)
+            print(f"{label:<26} | {duration:>8.2f} | {peak_mb:>13.1f} | {size_kb:>12}")
+
+
+if __name__ == "__main__":
+    main()
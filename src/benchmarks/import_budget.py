@@ -0,0 +1,80 @@
+"""
+import_budget.py - Prüft die Importzeit von src.main mit python -X importtime
+
+Startet einen frischen Interpreter, misst die kumulierte Importzeit der
+Einstiegsmodule und prüft, dass GUI-, Plot- und Statistikbibliotheken beim
+Start nicht geladen werden. Bei Überschreitung endet das Skript mit Code 1,
+es kann daher direkt in Batch-Skripten oder CI verwendet werden. Im Testlauf
+prüft tests/test_import_budget.py die verbotenen Module immer, das Zeitbudget
+nur mit SFPO_CHECK_IMPORT_TIME=1.
+
+Aufruf: python -m src.benchmarks.import_budget [--budget-ms 400]
+"""
+
+# src/benchmarks/import_budget.py
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+# Module, die beim Start nicht geladen werden dürfen
+FORBIDDEN_AT_STARTUP = ('tkinter', 'matplotlib', 'pandas', 'scipy', 'statsmodels', 'seaborn')
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def measure_import(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Importiert module in einem frischen Interpreter mit -X importtime.
+
+    Returns:
+        Dictionary Modulname -> (eigene Zeit, kumulierte Zeit) in µs
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def check_budget(module: str, budget_ms: float, repeats: int = 3) -> bool:
+    """Misst den Import mehrfach (bester Wert zählt) und prüft Budget und verbotene Module."""
+    best = None
+    for _ in range(repeats):
+        timings = measure_import(module)
+        if best is None or timings[module][1] < best[module][1]:
+            best = timings
+
+    total_ms = best[module][1] / 1000
+    forbidden = sorted({name.split('.')[0] for name in best} & set(FORBIDDEN_AT_STARTUP))
+
+    print(f"Import von {module}: {total_ms:.0f} ms (Budget {budget_ms:.0f} ms)")
+    print("Größte Einzelposten (kumuliert):")
+    top = sorted(best.items(), key=lambda item: item[1][1], reverse=True)[1:11]
+    for name, (_, cumulative_us) in top:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+    if forbidden:
+        print(f"Beim Start geladen, obwohl nicht benötigt: {', '.join(forbidden)}")
+
+    return total_ms <= budget_ms and not forbidden
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importzeit-Budget für den SFPO-Analyzer")
+    parser.add_argument("--module", default="src.main", help="Zu prüfendes Modul")
+    parser.add_argument("--budget-ms", type=float, default=400.0, help="Erlaubte Importzeit in ms")
+    parser.add_argument("--repeats", type=int, default=3, help="Anzahl der Messungen")
+    args = parser.parse_args()
+
+    ok = check_budget(args.module, args.budget_ms, args.repeats)
+    print("OK" if ok else "Budget überschritten")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
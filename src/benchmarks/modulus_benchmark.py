@@ -0,0 +1,64 @@
+"""
+modulus_benchmark.py - Verbundmodul je Kurve gegen die gemeinsame Berechnung der Messreihe
+
+Vergleicht für synthetische Messreihen:
+
+- je Kurve: argmin über den Abschnitt vor F_max (wie in compute_curve_metrics)
+- Messreihe: modulus_engine.compute_moduli auf dem MeasurementStore (Sekante und Ausgleichsgerade)
+
+Die Sekanten-Moduln beider Wege müssen übereinstimmen.
+
+Aufruf: python -m src.benchmarks.modulus_benchmark --specimens 1000 --samples 5000
+"""
+
+# src/benchmarks/modulus_benchmark.py
+import argparse
+import time
+import numpy as np
+from src.benchmarks.synthetic_corpus import synthetic_curve
+from src.core.measurement_store import MeasurementStore
+from src.core.modulus_engine import ModulusSettings, compute_moduli
+
+
+def per_curve_moduli(store: MeasurementStore, lower: float, upper: float) -> list[float]:
+    """Bisheriger Weg: eine Kurve nach der anderen."""
+    moduli = []
+    for distances, forces in store:
+        max_index = int(np.argmax(forces))
+        before_max = forces[:max_index + 1]
+        low = int(np.argmin(np.abs(before_max - forces[max_index] * lower)))
+        high = int(np.argmin(np.abs(before_max - forces[max_index] * upper)))
+        if distances[low] >= distances[high]:
+            moduli.append(0.0)
+        else:
+            moduli.append(round((forces[high] - forces[low]) / (distances[high] - distances[low]), 4))
+    return moduli
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Verbundmodul-Berechnung")
+    parser.add_argument("--specimens", type=int, default=1000, help="Anzahl der Kurven")
+    parser.add_argument("--samples", type=int, default=5000, help="Messpunkte pro Kurve")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    store = MeasurementStore.from_curves(synthetic_curve(rng, args.samples)[1:] for _ in range(args.specimens))
+    print(f"{args.specimens} Kurven mit je {args.samples} Punkten")
+
+    start = time.perf_counter()
+    reference = per_curve_moduli(store, 0.2, 0.7)
+    loop_s = time.perf_counter() - start
+    print(f"{'je Kurve (secant)':<22} | {loop_s:>7.3f} s")
+
+    for fit in ('secant', 'lstsq'):
+        start = time.perf_counter()
+        result = compute_moduli(store, ModulusSettings(fit=fit))
+        batch_s = time.perf_counter() - start
+        print(f"{'Messreihe (' + fit + ')':<22} | {batch_s:>7.3f} s | {loop_s / batch_s:>5.1f}x")
+        if fit == 'secant' and result.moduli.tolist() != reference:
+            raise AssertionError("Sekanten-Moduln weichen von der Einzelberechnung ab")
+    print("Sekanten-Moduln identisch")
+
+
+if __name__ == "__main__":
+    main()
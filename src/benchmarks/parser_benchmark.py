@@ -0,0 +1,107 @@
+"""
+parser_benchmark.py - Vergleich SpecimenParser gegen den bisherigen pandas-Pfad
+
+Erzeugt einen synthetischen Korpus (Standard: 10.000 Dateien) und misst das
+Einlesen von Kurve und Faserdurchmesser:
+- pandas: Zeilenweises Lesen bis Zeile 20 plus pd.read_csv(skiprows=40), zwei Dateizugriffe
+- parser: SpecimenParser, ein Dateizugriff mit NumPy-Massenkonvertierung
+
+Aufruf: python -m src.benchmarks.parser_benchmark --files 10000 --samples 1000
+"""
+
+# src/benchmarks/parser_benchmark.py
+import argparse
+import math
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.benchmarks.synthetic_corpus import generate_corpus
+from src.core.specimen_parser import SpecimenParser
+
+
+def read_with_pandas(file_path: Path, max_allowed_length: float) -> tuple[float, np.ndarray, np.ndarray]:
+    """Bisheriger Einlesepfad: Durchmesser per Zeilenscan, Kurve per pd.read_csv."""
+    diameter = 0.0
+    with open(file_path, 'r') as file:
+        for i, line in enumerate(file, 1):
+            if i == 20:
+                diameter = float(line.split('\t')[1].strip())
+                break
+    df = pd.read_csv(
+        file_path,
+        delimiter="\t",
+        header=None,
+        skiprows=40,
+        encoding='unicode_escape',
+        names=["Time", "Displacement", "Force"],
+        usecols=["Displacement", "Force"])
+    df = df[
+        (df["Displacement"] > 0) &
+        (df["Displacement"] < max_allowed_length) &
+        (df["Force"] >= 0)]
+    return diameter, df["Displacement"].to_numpy(), df["Force"].to_numpy()
+
+
+def run_benchmark(root: Path, n_files: int, n_samples: int, max_allowed_length: float = 1000.0) -> dict:
+    """Erzeugt den Korpus unter root und misst beide Einlesepfade."""
+    specimens_per_series = 100
+    n_series = math.ceil(n_files / specimens_per_series)
+
+    start = time.perf_counter()
+    generate_corpus(root, n_series=n_series, n_specimens=specimens_per_series, n_samples=n_samples,
+                    failed_per_series=0, pool_size=64)
+    generation_time = time.perf_counter() - start
+    paths = sorted(root.rglob("*.txt"))[:n_files]
+
+    start = time.perf_counter()
+    pandas_results = [read_with_pandas(path, max_allowed_length) for path in paths]
+    pandas_time = time.perf_counter() - start
+
+    parser = SpecimenParser(max_allowed_length)
+    start = time.perf_counter()
+    parser_results = [parser.parse(path) for path in paths]
+    parser_time = time.perf_counter() - start
+
+    # Ergebnisse beider Pfade müssen übereinstimmen
+    for (diameter, displacement, force), specimen in zip(pandas_results, parser_results):
+        if (diameter != specimen.header.fiber_diameter
+                or not np.array_equal(displacement, specimen.curve.displacement)
+                or not np.array_equal(force, specimen.curve.force)):
+            raise AssertionError(f"Abweichende Ergebnisse für {specimen.path}")
+
+    return {
+        'files': len(paths),
+        'samples': n_samples,
+        'generation_s': generation_time,
+        'pandas_s': pandas_time,
+        'parser_s': parser_time,
+        'speedup': pandas_time / parser_time if parser_time > 0 else math.inf
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark SpecimenParser gegen pandas")
+    arg_parser.add_argument("--files", type=int, default=10000, help="Anzahl der Messdateien")
+    arg_parser.add_argument("--samples", type=int, default=1000, help="Messpunkte pro Datei")
+    arg_parser.add_argument("--root", type=Path, default=None,
+                            help="Ordner für den Korpus (Standard: temporärer Ordner)")
+    args = arg_parser.parse_args()
+
+    if args.root is not None:
+        args.root.mkdir(parents=True, exist_ok=True)
+        result = run_benchmark(args.root, args.files, args.samples)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run_benchmark(Path(tmp), args.files, args.samples)
+
+    print(f"Dateien: {result['files']}, Messpunkte pro Datei: {result['samples']}")
+    print(f"Korpus erzeugt in {result['generation_s']:.2f} s")
+    print(f"pandas-Pfad:  {result['pandas_s']:.2f} s ({result['files'] / result['pandas_s']:.0f} Dateien/s)")
+    print(f"SpecimenParser: {result['parser_s']:.2f} s ({result['files'] / result['parser_s']:.0f} Dateien/s)")
+    print(f"Beschleunigung: {result['speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
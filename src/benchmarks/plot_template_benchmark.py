@@ -0,0 +1,109 @@
+"""
+plot_template_benchmark.py - Zeit pro Abbildung mit und ohne Plot-Templates
+
+Vergleicht für die normierten Arbeitsplots und die Arbeitsintervall-Plots die
+bisherige Umsetzung (neue pyplot-Abbildung pro Messreihe inkl. Ticks, Schriften
+und Gitter) mit den wiederverwendeten Templates aus plot_templates. Die
+Messreihen werden synthetisch erzeugt, die PNGs landen in einem temporären Ordner.
+
+Aufruf: python -m src.benchmarks.plot_template_benchmark --series 20
+"""
+
+# src/benchmarks/plot_template_benchmark.py
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from src.core.data_plotting import DataPlotter
+from src.core.plot_templates import clear_templates, INTERVAL_CENTERS
+
+
+def synthetic_series(n_series: int, n_specimens: int, seed: int = 42) -> dict:
+    """Erzeugt Analyzer-Ersatzobjekte mit Arbeitsintervallen und normierten Intervallen."""
+    rng = np.random.default_rng(seed)
+    series = {}
+    for s in range(n_series):
+        work = rng.uniform(0.5, 2.0, size=(n_specimens, 10)) * np.linspace(1.5, 0.1, 10)
+        normed = work / work.sum(axis=1, keepdims=True)
+        series[f"Serie_{s}"] = SimpleNamespace(work_intervals=work.tolist(), normed_intervals=normed.tolist())
+    return series
+
+
+def legacy_normalized_plots(analyzers_dict: dict, plots_folder: Path):
+    """Bisherige Umsetzung: komplette pyplot-Abbildung pro Messreihe."""
+    colors = plt.cm.plasma(np.linspace(0, 1, 10))
+    for name, analyzer in analyzers_dict.items():
+        plt.figure(figsize=(10, 8))
+        for i, normed_measurement in enumerate(analyzer.normed_intervals):
+            plt.plot(INTERVAL_CENTERS, normed_measurement, color=colors[i % len(colors)],
+                     label=f'Messung {i + 1}', marker='o')
+        plt.title(f'Normierte Arbeit - {name}', fontsize=24, fontweight='bold')
+        plt.xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
+        plt.ylabel('Normierte Arbeit pro Intervall', fontsize=24, fontweight='bold')
+        plt.xticks(np.arange(0, 101, 20), fontsize=22, fontweight='bold')
+        plt.yticks(fontsize=22, fontweight='bold')
+        plt.grid(True, linestyle='--', alpha=0.7)
+        plt.savefig(plots_folder / f"normalized_work_{name}.png", dpi=300, bbox_inches='tight')
+        plt.close()
+
+
+def legacy_work_interval_plots(analyzers_dict: dict, plots_folder: Path):
+    """Bisherige Umsetzung: Balken, Fehlerbalken und Formatierung pro Messreihe neu."""
+    for name, analyzer in analyzers_dict.items():
+        plt.figure(figsize=(12, 8))
+        values = np.array(analyzer.work_intervals)
+        means, stds = values.mean(axis=0), values.std(axis=0)
+        plt.bar(INTERVAL_CENTERS, means, width=8, color='lightblue', edgecolor='blue',
+                linewidth=1.5, alpha=0.7, label='Mittlere Arbeit pro Intervall')
+        plt.errorbar(INTERVAL_CENTERS, means, yerr=stds, fmt='none', ecolor='red',
+                     elinewidth=1.5, capsize=5, capthick=1.5)
+        plt.title(f'Arbeitsintervalle - {name}', fontsize=24, fontweight='bold')
+        plt.xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
+        plt.ylabel('Arbeit [µJ]', fontsize=24, fontweight='bold')
+        plt.xticks(np.arange(0, 101, 20), fontsize=22, fontweight='bold')
+        plt.yticks(fontsize=22, fontweight='bold')
+        plt.grid(True, axis='y', linestyle='--', alpha=0.7)
+        plt.gca().spines['right'].set_visible(False)
+        plt.gca().spines['top'].set_visible(False)
+        plt.tight_layout()
+        plt.savefig(plots_folder / f"work_intervals_{name}.png", dpi=300, bbox_inches='tight')
+        plt.close()
+
+
+def time_per_figure(function, series: dict, folder: Path) -> float:
+    """Führt eine Plot-Funktion für alle Messreihen aus und liefert die Zeit pro Abbildung in ms."""
+    start = time.perf_counter()
+    function(series, folder)
+    return (time.perf_counter() - start) * 1000 / len(series)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Plot-Templates")
+    parser.add_argument("--series", type=int, default=20, help="Anzahl der Messreihen")
+    parser.add_argument("--specimens", type=int, default=10, help="Proben pro Messreihe")
+    args = parser.parse_args()
+
+    series = synthetic_series(args.series, args.specimens)
+    cases = [
+        ("normierte Arbeit", legacy_normalized_plots, DataPlotter.create_normalized_plots),
+        ("Arbeitsintervalle", legacy_work_interval_plots, DataPlotter.create_work_interval_plots),
+    ]
+
+    print(f"{args.series} Messreihen, {args.specimens} Proben pro Messreihe")
+    print(f"{'Plot':<18} | {'bisher [ms]':>11} | {'Template [ms]':>13} | {'Faktor':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        for label, legacy, templated in cases:
+            clear_templates()
+            legacy_ms = time_per_figure(legacy, series, folder)
+            template_ms = time_per_figure(templated, series, folder)
+            print(f"{label:<18} | {legacy_ms:>11.1f} | {template_ms:>13.1f} | {legacy_ms / template_ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
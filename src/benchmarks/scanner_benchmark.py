@@ -0,0 +1,108 @@
+"""
+scanner_benchmark.py - rglob/iterdir gegen den scandir-Scanner
+
+Erzeugt einen synthetischen Korpus (Messreihen-Ordner, optional mit
+Unterordnern) und vergleicht:
+
+- bisher: Path.rglob('*.txt') plus stat je Datei für Größe/Änderungszeit,
+  iterdir/is_dir für die Messreihen-Ordner
+- Scanner: directory_scanner.scan_specimen_files (nebenläufig) und
+  iter_specimen_entries (nacheinander), scan_subfolders
+
+Geprüft wird, dass die Dateien in derselben Reihenfolge wie von rglob kommen.
+Mit --latency wird ein Netzlaufwerk nachgebildet: jeder Ordner- und jeder
+stat-Aufruf wartet zusätzlich (bisher: os.scandir/os.stat, Scanner: ein
+Ordneraufruf plus ein stat je Messdatei wie unter Linux; unter Windows
+entfällt das stat des Scanners).
+
+Aufruf: python -m src.benchmarks.scanner_benchmark --series 50 --specimens 40 --latency 0.002
+"""
+
+# src/benchmarks/scanner_benchmark.py
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from src.benchmarks.synthetic_corpus import generate_corpus
+from src.core import directory_scanner
+from src.core.directory_scanner import iter_specimen_entries, scan_specimen_files, scan_subfolders
+
+
+@contextlib.contextmanager
+def network_latency(latency: float):
+    """Verzögert os.scandir/os.stat (pathlib) und directory_scanner.scan_directory um latency je Aufruf."""
+    if latency <= 0:
+        yield
+        return
+    original_scandir, original_stat, original_scan = os.scandir, os.stat, directory_scanner.scan_directory
+
+    def slow(function, calls=lambda result: 1):
+        def wrapper(*args, **kwargs):
+            result = function(*args, **kwargs)
+            time.sleep(latency * calls(result))
+            return result
+        return wrapper
+
+    os.scandir, os.stat = slow(original_scandir), slow(original_stat)
+    directory_scanner.scan_directory = slow(original_scan, lambda result: 1 + len(result[0]))
+    try:
+        yield
+    finally:
+        os.scandir, os.stat, directory_scanner.scan_directory = original_scandir, original_stat, original_scan
+
+
+def legacy_scan(root: Path) -> list[tuple[str, int, int]]:
+    result = []
+    for path in root.rglob("*.txt"):
+        stat = path.stat()
+        result.append((path.stem, stat.st_size, stat.st_mtime_ns))
+    return result
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Verzeichnissuche")
+    parser.add_argument("--series", type=int, default=50, help="Anzahl der Messreihen-Ordner")
+    parser.add_argument("--specimens", type=int, default=40, help="Proben je Messreihe (max. 100)")
+    parser.add_argument("--nested", type=int, default=2, help="Unterordner je Messreihe (Kopien, z.B. Altdaten)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Künstliche Verzögerung je Dateisystemaufruf in s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        folders = generate_corpus(root, args.series, args.specimens, n_samples=20, pool_size=8)
+        for folder in folders:
+            for nested in range(args.nested):
+                generate_corpus(folder / f"alt_{nested}", 1, 3, n_samples=20, pool_size=1)
+        print(f"{args.series} Messreihen mit {args.specimens + 1} Proben und {args.nested} Unterordnern")
+
+        with network_latency(args.latency):
+            legacy, legacy_s = timed(legacy_scan, root)
+            entries, scanner_s = timed(scan_specimen_files, root)
+            sequential, sequential_s = timed(lambda: list(iter_specimen_entries(root)))
+            folders_legacy, folders_legacy_s = timed(lambda: [f for f in root.iterdir() if f.is_dir()])
+            folders_scanned, folders_scanned_s = timed(scan_subfolders, root)
+
+    for name, found in (("Scanner", entries), ("nacheinander", sequential)):
+        if [(entry.name, entry.size, entry.mtime_ns) for entry in found] != legacy:
+            raise AssertionError(f"{name}: Dateien oder Reihenfolge weichen von rglob ab")
+    if folders_scanned != folders_legacy:
+        raise AssertionError("Messreihen-Ordner weichen von iterdir ab")
+
+    print(f"{'rglob + stat':<22} | {legacy_s:>7.3f} s | {len(legacy)} Dateien")
+    print(f"{'Scanner (asyncio)':<22} | {scanner_s:>7.3f} s | {legacy_s / scanner_s:>5.1f}x")
+    print(f"{'Scanner (nacheinander)':<22} | {sequential_s:>7.3f} s | {legacy_s / sequential_s:>5.1f}x")
+    print(f"{'iterdir + is_dir':<22} | {folders_legacy_s:>7.3f} s | {len(folders_legacy)} Ordner")
+    print(f"{'scan_subfolders':<22} | {folders_scanned_s:>7.3f} s | {folders_legacy_s / folders_scanned_s:>5.1f}x")
+    print("Reihenfolge und Dateiangaben identisch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+synthetic_corpus.py - Erzeugt synthetische SFPO-Messdateien für Benchmarks
+
+Die Dateien folgen dem Laborformat: 40 Kopfzeilen (Faserdurchmesser in Zeile 20)
+und ein tabulatorgetrennter Datenblock Zeit/Weg/Kraft. Die Kraft-Weg-Kurve steigt
+linear bis F_max an und fällt danach bis zur Einbettlänge auf null ab.
+"""
+
+# src/benchmarks/synthetic_corpus.py
+from pathlib import Path
+import numpy as np
+from src.core.specimen_parser import HEADER_LINES, DIAMETER_LINE
+
+
+def synthetic_curve(rng: np.random.Generator, n_samples: int = 1000) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Erzeugt Zeit, Weg und Kraft einer synthetischen Messung."""
+    embedding_length = rng.uniform(200.0, 900.0)
+    peak_position = rng.uniform(5.0, 20.0)
+    max_force = rng.uniform(0.05, 0.25)
+
+    time = np.linspace(0.0, 100.0, n_samples)
+    displacement = np.linspace(-2.0, embedding_length * 1.05, n_samples)
+    force = np.where(
+        displacement < peak_position,
+        max_force * displacement / peak_position,
+        max_force * np.clip(1 - (displacement - peak_position) / (embedding_length - peak_position), 0, 1))
+    force = force + rng.normal(0.0, 0.002, n_samples)
+    return time, displacement, force
+
+
+def specimen_text(rng: np.random.Generator, n_samples: int = 1000) -> str:
+    """Erzeugt den Dateiinhalt einer einzelnen synthetischen Messung."""
+    time, displacement, force = synthetic_curve(rng, n_samples)
+
+    header = []
+    for line_nr in range(1, HEADER_LINES + 1):
+        if line_nr == DIAMETER_LINE:
+            header.append(f"Faserdurchmesser [um]\t{rng.uniform(6.0, 9.0):.3f}")
+        else:
+            header.append(f"Parameter {line_nr}\tWert {line_nr}")
+    rows = np.column_stack([time, displacement, force])
+    body = "\n".join(f"{t:.4f}\t{s:.4f}\t{f:.6f}" for t, s, f in rows)
+    return "\n".join(header) + "\n" + body + "\n"
+
+
+def specimen_name(index: int, failed: bool = False, new_scheme: bool = True) -> str:
+    """
+    Dateiname im neuen (Kennung an Position 2) oder alten Schema (Kennung am Ende).
+    Erfolgreiche Auszüge enden auf 'a', Faserbrüche auf 'xa'.
+    Das neue Schema erlaubt nur zweistellige Probennummern.
+    """
+    if new_scheme:
+        if not 0 <= index < 100:
+            raise ValueError(f"Probennummer {index} passt nicht in das neue Namensschema")
+        return f"{index:02d}xa_probe" if failed else f"{index:02d}a_probe"
+    return f"Probe{index:02d}xa" if failed else f"Probe{index:02d}a"
+
+
+def generate_corpus(root: Path, n_series: int = 1, n_specimens: int = 10, n_samples: int = 1000,
+                    failed_per_series: int = 1, seed: int = 42, pool_size: int = None) -> list[Path]:
+    """
+    Schreibt n_series Messreihen-Ordner mit je n_specimens erfolgreichen und
+    failed_per_series gebrochenen Proben. Die Namensschemata wechseln sich ab.
+
+    Args:
+        pool_size: Wenn gesetzt, werden nur so viele verschiedene Kurven erzeugt und
+                   reihum wiederverwendet (schnellere Erzeugung großer Korpora)
+
+    Returns:
+        Liste der erzeugten Messreihen-Ordner
+    """
+    rng = np.random.default_rng(seed)
+    root = Path(root)
+    pool = [specimen_text(rng, n_samples) for _ in range(pool_size)] if pool_size else None
+    file_count = 0
+    series_folders = []
+    for series_nr in range(n_series):
+        folder = root / f"Messreihe_{series_nr:03d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        new_scheme = series_nr % 2 == 0
+        for index in range(n_specimens + failed_per_series):
+            failed = index >= n_specimens
+            name = specimen_name(index, failed, new_scheme)
+            text = pool[file_count % len(pool)] if pool else specimen_text(rng, n_samples)
+            (folder / f"{name}.txt").write_text(text, encoding='latin-1')
+            file_count += 1
+        series_folders.append(folder)
+    return series_folders
@@ -26,15 +26,18 @@ class NamingInTheNameOf:
     filenames: list[str] = None
     root_path: Path = None
     main_folder: str = ""
+    file_entries: dict = None  # path -> SpecimenEntry (size, mtime) from FileHandler.find_specimen_files
 
     def __post_init__(self):
         self.filenames = [] if self.filenames is None else self.filenames
+        self.file_entries = {} if self.file_entries is None else self.file_entries
 
 # saving strings from path
     def update_paths(self, new_path: Path):
         self.root_path = new_path
         self.main_folder = new_path.name
         self.filenames = []  # filled later with the names of measurements
+        self.file_entries = {}
 # global instancing
 naming_storage = NamingInTheNameOf()
 
@@ -0,0 +1,232 @@
+"""
+batch_kernels.py - Kennwerte aller Kurven einer Messreihe auf den flachen Arrays
+
+Statt compute_curve_metrics für jede Kurve einzeln aufzurufen, arbeiten die
+Kernels auf den hintereinanderliegenden Arrays des MeasurementStore mit dem
+Offset-Index. F_max, Einbettlänge, Arbeit, Arbeit vor/nach F_max und die
+Arbeit an den Intervallgrenzen entstehen aus wenigen Aufrufen von
+ufunc.reduceat, einer laufenden Summe und einer gemeinsamen Suche. Das lohnt
+sich vor allem bei Messreihen mit vielen kurzen Kurven.
+
+Für segmentweise laufende Maxima und Suchen wird die Kurvennummer als Realteil
+und der Wert als Imaginärteil einer komplexen Zahl verwendet: NumPy vergleicht
+komplexe Zahlen lexikographisch, dadurch beginnt jede Kurve einen eigenen,
+exakt sortierten Bereich, ohne die Werte selbst zu verändern.
+
+Der Vorteil gegenüber der Schleife wächst mit der Zahl der Kurven und sinkt mit
+ihrer Länge; bei Kurven mit einigen tausend Punkten sind beide Wege etwa
+gleich schnell (siehe src/benchmarks/batch_kernel_benchmark.py).
+"""
+
+# src/core/batch_kernels.py
+import functools
+import logging
+import math
+from dataclasses import dataclass, replace
+from typing import Optional
+import numpy as np
+from src.core.measurement_store import MeasurementStore
+from src.core.metric_kernels import CurveMetrics, compute_curve_metrics
+from src.core.modulus_engine import ModulusSettings, ModulusResult, compute_moduli, first_position
+
+KERNEL_BACKENDS = ('numpy', 'numba', 'auto')
+
+
+@dataclass
+class SeriesArrays:
+    """Ungerundete Kennwerte je Kurve einer Messreihe, Ergebnis eines Kernel-Backends"""
+    max_force: np.ndarray  # F_max in N
+    max_force_index: np.ndarray  # Index von F_max relativ zum Kurvenanfang
+    embedding_length: np.ndarray  # Einbettlänge in µm
+    work: np.ndarray  # Gesamtarbeit in µJ
+    work_before_fmax: np.ndarray  # Arbeit bis F_max in µJ (0.0, wenn F_max am Kurvenanfang liegt)
+    work_after_fmax: np.ndarray  # Arbeit nach F_max in µJ (0.0, wenn F_max am Kurvenende liegt)
+    cumulative_work: np.ndarray  # Arbeit bis zu jeder Intervallgrenze, Form (Kurven, Intervalle + 1)
+    all_inside: np.ndarray  # False: Kurve reicht über die Einbettlänge hinaus (Werte ungültig)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_kernel_backend(backend: str = 'numpy') -> str:
+    """
+    Wählt das Kernel-Backend: 'numpy', 'numba' oder 'auto' (numba, falls installiert).
+    Ohne installiertes numba wird auf NumPy zurückgefallen.
+    """
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(f"Unbekanntes Kernel-Backend: {backend} (erlaubt: {', '.join(KERNEL_BACKENDS)})")
+    if backend == 'numpy':
+        return 'numpy'
+    try:
+        from src.core import numba_kernels  # noqa: F401 - kompiliert erst beim ersten Aufruf
+    except ImportError:
+        if backend == 'numba':
+            logging.getLogger('SFPO_Analyzer').warning("Numba ist nicht installiert, verwende die NumPy-Kernels")
+        return 'numpy'
+    return 'numba'
+
+
+def segmented_keys(values: np.ndarray, curve_ids: np.ndarray) -> np.ndarray:
+    """Komplexe Schlüssel (Kurvennummer, Wert): sortieren erst nach Kurve, dann nach Wert."""
+    return curve_ids + 1j * values
+
+
+def segmented_cummax(values: np.ndarray, curve_ids: np.ndarray) -> np.ndarray:
+    """Laufendes Maximum, das am Anfang jeder Kurve neu beginnt (als Schlüssel, Wert im Imaginärteil)."""
+    return np.maximum.accumulate(segmented_keys(values, curve_ids))
+
+
+def series_area_normalized(works, diameters, lengths, max_allowed_length: float) -> tuple[list[float], np.ndarray]:
+    """
+    Flächennormierte Arbeit W / (PI * d * l_e) für alle Messungen einer Messreihe.
+
+    Returns:
+        (Werte auf 4 Stellen gerundet, Maske der ungültigen Messungen mit d <= 0 oder l_e <= 0)
+    """
+    works = np.asarray(works, dtype=float)
+    diameters = np.asarray(diameters, dtype=float)
+    lengths = np.minimum(np.asarray(lengths, dtype=float), max_allowed_length)
+    invalid = (diameters <= 0) | (lengths <= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = works / (math.pi * diameters * lengths)
+    return [0.0 if bad else round(float(value), 4) for value, bad in zip(values, invalid)], invalid
+
+
+def series_arrays(store: MeasurementStore, max_allowed_length: float, n_intervals: int = 10) -> SeriesArrays:
+    """NumPy-Backend: Kennwerte aller (nicht leeren) Kurven auf den flachen Arrays."""
+    n_curves = len(store)
+    lengths = store.lengths
+    displacement, force = store.displacement, store.force
+    starts = store.offsets[:-1]
+    ends = store.offsets[1:] - 1  # Letzter Punkt je Kurve
+    curve_ids = np.repeat(np.arange(n_curves, dtype=np.float64), lengths)
+
+    # F_max und dessen erste Position je Kurve
+    max_force = np.maximum.reduceat(force, starts)
+    peak = first_position(force == np.repeat(max_force, lengths), starts)
+    embedding_length = np.minimum(np.maximum.reduceat(displacement, starts), max_allowed_length)
+    all_inside = np.logical_and.reduceat(displacement <= np.repeat(embedding_length, lengths), starts)
+
+    # Trapezflächen; der Übergang vom letzten Punkt einer Kurve zur nächsten zählt nicht
+    segments = np.zeros(len(force))
+    segments[:-1] = np.diff(displacement) * (force[1:] + force[:-1]) / 2.0
+    segments[ends] = 0.0
+    work = np.add.reduceat(segments, starts)
+    # Der Übergang zieht die Arbeit der Kurve wieder ab: das laufende Integral beginnt
+    # jede Kurve nahe 0 und verliert keine Stellen durch die Summe der vorherigen Kurven
+    segments[ends] = -work
+    cumulative = np.empty(len(force) + 1)
+    cumulative[0] = 0.0
+    np.cumsum(segments, out=cumulative[1:])
+    work_before = cumulative[peak] - cumulative[starts]
+    work_after = cumulative[ends] - cumulative[peak]
+
+    # Arbeit an den Intervallgrenzen wie metric_kernels.work_at_positions, für alle Kurven gemeinsam
+    fractions = np.arange(n_intervals + 1)
+    bounds = fractions[np.newaxis, :] * (embedding_length / n_intervals)[:, np.newaxis]
+    bounds[:, -1] = embedding_length
+    # Bisher erreichter Weg je Kurve, darin je Grenze der erste Punkt, an dem sie erreicht ist
+    reached = segmented_cummax(displacement, curve_ids)
+    bound_ids = np.repeat(np.arange(n_curves, dtype=np.float64), n_intervals + 1)
+    found = np.searchsorted(reached, segmented_keys(bounds.ravel(), bound_ids), side='left').reshape(bounds.shape)
+    inside = (found > starts[:, np.newaxis]) & (found <= ends[:, np.newaxis])
+    lower = np.where(inside, found - 1, 0)
+    upper = np.where(inside, found, 0)
+    x0, x1 = displacement[lower], displacement[upper]
+    f0, f1 = force[lower], force[upper]
+    width = x1 - x0
+    fraction = np.divide(bounds - x0, width, out=np.zeros(bounds.shape), where=width > 0)
+    partial = (bounds - x0) * (f0 + (f0 + fraction * (f1 - f0))) / 2.0
+    bound_work = np.where(inside, cumulative[lower] - cumulative[starts][:, np.newaxis] + partial, 0.0)
+    # Grenzen hinter dem größten Weg: Arbeit bis zu dessen erstem Erreichen
+    beyond = found > ends[:, np.newaxis]
+    if beyond.any():
+        last_max = first_position(displacement == np.repeat(np.maximum.reduceat(displacement, starts), lengths),
+                                  starts)
+        reach_work = cumulative[last_max] - cumulative[starts]
+        bound_work[beyond] = np.broadcast_to(reach_work[:, np.newaxis], bounds.shape)[beyond]
+
+    return SeriesArrays(
+        max_force=max_force,
+        max_force_index=peak - starts,
+        embedding_length=embedding_length,
+        work=work,
+        work_before_fmax=np.where(peak > starts, work_before, 0.0),
+        work_after_fmax=np.where(peak < ends, work_after, 0.0),
+        cumulative_work=bound_work,
+        all_inside=all_inside
+    )
+
+
+def compute_series_metrics(store: MeasurementStore, max_allowed_length: float, n_intervals: int = 10,
+                           modulus_settings: Optional[ModulusSettings] = None,
+                           backend: str = 'numpy') -> list[CurveMetrics]:
+    """
+    Berechnet die Kennwerte aller Kurven einer Messreihe gemeinsam.
+
+    Liefert dieselben Werte wie compute_curve_metrics je Kurve (Summen bis auf
+    die Rundung der Gleitkommaaddition). Kurven, die über die max. Einbetttiefe
+    hinausreichen, werden einzeln mit compute_curve_metrics berechnet.
+
+    Args:
+        store: Kurven der Messreihe
+        max_allowed_length: Maximale Einbetttiefe in µm
+        n_intervals: Anzahl gleich breiter Arbeitsintervalle
+        modulus_settings: Kraftniveaus und Verfahren des Verbundmoduls (Standard: 20%/70%, Sekante)
+        backend: Kernel-Backend 'numpy', 'numba' oder 'auto' (siehe resolve_kernel_backend)
+
+    Raises:
+        ValueError: Wenn eine Kurve leer ist
+    """
+    if len(store) == 0:
+        return []
+    if np.any(store.lengths == 0):
+        raise ValueError("Leere Messung - keine Kennwerte berechenbar")
+    if n_intervals < 1:
+        raise ValueError(f"Anzahl der Intervalle muss positiv sein: {n_intervals}")
+    settings = modulus_settings or ModulusSettings()
+
+    if resolve_kernel_backend(backend) == 'numba':
+        from src.core import numba_kernels
+        arrays = numba_kernels.series_arrays(store, max_allowed_length, n_intervals)
+        moduli = numba_kernels.compute_moduli(store, settings)
+    else:
+        arrays = series_arrays(store, max_allowed_length, n_intervals)
+        moduli = compute_moduli(store, settings)
+    return _assemble_metrics(store, arrays, moduli, max_allowed_length, n_intervals)
+
+
+def _assemble_metrics(store: MeasurementStore, arrays: SeriesArrays, moduli: ModulusResult,
+                      max_allowed_length: float, n_intervals: int) -> list[CurveMetrics]:
+    """Erzeugt die CurveMetrics je Kurve aus den Ergebnissen eines Backends."""
+    displacement, force = store.displacement, store.force
+    starts = store.offsets[:-1]
+
+    # Ab hier je Kurve nur noch Python-Zahlen: round() wie in compute_curve_metrics, aber ohne NumPy-Skalare
+    low = (starts + moduli.index_low).tolist()
+    high = (starts + moduli.index_high).tolist()
+    interval_work = np.diff(arrays.cumulative_work, axis=1).tolist()
+    columns = zip(arrays.max_force.tolist(), arrays.max_force_index.tolist(), arrays.embedding_length.tolist(),
+                  arrays.work.tolist(), arrays.work_before_fmax.tolist(), arrays.work_after_fmax.tolist(),
+                  arrays.cumulative_work.tolist(), moduli.moduli.tolist(), arrays.all_inside.tolist())
+
+    metrics = []
+    for i, (f_max, peak_index, length, total, before, after, bound, modulus, inside) in enumerate(columns):
+        modulus_values = {'modulus_point_low': (float(displacement[low[i]]), float(force[low[i]])),
+                          'modulus_point_high': (float(displacement[high[i]]), float(force[high[i]])),
+                          'force_modulus': modulus}
+        if not inside:
+            # Kurve reicht über die Einbettlänge hinaus: gekürzte Kurve einzeln auswerten
+            metrics.append(replace(compute_curve_metrics(*store[i], max_allowed_length, n_intervals),
+                                   **modulus_values))
+            continue
+        metrics.append(CurveMetrics(
+            max_force=f_max,
+            max_force_index=peak_index,
+            embedding_length=length,
+            work=round(total, 3),
+            work_before_fmax=round(before, 3),
+            work_after_fmax=round(after, 3),
+            work_intervals=[round(value, 3) for value in interval_work[i]],
+            cumulative_work=bound,
+            **modulus_values
+        ))
+    return metrics
@@ -0,0 +1,256 @@
+"""
+curve_archive.py - Binärarchiv der bereinigten Kraft-Weg-Kurven mit Memory-Mapping
+
+Das Einlesen tausender Textdateien ist der größte Aufwand jedes Wiederholungslaufs.
+Ein Messordner wird daher einmalig in eine einzelne Archivdatei überführt:
+
+    [0:8]    Kennung b'SFPOARC1'
+    [8:16]   Länge des Kopfes in Byte (uint64, little endian)
+    [16:..]  Kopf als JSON (Messreihen, Probennamen, Kopfdaten, Dateisignaturen),
+             mit Leerzeichen auf ein Vielfaches von 64 Byte aufgefüllt
+    danach   Weg aller Proben hintereinander (float32 oder float64)
+             Kraft aller Proben hintereinander (gleicher Datentyp)
+             Offset-Index (int64, Anzahl Proben + 1)
+
+Die Kurven werden beim Erstellen wie beim Einlesen der Textdateien bereinigt
+(SpecimenParser mit der max. Einbetttiefe). Beim Öffnen werden die Blöcke per
+np.memmap eingebunden; eine Messreihe wird als MeasurementStore auf dem
+gemappten Speicher herausgegeben, bei float64 ohne Kopie.
+"""
+
+# src/core/curve_archive.py
+from pathlib import Path
+from typing import Optional
+import json
+import logging
+import os
+import shutil
+import struct
+import tempfile
+import numpy as np
+from src.config.settings import NamingInTheNameOf, SortOf
+from src.core.data_sorter import DataSorter
+from src.core.file_handler import FileHandler
+from src.core.measurement_store import MeasurementStore, Curve
+from src.core.specimen_parser import SpecimenParser, SpecimenHeader
+
+ARCHIVE_MAGIC = b'SFPOARC1'
+ARCHIVE_VERSION = 1
+ARCHIVE_DTYPES = {'float32': '<f4', 'float64': '<f8'}
+HEADER_ALIGNMENT = 64  # Datenblöcke beginnen an einer 64-Byte-Grenze
+_PREAMBLE = struct.Struct('<8sQ')
+
+
+def _source_signature(path: Path) -> tuple[int, int]:
+    """Größe und Änderungszeit einer Messdatei."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def build_archive(series_folders: list[Path], archive_path: Path, max_allowed_length: float = 1000.0,
+                  dtype: str = 'float64') -> Path:
+    """
+    Liest alle erfolgreichen Messungen der Messreihen ein und schreibt sie in ein Archiv.
+
+    Dateien werden wie in der Analyse gefunden und sortiert (FileHandler.find_specimen_files,
+    DataSorter.analyze_filenames). Weg und Kraft werden zunächst in zwei temporäre Dateien
+    geschrieben, sodass nie mehr als eine Kurve im Speicher liegt.
+
+    Args:
+        series_folders: Messreihen-Ordner (Ordner ohne Messdateien werden übersprungen)
+        archive_path: Zieldatei, wird erst nach vollständigem Schreiben ersetzt
+        max_allowed_length: Max. Einbetttiefe für die Bereinigung der Kurven
+        dtype: 'float32' (halbe Dateigröße) oder 'float64' (Zugriff ohne Kopie)
+
+    Returns:
+        Pfad des Archivs
+    """
+    if dtype not in ARCHIVE_DTYPES:
+        raise ValueError(f"Unbekannter Datentyp: {dtype} (erlaubt: {', '.join(ARCHIVE_DTYPES)})")
+    logger = logging.getLogger('SFPO_Analyzer')
+    archive_path = Path(archive_path)
+    parser = SpecimenParser(max_allowed_length)
+    series_table = []
+    specimen_table = []
+    offsets = [0]
+
+    with tempfile.TemporaryDirectory(dir=archive_path.parent) as tmp:
+        displacement_path = Path(tmp) / "displacement.bin"
+        force_path = Path(tmp) / "force.bin"
+        with open(displacement_path, 'wb') as displacement_file, open(force_path, 'wb') as force_file:
+            for folder in series_folders:
+                naming = NamingInTheNameOf()
+                sorting = SortOf()
+                naming.update_paths(Path(folder))
+                if not FileHandler.find_specimen_files(naming):
+                    logger.info(f"Keine Messdateien in {folder}, übersprungen")
+                    continue
+                DataSorter.analyze_filenames(naming, sorting)
+
+                first = len(specimen_table)
+                for name in sorting.good_ones:
+                    path = naming.root_path / f"{name}.txt"
+                    try:
+                        specimen = parser.parse(path)
+                        size, mtime_ns = _source_signature(path)
+                    except Exception as e:
+                        logger.error(f"Fehler beim Lesen von {path}: {e}")
+                        continue
+                    specimen.curve.displacement.astype(ARCHIVE_DTYPES[dtype]).tofile(displacement_file)
+                    specimen.curve.force.astype(ARCHIVE_DTYPES[dtype]).tofile(force_file)
+                    offsets.append(offsets[-1] + len(specimen.curve.force))
+                    specimen_table.append({
+                        'name': name,
+                        'fiber_diameter': specimen.header.fiber_diameter,
+                        'fields': specimen.header.fields,
+                        'lines': specimen.header.lines,
+                        'size': size,
+                        'mtime_ns': mtime_ns,
+                    })
+                series_table.append({
+                    'name': naming.main_folder,
+                    'folder': str(Path(folder).resolve()),
+                    'first': first,
+                    'count': len(specimen_table) - first,
+                    'bad_ones': list(sorting.bad_ones or []),
+                })
+                logger.info(f"Messreihe {naming.main_folder}: {len(specimen_table) - first} Proben archiviert")
+
+        header = {
+            'version': ARCHIVE_VERSION,
+            'dtype': ARCHIVE_DTYPES[dtype],
+            'max_allowed_length': max_allowed_length,
+            'n_samples': offsets[-1],
+            'series': series_table,
+            'specimens': specimen_table,
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        header_bytes += b' ' * (-(_PREAMBLE.size + len(header_bytes)) % HEADER_ALIGNMENT)
+
+        partial_path = Path(tmp) / archive_path.name
+        with open(partial_path, 'wb') as archive_file:
+            archive_file.write(_PREAMBLE.pack(ARCHIVE_MAGIC, len(header_bytes)))
+            archive_file.write(header_bytes)
+            for block_path in (displacement_path, force_path):
+                with open(block_path, 'rb') as block_file:
+                    shutil.copyfileobj(block_file, archive_file, 1 << 20)
+            np.asarray(offsets, dtype='<i8').tofile(archive_file)
+        os.replace(partial_path, archive_path)
+
+    logger.info(f"Archiv mit {len(series_table)} Messreihen und {len(specimen_table)} Proben "
+                f"gespeichert in: {archive_path}")
+    return archive_path
+
+
+class CurveArchive:
+    """
+    Lesezugriff auf ein Kurvenarchiv. Es wird nur der Kopf gelesen, die
+    Messdaten werden erst beim Zugriff auf einzelne Kurven von der Platte geladen.
+    """
+
+    def __init__(self, archive_path: Path):
+        self.path = Path(archive_path)
+        with open(self.path, 'rb') as archive_file:
+            magic, header_length = _PREAMBLE.unpack(archive_file.read(_PREAMBLE.size))
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError(f"Keine SFPO-Archivdatei: {self.path}")
+            header = json.loads(archive_file.read(header_length))
+        if header['version'] != ARCHIVE_VERSION:
+            raise ValueError(f"Archivversion {header['version']} wird nicht unterstützt: {self.path}")
+
+        self.max_allowed_length = header['max_allowed_length']
+        self.series = {entry['name']: entry for entry in header['series']}
+        self.specimens = header['specimens']
+        n_samples = header['n_samples']
+        dtype = np.dtype(header['dtype'])
+
+        data_start = _PREAMBLE.size + header_length
+        self.displacement = self._map(dtype, data_start, n_samples)
+        self.force = self._map(dtype, data_start + n_samples * dtype.itemsize, n_samples)
+        self.offsets = self._map(np.dtype('<i8'), data_start + 2 * n_samples * dtype.itemsize,
+                                 len(self.specimens) + 1)
+        self.logger = logging.getLogger('SFPO_Analyzer')
+
+    def _map(self, dtype: np.dtype, offset: int, count: int) -> np.ndarray:
+        # np.memmap kann keine Länge 0 abbilden
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+
+    @property
+    def series_names(self) -> list[str]:
+        return list(self.series)
+
+    def __contains__(self, series: str) -> bool:
+        return series in self.series
+
+    def _range(self, series: str) -> tuple[int, int]:
+        if series not in self.series:
+            raise KeyError(f"Messreihe {series} ist nicht im Archiv {self.path}")
+        entry = self.series[series]
+        return entry['first'], entry['first'] + entry['count']
+
+    def specimen_names(self, series: str) -> list[str]:
+        """Probennamen der Messreihe in Messreihenfolge."""
+        first, last = self._range(series)
+        return [specimen['name'] for specimen in self.specimens[first:last]]
+
+    def bad_ones(self, series: str) -> list[str]:
+        """Beim Sortieren aussortierte Proben der Messreihe."""
+        self._range(series)
+        return list(self.series[series]['bad_ones'])
+
+    def headers(self, series: str) -> list[SpecimenHeader]:
+        """Kopfdaten der Proben der Messreihe."""
+        first, last = self._range(series)
+        return [SpecimenHeader(fiber_diameter=specimen['fiber_diameter'], fields=specimen['fields'],
+                               lines=specimen['lines'])
+                for specimen in self.specimens[first:last]]
+
+    def curve(self, series: str, index: int) -> Curve:
+        """Einzelne Kurve als View auf den gemappten Speicher."""
+        first, last = self._range(series)
+        if not 0 <= index < last - first:
+            raise IndexError(f"Messung {index} existiert nicht in {series}")
+        start, end = self.offsets[first + index], self.offsets[first + index + 1]
+        return Curve(self.displacement[start:end], self.force[start:end])
+
+    def store(self, series: str, max_allowed_length: Optional[float] = None) -> MeasurementStore:
+        """
+        Alle Kurven einer Messreihe als MeasurementStore.
+
+        Bei float64 und gleicher Einbetttiefe verweisen die Arrays direkt auf den
+        gemappten Speicher. Bei kleinerer Einbetttiefe werden die Kurven wie beim
+        Einlesen nachbereinigt (Kopie), eine größere ist nur mit neuem Archiv möglich.
+        """
+        if max_allowed_length is not None and max_allowed_length > self.max_allowed_length:
+            raise ValueError(f"Archiv wurde mit max. Einbetttiefe {self.max_allowed_length} µm erstellt, "
+                             f"angefordert: {max_allowed_length} µm")
+        first, last = self._range(series)
+        start, end = int(self.offsets[first]), int(self.offsets[last])
+        store = MeasurementStore(self.displacement[start:end], self.force[start:end],
+                                 self.offsets[first:last + 1] - start)
+        if max_allowed_length is None or max_allowed_length == self.max_allowed_length:
+            return store
+        parser = SpecimenParser(max_allowed_length)
+        return MeasurementStore.from_curves(parser.clean_curve(*curve) for curve in store)
+
+    def changed_specimens(self, series: str) -> list[str]:
+        """
+        Proben, deren Messdatei seit dem Erstellen geändert oder gelöscht wurde.
+        Liegt der Messordner nicht (mehr) am gespeicherten Ort, wird nichts geprüft.
+        """
+        first, last = self._range(series)
+        folder = Path(self.series[series]['folder'])
+        if not folder.is_dir():
+            return []
+        changed = []
+        for specimen in self.specimens[first:last]:
+            path = folder / f"{specimen['name']}.txt"
+            try:
+                signature = _source_signature(path)
+            except OSError:
+                signature = None
+            if signature != (specimen['size'], specimen['mtime_ns']):
+                changed.append(specimen['name'])
+        return changed
@@ -0,0 +1,164 @@
+"""
+curve_decimation.py - Ausdünnen der Kraft-Weg-Kurven vor dem Plotten
+
+Die Messmaschine zeichnet deutlich mehr Punkte auf, als eine Abbildung
+Pixel in x-Richtung hat. Vor dem Plotten werden die Kurven daher auf die
+Ausgabeauflösung reduziert:
+
+- 'minmax': Pro Pixelspalte bleiben erster, letzter, kleinster und größter
+  Punkt erhalten (M4-Verfahren). Die gezeichnete Linie ist bei dieser
+  Auflösung nicht von der Originalkurve zu unterscheiden.
+- 'lttb': Largest-Triangle-Three-Buckets, liefert eine feste Anzahl Punkte,
+  die die Form der Kurve bestmöglich erhalten.
+
+Die ausgedünnten Kurven können zusätzlich als CSV neben der Abbildung
+gespeichert werden.
+"""
+
+# src/core/curve_decimation.py
+from pathlib import Path
+from typing import Optional
+import numpy as np
+from src.core.measurement_store import Curve
+
+DECIMATION_METHODS = ('minmax', 'lttb')
+
+
+def resolve_pixels(figure_width: float, dpi: float, pixels: Optional[int] = None) -> int:
+    """
+    Bestimmt die Ausgabeauflösung in x-Richtung.
+
+    Args:
+        figure_width: Breite der Abbildung in Zoll
+        dpi: Auflösung beim Speichern
+        pixels: Fest eingestellte Auflösung (hat Vorrang, wenn gesetzt)
+    """
+    if pixels is not None:
+        return max(int(pixels), 1)
+    return max(int(round(figure_width * dpi)), 1)
+
+
+def minmax_decimate(distances: np.ndarray, forces: np.ndarray, pixels: int,
+                    x_range: Optional[tuple[float, float]] = None) -> Curve:
+    """
+    Behält pro Pixelspalte den ersten, letzten, kleinsten und größten Punkt.
+
+    Args:
+        distances, forces: Kurve in Aufnahmereihenfolge
+        pixels: Anzahl Pixelspalten über x_range
+        x_range: Sichtbarer x-Bereich (Standard: Bereich der Daten). Punkte
+            außerhalb erhalten eigene Spalten gleicher Breite.
+    """
+    distances = np.asarray(distances, dtype=float)
+    forces = np.asarray(forces, dtype=float)
+    n = len(distances)
+    if n <= 4 * pixels:
+        return Curve(distances, forces)
+
+    x_min, x_max = x_range if x_range is not None else (distances.min(), distances.max())
+    width = (x_max - x_min) / pixels
+    if not width > 0:
+        return Curve(distances, forces)
+    buckets = np.floor((distances - x_min) / width).astype(np.int64)
+
+    if np.all(buckets[1:] >= buckets[:-1]):
+        # Monoton steigender Weg (Normalfall): Spalten sind zusammenhängend, kein Sortieren nötig
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], n] - 1
+        counts = ends - starts + 1
+        # Jeweils erste Position des Minimums bzw. Maximums innerhalb der Spalte
+        is_min = np.flatnonzero(forces == np.repeat(np.minimum.reduceat(forces, starts), counts))
+        is_max = np.flatnonzero(forces == np.repeat(np.maximum.reduceat(forces, starts), counts))
+        mins = is_min[np.searchsorted(is_min, starts)]
+        maxs = is_max[np.searchsorted(is_max, starts)]
+        keep = np.unique(np.concatenate([starts, ends, mins, maxs]))
+        return Curve(distances[keep], forces[keep])
+
+    # Gruppen gleicher Spalte in Aufnahmereihenfolge: erster und letzter Punkt
+    by_bucket = np.argsort(buckets, kind='stable')
+    sorted_buckets = buckets[by_bucket]
+    starts = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+
+    # Innerhalb jeder Spalte nach Kraft sortiert: Minimum und Maximum
+    by_force = np.lexsort((forces, buckets))
+
+    keep = np.unique(np.concatenate([by_bucket[starts], by_bucket[ends],
+                                     by_force[starts], by_force[ends]]))
+    return Curve(distances[keep], forces[keep])
+
+
+def lttb_decimate(distances: np.ndarray, forces: np.ndarray, n_out: int) -> Curve:
+    """
+    Largest-Triangle-Three-Buckets: reduziert die Kurve auf n_out Punkte.
+
+    Erster und letzter Punkt bleiben erhalten; aus jedem der übrigen
+    Abschnitte wird der Punkt gewählt, der mit dem zuvor gewählten Punkt und
+    dem Mittelwert des nächsten Abschnitts das größte Dreieck bildet.
+    """
+    distances = np.asarray(distances, dtype=float)
+    forces = np.asarray(forces, dtype=float)
+    n = len(distances)
+    if n_out >= n or n_out < 3:
+        return Curve(distances, forces)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mittelwerte aller Abschnitte (der letzte "Abschnitt" ist der Endpunkt), unabhängig von der Auswahl
+    bounds = np.r_[edges, n]
+    sizes = np.diff(bounds)
+    mean_x = np.add.reduceat(distances, bounds[:-1]) / sizes
+    mean_y = np.add.reduceat(forces, bounds[:-1]) / sizes
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_x, next_y = mean_x[i + 1], mean_y[i + 1]
+
+        x_a, y_a = distances[selected], forces[selected]
+        areas = np.abs((x_a - next_x) * (forces[start:end] - y_a)
+                       - (x_a - distances[start:end]) * (next_y - y_a))
+        selected = start + int(np.argmax(areas))
+        keep[i + 1] = selected
+    return Curve(distances[keep], forces[keep])
+
+
+def decimate_curve(distances: np.ndarray, forces: np.ndarray, method: Optional[str], pixels: int,
+                   x_range: Optional[tuple[float, float]] = None) -> Curve:
+    """
+    Dünnt eine Kurve mit dem gewählten Verfahren aus.
+
+    Args:
+        method: 'minmax', 'lttb' oder None (keine Ausdünnung)
+        pixels: Ausgabeauflösung in x-Richtung; 'lttb' liefert 2 Punkte pro Pixel
+        x_range: Sichtbarer x-Bereich (nur für 'minmax')
+    """
+    if method is None:
+        return Curve(np.asarray(distances), np.asarray(forces))
+    if method == 'minmax':
+        return minmax_decimate(distances, forces, pixels, x_range)
+    if method == 'lttb':
+        return lttb_decimate(distances, forces, 2 * pixels)
+    raise ValueError(f"Unbekanntes Ausdünnungsverfahren: {method} (erlaubt: {', '.join(DECIMATION_METHODS)})")
+
+
+def decimate_curves(curves, method: Optional[str], pixels: int,
+                    x_range: Optional[tuple[float, float]] = None) -> list[Curve]:
+    """Dünnt alle Kurven einer Messreihe aus."""
+    return [decimate_curve(distances, forces, method, pixels, x_range) for distances, forces in curves]
+
+
+def export_curves_csv(curves, path: Path) -> Path:
+    """
+    Speichert Kurven im Langformat (Messung; Weg; Kraft) als CSV.
+
+    Returns:
+        Pfad der geschriebenen Datei
+    """
+    rows = [np.column_stack([np.full(len(distances), i + 1), distances, forces])
+            for i, (distances, forces) in enumerate(curves)]
+    table = np.vstack(rows) if rows else np.empty((0, 3))
+    np.savetxt(path, table, delimiter=';', fmt=['%d', '%.6g', '%.6g'],
+               header='Messung;Displacement [µm];Force [N]', comments='', encoding='utf-8')
+    return path
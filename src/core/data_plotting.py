@@ -1,10 +1,17 @@
 # src/core/data_plotting.py
+import logging
 import matplotlib.pyplot as plt
 from pathlib import Path
+from typing import Optional
 import numpy as np
+from src.core.curve_decimation import resolve_pixels, decimate_curves, export_curves_csv
+from src.core.plot_templates import (get_template, interval_centers, SAVE_DPI, CurvePlotTemplate,
+                                     WorkIntervalTemplate, NormalizedWorkTemplate, MeanNormalizedWorkTemplate)
 
 
 class DataPlotter:
+    logger = logging.getLogger('SFPO_Analyzer')
+
     @staticmethod
     def setup_plot_style():
         """Konfiguriert den grundlegenden Plot-Stil"""
@@ -26,7 +33,9 @@ class DataPlotter:
         plt.rcParams['ytick.labelsize'] = 30
     
     @staticmethod
-    def save_plots_for_series(analyzers_dict: dict, plots_folder: Path, max_embedding_length: float = 1000.0):
+    def save_plots_for_series(analyzers_dict: dict, plots_folder: Path, max_embedding_length: float = 1000.0,
+                              decimation: Optional[str] = 'minmax', decimation_pixels: Optional[int] = None,
+                              export_curves: bool = False):
         """
         Erstellt und speichert Plots für alle Messreihen.
 
@@ -34,74 +43,39 @@ class DataPlotter:
             analyzers_dict: Dictionary mit Namen und Analyzern der Messreihen
             plots_folder: Ordner zum Speichern der Plots
             max_embedding_length: Maximale Einbetttiefe für die Achsenskalierung
+            decimation: Ausdünnung der Kurven vor dem Plotten ('minmax', 'lttb' oder None)
+            decimation_pixels: Ausgabeauflösung in x-Richtung (None: Breite der Abbildung)
+            export_curves: Ausgedünnte Kurven zusätzlich als CSV neben dem Plot speichern
         """
-        # Verwende Plasma-Farbschema
-        colors = plt.cm.plasma(np.linspace(0, 1, 10))  # 10 Farben aus dem Plasma-Schema
-        
         DataPlotter.setup_plot_style()  # Setze Grundstil
         
+        # Achsen, Ticks und Stil werden einmal aufgebaut, pro Messreihe nur die Kurven getauscht
+        template = get_template(CurvePlotTemplate, max_embedding_length)
+        pixels = resolve_pixels(template.figsize[0], SAVE_DPI, decimation_pixels)
         for name, analyzer in analyzers_dict.items():
-            # Erstelle Figur und Achsenobjekt
-            fig, ax = plt.subplots(figsize=(12, 9), constrained_layout=True)
-            
-            # Plot jede Messung mit einer Farbe aus dem Plasma-Schema
-            for i, (measurement, color) in enumerate(zip(analyzer.measurements_data, colors)):
-                distances, forces = zip(*measurement)
-                ax.plot(distances, forces, color=color, label=f'Messung {i + 1}')
-            
-            # Achsenlimits setzen basierend auf der konfigurierten Einbetttiefe
-            ax.set_xlim(0, max_embedding_length)
-            ax.set_ylim(0, 0.3)
-            
-            # Tick-Positionen setzen
-            tick_step = max_embedding_length / 5  # 5 Ticks auf der x-Achse
-            ax.set_xticks(np.arange(0, max_embedding_length + 1, tick_step))
-            ax.set_yticks(np.arange(0, 0.31, 0.05))
-            
-            # Formatierung der Ticks und Labels
-            ax.tick_params(axis='both', which='major', pad=2)
-            
-            # Fettdruck für die Tick-Labels
-            for label in ax.get_xticklabels() + ax.get_yticklabels():
-                label.set_fontweight('bold')
-            
-            # Achsenbeschriftungen
-            ax.set_xlabel('Displacement [µm]', fontweight='bold', labelpad=2)
-            ax.set_ylabel('Force [N]', fontweight='bold', labelpad=2)
-            
-            # Gitter hinzufügen
-            ax.grid(True)
-            
-            # Optimiere Layout
-            fig.tight_layout(pad=2.0)
-            
-            # Speichere Plot
-            plot_path = plots_folder / f"{name}_plot.png"
-            fig.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close(fig)
+            curves = decimate_curves(analyzer.measurements_data, decimation, pixels, template.x_range)
+            template.render(curves, plots_folder / f"{name}_plot.png")
+            if export_curves:
+                export_curves_csv(curves, plots_folder / f"{name}_curves.csv")
     
     @staticmethod
     def create_work_interval_plots(analyzers_dict: dict, plots_folder: Path):
         """
         Erstellt Plots für die durchschnittlichen Arbeitsintervalle mit Standardabweichungen.
 
-        Diese Methode visualisiert für jede Messreihe die mittlere Arbeit in jedem 10%-Intervall
-        der Einbettlänge. Die Arbeitswerte werden als Balken dargestellt, wobei die Fehlerbalken
-        die Standardabweichung anzeigen. Die x-Achse wird in 20%-Schritten beschriftet, während
-        die Daten für jedes 10%-Intervall gezeigt werden.
+        Diese Methode visualisiert für jede Messreihe die mittlere Arbeit in jedem Intervall
+        der Einbettlänge (Standard: 10%-Intervalle). Die Arbeitswerte werden als Balken dargestellt,
+        wobei die Fehlerbalken die Standardabweichung anzeigen. Die x-Achse wird in 20%-Schritten
+        beschriftet, während die Daten für jedes Intervall gezeigt werden.
 
         Args:
             analyzers_dict: Dictionary mit Namen und Analyzern der Messreihen
             plots_folder: Ordner zum Speichern der Plots
         """
         for name, analyzer in analyzers_dict.items():
-            plt.figure(figsize=(12, 8))
-            
-            # X-Positionen für die Balken (zentriert in jedem Intervall)
-            x_positions = np.array([5, 15, 25, 35, 45, 55, 65, 75, 85, 95])
-            
+            template = get_template(WorkIntervalTemplate, analyzer.n_intervals)
             # Extrahiere die nicht-normierten Arbeitsintervalle
-            interval_values = [[] for _ in range(10)]
+            interval_values = [[] for _ in range(analyzer.n_intervals)]
             for intervals in analyzer.work_intervals:
                 for i, value in enumerate(intervals):
                     interval_values[i].append(value)
@@ -110,52 +84,8 @@ class DataPlotter:
             means = [np.mean(values) for values in interval_values]
             stds = [np.std(values) for values in interval_values]
             
-            # Erstelle Balkendiagramm mit Fehlerbalken
-            bars = plt.bar(x_positions, means,
-                           width=8,  # Breite der Balken
-                           color='lightblue',  # Helle Farbe für die Balken
-                           edgecolor='blue',  # Blaue Umrandung
-                           linewidth=1.5,  # Dicke der Umrandung
-                           alpha=0.7,  # Leichte Transparenz
-                           label='Mittlere Arbeit pro Intervall')
-            
-            # Füge Fehlerbalken hinzu
-            plt.errorbar(x_positions, means,
-                         yerr=stds,
-                         fmt='none',  # Keine Verbindungslinien
-                         ecolor='red',  # Rote Fehlerbalken
-                         elinewidth=1.5,  # Dicke der Fehlerbalken
-                         capsize=5,  # Größe der Endkappen
-                         capthick=1.5)  # Dicke der Endkappen
-            
-            # Beschriftungen und Formatierung
-            plt.title(f'Arbeitsintervalle - {name}',
-                      fontsize=24, fontweight='bold')
-            plt.xlabel('Relative Position [%]',
-                       fontsize=24, fontweight='bold')
-            plt.ylabel('Arbeit [µJ]',
-                       fontsize=24, fontweight='bold')
-            
-            # X-Achse in 20%-Schritten beschriften
-            plt.xticks(np.arange(0, 101, 20),
-                       fontsize=22, fontweight='bold')
-            plt.yticks(fontsize=22, fontweight='bold')
-            
-            # Füge ein Gitter hinzu (nur horizontale Linien für bessere Lesbarkeit)
-            plt.grid(True, axis='y', linestyle='--', alpha=0.7)
-            
-            # Entferne vertikale Randlinien für einen klareren Look
-            plt.gca().spines['right'].set_visible(False)
-            plt.gca().spines['top'].set_visible(False)
-            
-            # Füge eine Legende hinzu
-            # plt.legend(fontsize=16, loc='upper right')
-            
-            # Speichere Plot
-            plt.tight_layout()  # Optimiere Layout
-            plot_path = plots_folder / f"work_intervals_{name}.png"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            # Balken und Fehlerbalken im Template aktualisieren und speichern
+            template.render(name, means, stds, plots_folder / f"work_intervals_{name}.png")
     
     @staticmethod
     def create_boxplots(analyzers_dict: dict, plots_folder: Path):
@@ -523,7 +453,7 @@ class DataPlotter:
                     std_after_values.append(np.std(valid_after))
         
         if not labels:
-            print("Keine gültigen Arbeitssegment-Daten zum Plotten vorhanden")
+            DataPlotter.logger.warning("Keine gültigen Arbeitssegment-Daten zum Plotten vorhanden")
             return
         
         # Erstelle Balkendiagramm
@@ -655,7 +585,7 @@ class DataPlotter:
                     std_after_values.append(np.std(valid_after))
         
         if not labels:
-            print("Keine gültigen flächennormierten Arbeitssegment-Daten zum Plotten vorhanden")
+            DataPlotter.logger.warning("Keine gültigen flächennormierten Arbeitssegment-Daten zum Plotten vorhanden")
             return
         
         # Erstelle Balkendiagramm
@@ -763,16 +693,15 @@ class DataPlotter:
         """
         plt.figure(figsize=(14, 10))
         
-        # X-Achse: Positionen für alle 10%-Intervalle
-        x_points = np.array([5, 15, 25, 35, 45, 55, 65, 75, 85, 95])  # Mittelpunkte der Intervalle
-        
         # Farbschema für verschiedene Messreihen
         colors = plt.cm.tab10(np.linspace(0, 1, len(analyzers_dict)))
         
         # Plotte jede Messreihe mit unterschiedlicher Farbe
         for i, (name, analyzer) in enumerate(analyzers_dict.items()):
+            # X-Achse: Mittelpunkte der Intervalle
+            x_points = interval_centers(analyzer.n_intervals)
             # Berechne Mittelwert und Standardabweichung für jedes Intervall
-            interval_values = [[] for _ in range(10)]  # 10 Intervalle
+            interval_values = [[] for _ in range(analyzer.n_intervals)]
             for measurement in analyzer.normed_intervals:
                 for j, value in enumerate(measurement):
                     interval_values[j].append(value)
@@ -816,42 +745,14 @@ class DataPlotter:
         """
         Erstellt Plots für die normierte Arbeit jeder Messreihe.
 
-        Zeigt die normierte Arbeit für jedes 10%-Intervall, wobei die x-Achse
+        Zeigt die normierte Arbeit für jedes Intervall, wobei die x-Achse
         in 20%-Schritten beschriftet wird. Jedes Intervall zeigt die normierte
         Arbeit W(Intervall)/W(gesamt) für diesen spezifischen Abschnitt.
         """
-        # Verwende Plasma-Farbschema für verschiedene Messungen
-        colors = plt.cm.plasma(np.linspace(0, 1, 10))
-        
         for name, analyzer in analyzers_dict.items():
-            plt.figure(figsize=(10, 8))
-            
-            # X-Achse: Positionen für alle 10%-Intervalle
-            x_points = np.array([5, 15, 25, 35, 45, 55, 65, 75, 85, 95])  # Mittelpunkte der Intervalle
-            
-            # Plot jede normierte Messung
-            for i, normed_measurement in enumerate(analyzer.normed_intervals):
-                plt.plot(x_points, normed_measurement,
-                         color=colors[i % len(colors)],
-                         label=f'Messung {i + 1}',
-                         marker='o')  # Marker für bessere Sichtbarkeit der Messpunkte
-            
-            # Beschriftungen und Formatierung
-            plt.title(f'Normierte Arbeit - {name}', fontsize=24, fontweight='bold')
-            plt.xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
-            plt.ylabel('Normierte Arbeit pro Intervall', fontsize=24, fontweight='bold')
-            
-            # X-Achse in 20%-Schritten beschriften
-            plt.xticks(np.arange(0, 101, 20), fontsize=22, fontweight='bold')
-            plt.yticks(fontsize=22, fontweight='bold')
-            
-            plt.grid(True, linestyle='--', alpha=0.7)
-            # plt.legend(fontsize=16)
-            
-            # Speichere Plot
-            plot_path = plots_folder / f"normalized_work_{name}.png"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            template = get_template(NormalizedWorkTemplate, analyzer.n_intervals)
+            # Eine Linie pro normierter Messung, Farben aus dem Plasma-Schema
+            template.render(name, analyzer.normed_intervals, plots_folder / f"normalized_work_{name}.png")
     
     @staticmethod
     def create_mean_normalized_plots(analyzers_dict: dict, plots_folder: Path):
@@ -859,16 +760,12 @@ class DataPlotter:
         Erstellt Plots für die Mittelwerte der normierten Arbeit mit Fehlerbalken.
 
         Zeigt den Mittelwert und die Standardabweichung der normierten Arbeit für
-        jedes 10%-Intervall. Die x-Achse wird in 20%-Schritten beschriftet.
+        jedes Intervall. Die x-Achse wird in 20%-Schritten beschriftet.
         """
         for name, analyzer in analyzers_dict.items():
-            plt.figure(figsize=(10, 8))
-            
-            # X-Achse: Positionen für alle 10%-Intervalle
-            x_points = np.array([5, 15, 25, 35, 45, 55, 65, 75, 85, 95])  # Mittelpunkte der Intervalle
-            
+            template = get_template(MeanNormalizedWorkTemplate, analyzer.n_intervals)
             # Extrahiere die Werte für jedes Intervall
-            interval_values = [[] for _ in range(10)]  # 10 Intervalle
+            interval_values = [[] for _ in range(analyzer.n_intervals)]
             for measurement in analyzer.normed_intervals:
                 for i, value in enumerate(measurement):
                     interval_values[i].append(value)
@@ -877,34 +774,7 @@ class DataPlotter:
             means = [np.mean(values) for values in interval_values]
             stds = [np.std(values) for values in interval_values]
             
-            # Plotte Mittelwertlinie mit Fehlerbalken
-            plt.errorbar(x_points, means,
-                         yerr=stds,
-                         fmt='b-',
-                         linewidth=2,
-                         ecolor='red',
-                         elinewidth=1,
-                         capsize=5,
-                         capthick=1,
-                         marker='o',  # Marker für die Datenpunkte
-                         label='Mittelwert mit Standardabweichung')
-            
-            # Beschriftungen und Formatierung
-            plt.title(f'Mittlere normierte Arbeit - {name}', fontsize=24, fontweight='bold')
-            plt.xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
-            plt.ylabel('Normierte Arbeit pro Intervall', fontsize=24, fontweight='bold')
-            
-            # X-Achse in 20%-Schritten beschriften
-            plt.xticks(np.arange(0, 101, 20), fontsize=22, fontweight='bold')
-            plt.yticks(fontsize=22, fontweight='bold')
-            
-            plt.grid(True, linestyle='--', alpha=0.7)
-            # plt.legend(fontsize=16)
-            
-            # Speichere Plot
-            plot_path = plots_folder / f"mean_normalized_work_{name}.png"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            template.render(name, means, stds, plots_folder / f"mean_normalized_work_{name}.png")
     
     @staticmethod
     def create_area_normalized_work_boxplot(analyzers_dict: dict, plots_folder: Path):
@@ -925,7 +795,7 @@ class DataPlotter:
         for name, analyzer in analyzers_dict.items():
             # Stelle sicher, dass die flächennormierte Arbeit berechnet wurde
             if not hasattr(analyzer, 'area_normalized_works') or not analyzer.area_normalized_works:
-                print(f"Warnung: Keine flächennormierten Arbeitsdaten für {name}")
+                DataPlotter.logger.warning(f"Keine flächennormierten Arbeitsdaten für {name}")
                 continue
             
             area_norm_work_data.append(analyzer.area_normalized_works)
@@ -933,7 +803,7 @@ class DataPlotter:
             labels.append(name.replace('_', ' '))
         
         if not area_norm_work_data:
-            print("Keine flächennormierten Arbeitsdaten zum Plotten vorhanden")
+            DataPlotter.logger.warning("Keine flächennormierten Arbeitsdaten zum Plotten vorhanden")
             return
         
         # Erstelle Boxplot für flächennormierte Arbeit
@@ -1066,7 +936,7 @@ class DataPlotter:
             # Prüfe, ob alle erforderlichen Daten vorhanden sind
             required_keys = ['z_scores', 'robust_z_scores', 'mean', 'std', 'median', 'iqr']
             if not all(key in data_dict for key in required_keys):
-                print(f"Warnung: Fehlende Daten für {name}")
+                DataPlotter.logger.warning(f"Fehlende Daten für {name}")
                 return
             
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
@@ -1119,7 +989,7 @@ class DataPlotter:
             plt.close()
         
         except Exception as e:
-            print(f"Fehler beim Erstellen des Z-Score Plots für {name}: {str(e)}")
+            DataPlotter.logger.error(f"Fehler beim Erstellen des Z-Score Plots für {name}: {str(e)}")
             plt.close()  # Stelle sicher, dass Figure geschlossen wird
     
     @staticmethod
@@ -1135,7 +1005,7 @@ class DataPlotter:
             plots_folder.mkdir(exist_ok=True)
             
             if not analyzers_dict:
-                print("Warnung: Keine Analyzer für Z-Score Plots verfügbar")
+                DataPlotter.logger.warning("Keine Analyzer für Z-Score Plots verfügbar")
                 return
             
             for name, analyzer in analyzers_dict.items():
@@ -1168,11 +1038,11 @@ class DataPlotter:
                         )
                 
                 except Exception as e:
-                    print(f"Fehler bei der Verarbeitung von {name}: {str(e)}")
+                    DataPlotter.logger.error(f"Fehler bei der Verarbeitung von {name}: {str(e)}")
                     continue
         
         except Exception as e:
-            print(f"Fehler beim Erstellen der Z-Score Plots: {str(e)}")
+            DataPlotter.logger.error(f"Fehler beim Erstellen der Z-Score Plots: {str(e)}")
     
     @staticmethod
     def create_area_normalized_work_plot(analyzers_dict: dict, plots_folder: Path):
@@ -1207,7 +1077,7 @@ class DataPlotter:
                     std_values.append(np.std(valid_data))
         
         if not labels:
-            print("Keine gültigen flächennormierten Arbeitsdaten zum Plotten vorhanden")
+            DataPlotter.logger.warning("Keine gültigen flächennormierten Arbeitsdaten zum Plotten vorhanden")
             return
         
         # Erstelle Balkendiagramm
@@ -1386,7 +1256,7 @@ class DataPlotter:
             # Prüfe, ob die Arbeitssegmente berechnet wurden
             if not hasattr(analyzer, 'work_before_fmax') or not analyzer.work_before_fmax or \
                     not hasattr(analyzer, 'work_after_fmax') or not analyzer.work_after_fmax:
-                print(f"Warnung: Keine Arbeitssegment-Daten für {name}")
+                DataPlotter.logger.warning(f"Keine Arbeitssegment-Daten für {name}")
                 continue
             
             work_before_fmax_data.append(analyzer.work_before_fmax)
@@ -1395,7 +1265,7 @@ class DataPlotter:
             labels.append(name.replace('_', ' '))
         
         if not work_before_fmax_data or not work_after_fmax_data:
-            print("Keine Arbeitssegment-Daten zum Plotten vorhanden")
+            DataPlotter.logger.warning("Keine Arbeitssegment-Daten zum Plotten vorhanden")
             return
         
         # 1. Erstelle Boxplot für Arbeit bis F_max
@@ -1519,7 +1389,7 @@ class DataPlotter:
             # Prüfe, ob die flächennormierten Arbeitssegmente berechnet wurden
             if not hasattr(analyzer, 'area_normalized_before_fmax') or not analyzer.area_normalized_before_fmax or \
                     not hasattr(analyzer, 'area_normalized_after_fmax') or not analyzer.area_normalized_after_fmax:
-                print(f"Warnung: Keine flächennormierten Arbeitssegment-Daten für {name}")
+                DataPlotter.logger.warning(f"Keine flächennormierten Arbeitssegment-Daten für {name}")
                 continue
             
             area_norm_before_fmax_data.append(analyzer.area_normalized_before_fmax)
@@ -1528,7 +1398,7 @@ class DataPlotter:
             labels.append(name.replace('_', ' '))
         
         if not area_norm_before_fmax_data or not area_norm_after_fmax_data:
-            print("Keine flächennormierten Arbeitssegment-Daten zum Plotten vorhanden")
+            DataPlotter.logger.warning("Keine flächennormierten Arbeitssegment-Daten zum Plotten vorhanden")
             return
         
         # 1. Erstelle Boxplot für flächennormierte Arbeit bis F_max
@@ -3,24 +3,30 @@ this code was made with the help of chatgpt, claude, stackoverflow .... u name a
 """
 
 # src/core/data_sorter.py
-from src.config.settings import naming_storage, sort_storage
+from src.config.settings import naming_storage, sort_storage, NamingInTheNameOf, SortOf
 
 class DataSorter:
     """sort the useful and evaluable pull-outs"""
 
 
     @staticmethod
-    def analyze_filenames() -> None:
+    def analyze_filenames(naming: NamingInTheNameOf = None, sorting: SortOf = None) -> None:
         """
         Analyzes filenames and sorts them into successful and failed measurements.
         The method looks at the part before the first underscore to determine
         if it's a new or old naming scheme.
+        Without explicit naming/sorting states the global storages are used.
         """
-        if not naming_storage.filenames:
+        if naming is None:
+            naming = naming_storage
+        if sorting is None:
+            sorting = sort_storage
+
+        if not naming.filenames:
             raise ValueError("No filenames to analyze")
 
         # Analyze the first filename to determine the naming scheme
-        first_name = naming_storage.filenames[0]
+        first_name = naming.filenames[0]
         prefix = first_name.split('_')[0]  # Get part before first underscore
 
         # Determine if we're dealing with new or old naming scheme
@@ -30,18 +36,18 @@ class DataSorter:
 
         if is_new_scheme:
             successful, failed = DataSorter._sort_new_scheme(
-                naming_storage.filenames
+                naming.filenames
             )
         else:
             successful, failed = DataSorter._sort_old_scheme(
-                naming_storage.filenames
+                naming.filenames
             )
 
-        # Store results in our global storage
-        sort_storage.good_ones = successful
-        sort_storage.bad_ones = failed
-        sort_storage.good_ones_nr = len(successful)
-        sort_storage.bad_ones_nr = len(failed)
+        # Store results in the given (default: global) storage
+        sorting.good_ones = successful
+        sorting.bad_ones = failed
+        sorting.good_ones_nr = len(successful)
+        sorting.bad_ones_nr = len(failed)
 
     @staticmethod
     def _sort_new_scheme(filenames: list[str]) -> tuple[list[str], list[str]]:
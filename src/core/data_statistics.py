@@ -3,13 +3,28 @@ this code was made with the help of chatgpt, claude, stackoverflow .... u name i
 """
 
 # src/core/data_statistics.py
-from src.config.settings import naming_storage, sort_storage
+from src.config.settings import naming_storage, sort_storage, NamingInTheNameOf, SortOf
 import logging
 from pathlib import Path
-import pandas as pd
 import numpy as np
 import math
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Optional
+from src.core.measurement_store import MeasurementStore, Curve
+from src.core.metric_kernels import CurveMetrics
+from src.core.modulus_engine import ModulusSettings, compute_moduli
+from src.core.batch_kernels import compute_series_metrics, series_area_normalized
+from src.core.specimen_parser import SpecimenParser, SpecimenHeader
+from src.core.result_cache import MetricsCache, CachedSpecimen
+from src.core.curve_archive import CurveArchive
+
+
+@dataclass
+class ReadError:
+    """Messdatei, die beim Einlesen übersprungen wurde"""
+    path: Path
+    message: str
 
 
 @dataclass
@@ -21,13 +36,25 @@ class AnalysisConfig:
     # Berechnungen
     calculate_zscores: bool = True
     calculate_force_moduli: bool = True
+    modulus_lower_fraction: float = 0.2  # Unteres Kraftniveau des Verbundmoduls (Anteil von F_max)
+    modulus_upper_fraction: float = 0.7  # Oberes Kraftniveau des Verbundmoduls (Anteil von F_max)
+    modulus_fit: str = 'secant'  # 'secant' (zwei Punkte) oder 'lstsq' (Ausgleichsgerade im Fenster)
     calculate_work_intervals: bool = True
+    work_interval_count: int = 10  # Anzahl gleich breiter Arbeitsintervalle (z.B. 10, 20, 100)
     calculate_area_normalized_works: bool = True
+    kernel_backend: str = 'numpy'  # Kennwert-Kernels: 'numpy', 'numba' (kompiliert, optional) oder 'auto'
+    read_workers: int = 8  # Threads zum Einlesen der Messdateien (1: nacheinander, z.B. für lokale SSDs)
+    
+    # Laufzeitmessung der Verarbeitungsschritte (src/utils/stage_profiler.py)
+    profile_stages: bool = False  # Wand-/CPU-Zeit, Speicher und Anzahl je Schritt und Messreihe
+    profile_memory: bool = False  # Spitzenwert der Allokationen mit tracemalloc (langsamer)
     
     # Statistische Analysen
     perform_bootstrap: bool = False  # Option für Bootstrap
     perform_anova: bool = False  # Option für ANOVA
     bootstrap_samples: int = 1000  # Anzahl der Bootstrap-Stichproben
+    bootstrap_memory_mb: float = 256.0  # Speicherbudget der Bootstrap-Indexmatrizen (auf alle Threads verteilt)
+    bootstrap_workers: Optional[int] = None  # Threads für Bootstrap (None: Standard des Pools)
     anova_target_size: int = 10  # Zielgröße für ANOVA-Bootstrap
     
     # Plot-Erstellung
@@ -39,28 +66,69 @@ class AnalysisConfig:
     create_zscore_plots: bool = True  # Z-Score-Plots
     create_statistical_plots: bool = True  # Option für statistische Plots
     
+    curve_decimation: Optional[str] = 'minmax'  # Kurven vor dem Plotten ausdünnen ('minmax', 'lttb' oder None)
+    decimation_pixels: Optional[int] = None  # Ausgabeauflösung in x-Richtung (None: Breite der Abbildung)
+    export_decimated_curves: bool = False  # Ausgedünnte Kurven als CSV neben den Kraft-Weg-Plots speichern
+    
+    parallel_plots: bool = True  # Plots in Worker-Prozessen rendern
+    plot_workers: Optional[int] = None  # Anzahl Plot-Worker (None: alle Kerne)
+    
     # Export
     export_to_excel: bool = True
+    excel_export_mode: str = 'separate'  # 'separate' (eine Datei je Tabellengruppe) oder 'consolidated' (Streaming)
+    excel_workbooks: Optional[dict[str, list[str]]] = None  # Gesamtexport: Dateiname -> Tabellengruppen (None: eine Datei)
+    excel_engine: Optional[str] = None  # Streaming-Engine 'xlsxwriter' oder 'openpyxl' (None: erste installierte)
+    columnar_export: Optional[str] = None  # Kurven und Kennwerte zusätzlich als 'parquet' oder 'arrow' (None: aus)
+    columnar_folder: Optional[Path] = None  # Zielordner (None: Unterordner 'SFPO_Daten' im Ergebnisordner)
+    
+    # Ausführung
+    parallel_series: bool = True  # Messreihen im Prozess-Pool analysieren
+    
+    # Ergebnis-Cache
+    use_result_cache: bool = False  # Kurven und Kennwerte je Probe auf der Festplatte zwischenspeichern
+    cache_folder: Optional[Path] = None  # Cache-Ordner (None: Cache-Ordner des Benutzers, default_cache_folder)
+    cache_max_mb: float = 512.0  # Maximale Cache-Größe, darüber werden alte Einträge verdrängt
+    cache_key_mode: str = 'content'  # 'content' (Inhaltshash) oder 'stat' (Größe + Änderungszeit)
+    max_workers: Optional[int] = None  # Anzahl Worker-Prozesse (None: alle Kerne)
+    
+    # Kurvenarchiv
+    curve_archive: Optional[Path] = None  # Kurven aus diesem Archiv statt aus den Textdateien laden
 
 
 class MeasurementAnalyzer:
     """
     All calculations and statistical evaluations are performed in this class.
     """
-    def __init__(self, max_allowed_length: float = 1000.0):
-        self.measurements_data = []  # Liste für alle Messungen
+    def __init__(self, max_allowed_length: float = 1000.0,
+                 naming: NamingInTheNameOf = None, sorting: SortOf = None):
+        # Pfad- und Sortierzustand der Messreihe, ohne Angabe die globalen Instanzen
+        self.naming = naming if naming is not None else naming_storage
+        self.sorting = sorting if sorting is not None else sort_storage
+        self.measurements_data = MeasurementStore()  # Spaltenspeicher für alle Messungen
         self.max_forces_data = []  # Liste aller Maximalkräfter jeder erfolgreichen Messung
         self.embeddinglengths = []  # Liste aller Einbettlängen
         self.fiberdiameters = []
+        self.specimen_headers: list[SpecimenHeader] = []  # Kopfdaten je eingelesener Messung
         self.ifssvalues = []
         self.works = []
         self.work_intervals = []
+        self.cumulative_works = []  # Arbeit bis zu jeder Intervallgrenze je Messung
         self.normed_intervals = []  # Neue Liste für normierte Intervalle
+        self.cumulative_normed_works = []  # Kumulative normierte Arbeit je Messung
         self.mean_normed_intervals = []  # Mittelwerte
         self.stddev_normed_intervals = []  # Standardabweichungen
         self.rel_stddev_normed_intervals = []  # Relative Standardabweichungen
         self.force_moduli = []  # Liste für die Verbundmodule
+        self.modulus_settings = ModulusSettings()  # Kraftniveaus und Verfahren des Verbundmoduls
         self.area_normalized_works = []  # Liste für flächen normalisierte Auszugsarbeit
+        self.curve_metrics: list[CurveMetrics] = []  # Kennwerte je Messung aus dem Einzeldurchlauf
+        self.result_cache: Optional[MetricsCache] = None  # Optionaler Cache für Kurven und Kennwerte
+        self._cache_keys: list[str] = []  # Cache-Schlüssel je eingelesener Messung
+        self._cached_metrics: list[Optional[CurveMetrics]] = []  # Kennwerte aus dem Cache (None: neu berechnen)
+        self.n_intervals = 10  # Anzahl der Arbeitsintervalle
+        self.kernel_backend = 'numpy'  # Backend der Kennwert-Kernels (batch_kernels.resolve_kernel_backend)
+        self.read_workers = 8  # Threads für read_all_measurements (1: nacheinander)
+        self.read_errors: list[ReadError] = []  # Übersprungene Dateien des letzten Einlesens
         self.max_allowed_length = max_allowed_length  # Neue Variable für max. Einbetttiefe
         self.logger = logging.getLogger('SFPO_Analyzer')  # Logger initialisieren
         self._update_mapping()
@@ -94,81 +162,93 @@ class MeasurementAnalyzer:
         Creates full paths for all successful measurements.
         """
         return [
-            naming_storage.root_path / f"{filename}.txt"
-            for filename in sort_storage.good_ones]
+            self.naming.root_path / f"{filename}.txt"
+            for filename in self.sorting.good_ones]
 
-    def read_single_measurement(self, file_path: Path) -> list[tuple[float, float]]:
+    def read_single_measurement(self, file_path: Path) -> Curve:
         """
         Reads and processes a single measurement file.
+        Returns the cleaned curve as (displacement, force) arrays.
         """
-        df = pd.read_csv(
-            file_path,
-            delimiter="\t",
-            header=None,
-            skiprows=40,
-            encoding='unicode_escape',
-            names=["Time", "Displacement", "Force"],
-            usecols=["Displacement", "Force"])
-        # Datenbereinigung
-        df = df[
-            (df["Displacement"] > 0) &
-            (df["Displacement"] < self.max_allowed_length) &  # Verwende konfigurierbare Einbetttiefe
-            (df["Force"] >= 0)]
-        return list(zip(df["Displacement"], df["Force"]))
+        # Datenbereinigung mit der konfigurierbaren Einbetttiefe übernimmt der Parser
+        return SpecimenParser(self.max_allowed_length).parse(file_path).curve
 
-    def read_all_measurements(self):
+    def _map_files(self, function, paths: list[Path]) -> list[tuple[Path, object, Optional[Exception]]]:
         """
-        Reads and processes all successful measurements.
+        Wendet function auf alle Pfade an, mit self.read_workers Threads (Dateizugriffe auf
+        Netzlaufwerken überlappen sich). Ergebnisse in der Reihenfolge von paths als
+        (Pfad, Ergebnis, Fehler); ein Fehler bricht das Einlesen der übrigen Dateien nicht ab.
         """
-        measurement_paths = self.get_measurement_paths()
-        for path in measurement_paths:
+        def guarded(path: Path):
             try:
-                measurement_data = self.read_single_measurement(path)
-                self.measurements_data.append(measurement_data)
+                return path, function(path), None
             except Exception as e:
-                logger = logging.getLogger('SFPO_Analyzer')
-                logger.error(f"Fehler beim Lesen von {path}: {e}")
-
-    def find_max_force_single(self, measurement: list[tuple[float, float]]) -> float:
-        """
-        Findet die maximale Kraft in einer einzelnen Messung.
-        Args: measurement: Liste von (distance, force) Tupeln einer Messung
-        Returns: Maximale Kraft als float
-        """
-        # erstelle Liste mit Kraftwerten
-        # Jedes Tupel hat (distance, force) == ([0],[1]), wir wollen nur force, also Index 1
-        forces = [point[1] for point in measurement]
-        # Finde das Maximum
-        max_force = max(forces)
-        return max_force
-
-    def find_all_max_forces(self):
-        """
-        Findet die maximalen Kräfte aller erfolgreichen Messungen
-        und speichert sie in dieser Klasse für weitere Berechnungen.
-        """
-        for measurement in self.measurements_data:
-            max_force = self.find_max_force_single(measurement)
-            self.max_forces_data.append(max_force)
-
-    def find_single_embeddinglength(self, measurement: list[tuple[float, float]]) -> float:
-        """
-        Ermittelt die Einbettlänge einer einzelnen Messung basierend auf der maximalen Verschiebung.
-        Berücksichtigt die konfigurierte maximale Einbetttiefe.
-        """
-        # erstelle Liste mit Distanzwerten
-        distance = [point[0] for point in measurement]
-        # Finde das Maximum und begrenze es auf die erlaubte maximale Länge
-        embeddinglength = min(max(distance), self.max_allowed_length)
-        return embeddinglength
+                return path, None, e
+
+        workers = min(self.read_workers or 1, len(paths))
+        if workers <= 1:
+            return [guarded(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='SFPO_Einlesen') as executor:
+            return list(executor.map(guarded, paths))
+
+    def _read_specimen(self, path: Path, parser: SpecimenParser) -> tuple[CachedSpecimen, Optional[str]]:
+        """Liest eine Messdatei bzw. ihren Cache-Eintrag; liefert den Eintrag und den Cache-Schlüssel."""
+        if self.result_cache is None:
+            specimen = parser.parse(path)
+            return CachedSpecimen(curve=specimen.curve, header=specimen.header), None
+
+        # Mit Cache: unveränderte Dateien werden nicht erneut eingelesen
+        raw = path.read_bytes() if self.result_cache.needs_content else None
+        entry = self.naming.file_entries.get(path)  # Größe und Änderungszeit aus der Verzeichnissuche
+        key = self.result_cache.make_key(path, self.max_allowed_length, self.n_intervals, raw,
+                                         entry.signature if entry is not None else None, self.modulus_settings)
+        cached = self.result_cache.get(key)
+        if cached is None:
+            specimen = parser.parse_bytes(raw if raw is not None else path.read_bytes(), path)
+            cached = CachedSpecimen(curve=specimen.curve, header=specimen.header)
+        return cached, key
 
-    def find_all_embeddinglengths(self):
-        """
-        Ermittelt die Einbettlängen für alle Messungen und speichert sie in self.embeddinglengths.
+    def read_all_measurements(self):
         """
-        for measurement in self.measurements_data:
-            max_distance = self.find_single_embeddinglength(measurement)
-            self.embeddinglengths.append(max_distance)
+        Reads and processes all successful measurements.
+        Each file is opened once; the fiber diameter is taken from the same read.
+        Files are read by up to self.read_workers threads; the curves keep the
+        order of sorting.good_ones. Unreadable files are skipped and collected
+        in self.read_errors.
+        """
+        parser = SpecimenParser(self.max_allowed_length)
+        curves = []
+        self.specimen_headers = []
+        self._cache_keys = []
+        self._cached_metrics = []
+        self.read_errors = []
+        results = self._map_files(lambda path: self._read_specimen(path, parser), self.get_measurement_paths())
+        for path, result, error in results:
+            if error is not None:
+                self.read_errors.append(ReadError(path, f"{type(error).__name__}: {error}"))
+                continue
+            specimen, key = result
+            curves.append(specimen.curve)
+            self.specimen_headers.append(specimen.header)
+            if key is not None:
+                self._cache_keys.append(key)
+                self._cached_metrics.append(specimen.metrics)
+        for read_error in self.read_errors:
+            self.logger.error(f"Fehler beim Lesen von {read_error.path}: {read_error.message}")
+        # Alle Kurven in einen zusammenhängenden Spaltenspeicher überführen
+        self.measurements_data = MeasurementStore.from_curves(curves)
+        self.fiberdiameters = [header.fiber_diameter for header in self.specimen_headers]
+
+    def load_from_archive(self, archive: CurveArchive, series: str):
+        """
+        Übernimmt Kurven und Kopfdaten einer Messreihe aus einem Kurvenarchiv
+        statt die Textdateien einzulesen. Die Kurven bleiben auf dem gemappten Speicher.
+        """
+        self.measurements_data = archive.store(series, self.max_allowed_length)
+        self.specimen_headers = archive.headers(series)
+        self.fiberdiameters = [header.fiber_diameter for header in self.specimen_headers]
+        self._cache_keys = []
+        self._cached_metrics = []
 
     def find_single_fiberdiameter(self, file_path: Path) -> float:
         """Liest den Faserdurchmesser aus einer einzelnen Messdatei."""
@@ -180,23 +260,33 @@ class MeasurementAnalyzer:
                         return float(diameter_str)
             raise ValueError(f"Zeile 20 nicht gefunden in {file_path}")
         except Exception as e:
-            print(f"Fehler beim Lesen des Faserdurchmessers: {e}")
+            self.logger.error(f"Fehler beim Lesen des Faserdurchmessers: {e}")
             return 0.0  # oder einen anderen sinnvollen Standardwert
 
     def process_all_fiberdiameters(self):
         """Verarbeitet die Faserdurchmesser aller erfolgreichen Messungen."""
         self.fiberdiameters = []  # Liste zurücksetzen
 
+        # Kopfdaten liegen schon aus read_all_measurements vor - kein erneutes Öffnen der Dateien
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if self.specimen_headers and len(self.specimen_headers) == len(self.measurements_data):
+            self.logger.info(f"Faserdurchmesser aus {len(self.specimen_headers)} Dateiköpfen übernommen")
+            self.fiberdiameters = [header.fiber_diameter for header in self.specimen_headers]
+            if debug:
+                for i, diameter in enumerate(self.fiberdiameters, 1):
+                    self.logger.debug(f"  Datei {i}: Durchmesser = {diameter}")
+            return
+
         paths = self.get_measurement_paths()
-        print(f"\nVerarbeite {len(paths)} Dateien für Faserdurchmesser:")
+        self.logger.info(f"Verarbeite {len(paths)} Dateien für Faserdurchmesser")
 
-        for i, path in enumerate(paths, 1):
-            try:
-                diameter = self.find_single_fiberdiameter(path)
-                print(f"  Datei {i}: Durchmesser = {diameter}")
-                self.fiberdiameters.append(diameter)
-            except Exception as e:
-                print(f"  Fehler bei Datei {i}: {e}")
+        for i, (path, diameter, error) in enumerate(self._map_files(self.find_single_fiberdiameter, paths), 1):
+            if error is not None:
+                self.logger.error(f"Fehler bei Datei {i}: {error}")
+                continue
+            if debug:
+                self.logger.debug(f"  Datei {i}: Durchmesser = {diameter}")
+            self.fiberdiameters.append(diameter)
 
     def check_data_consistency(self):
         """Überprüft ob alle Datenlisten die gleiche Länge haben und zeigt Details"""
@@ -204,192 +294,139 @@ class MeasurementAnalyzer:
         fiber_len = len(self.fiberdiameters)
         paths_len = len(self.get_measurement_paths())
 
-        print("\nDatenmengen:")
-        print(f"Gefundene Dateipfade: {paths_len}")
-        print(f"Eingelesene Messungen: {measurements_len}")
-        print(f"Gefundene Faserdurchmesser: {fiber_len}")
+        self.logger.debug(f"Datenmengen: {paths_len} Dateipfade, {measurements_len} Messungen, "
+                          f"{fiber_len} Faserdurchmesser")
 
         if fiber_len != measurements_len:
-            print("\nWarnung: Ungleiche Längen!")
+            self.logger.warning(f"Ungleiche Längen: {measurements_len} Messungen, {fiber_len} Faserdurchmesser")
 
             # Zeige die tatsächlichen Daten für Debugging
-            print("\nDateipfade:")
-            for path in self.get_measurement_paths():
-                print(f"  {path}")
-
-            print("\nFaserdurchmesser:")
-            for dia in self.fiberdiameters:
-                print(f"  {dia}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Dateipfade:\n" + "\n".join(f"  {path}" for path in self.get_measurement_paths()))
+                self.logger.debug("Faserdurchmesser:\n" + "\n".join(f"  {dia}" for dia in self.fiberdiameters))
 
         return measurements_len == fiber_len
 
-    def interfaceshearstrength(self):
+    def calculate_all_metrics(self, max_allowed_length: float = None):
         """
-        Berechnet die scheinbare Grenzflächenscherfestigkeit (IFSS) für alle Messungen.
+        Berechnet alle Kennwerte aller Messungen gemeinsam (batch_kernels.compute_series_metrics):
+        F_max, Einbettlänge, Arbeit, Arbeit vor/nach F_max, Arbeitsintervalle,
+        Verbundmodul und IFSS.
+
+        Args:
+            max_allowed_length: Maximale Einbetttiefe (µm), wenn None wird self.max_allowed_length verwendet
         """
-        # Zuerst sicherstellen, dass wir alle benötigten Werte haben
+        if max_allowed_length is None:
+            max_allowed_length = self.max_allowed_length
+
+        # Der Cache-Schlüssel enthält self.max_allowed_length, nur bei gleicher Einbetttiefe gültig
+        use_cache = (self.result_cache is not None
+                     and max_allowed_length == self.max_allowed_length
+                     and len(self._cache_keys) == len(self.measurements_data))
+
+        metrics = list(self._cached_metrics) if use_cache else [None] * len(self.measurements_data)
+        missing = [i for i, curve_metrics in enumerate(metrics) if curve_metrics is None]
+        if missing:
+            # Alle nicht zwischengespeicherten Kurven gemeinsam auf den flachen Arrays berechnen
+            store = (self.measurements_data if len(missing) == len(metrics)
+                     else MeasurementStore.from_curves(self.measurements_data[i] for i in missing))
+            computed = compute_series_metrics(store, max_allowed_length, self.n_intervals, self.modulus_settings,
+                                              backend=self.kernel_backend)
+            for i, curve_metrics in zip(missing, computed):
+                metrics[i] = curve_metrics
+                if use_cache:
+                    self.result_cache.put(self._cache_keys[i], CachedSpecimen(
+                        curve=self.measurements_data[i],
+                        header=self.specimen_headers[i],
+                        metrics=curve_metrics))
+
+        if use_cache:
+            self.result_cache.evict()
+        self.apply_curve_metrics(metrics)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_moduli()
+
+    def load_specimens(self, curves: list[Curve], headers: list[SpecimenHeader], metrics: list[CurveMetrics]):
+        """
+        Übernimmt bereits eingelesene Kurven, Kopfdaten und Kennwerte ohne Dateizugriff,
+        z.B. aus dem Watch-Modus, und aktualisiert alle Ergebnislisten. Die Kennwerte
+        müssen mit self.modulus_settings berechnet sein (siehe apply_curve_metrics).
+        """
+        self.measurements_data = MeasurementStore.from_curves(curves)
+        self.specimen_headers = list(headers)
+        self.fiberdiameters = [header.fiber_diameter for header in self.specimen_headers]
+        self._cache_keys = []
+        self._cached_metrics = []
+        self.apply_curve_metrics(metrics)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_moduli()
+
+    def apply_curve_metrics(self, metrics: list[CurveMetrics]):
+        """
+        Überträgt die Kennwerte aus dem Einzeldurchlauf in die Ergebnislisten
+        und berechnet daraus die IFSS-Werte. Der Verbundmodul wird unverändert
+        übernommen, die Kennwerte müssen mit self.modulus_settings berechnet sein.
+        """
+        self.curve_metrics = list(metrics)
+        self.max_forces_data = [m.max_force for m in self.curve_metrics]
+        self.embeddinglengths = [m.embedding_length for m in self.curve_metrics]
+        self.works = [m.work for m in self.curve_metrics]
+        self.work_before_fmax = [m.work_before_fmax for m in self.curve_metrics]
+        self.work_after_fmax = [m.work_after_fmax for m in self.curve_metrics]
+        self.work_intervals = [m.work_intervals for m in self.curve_metrics]
+        self.cumulative_works = [m.cumulative_work for m in self.curve_metrics]
+        self.force_moduli = [m.force_modulus for m in self.curve_metrics]
+
+        # IFSS benötigt zusätzlich die Faserdurchmesser
         if not self.fiberdiameters:
             self.process_all_fiberdiameters()
-        # Prüfe Datenkonsistenz
         if not self.check_data_consistency():
             raise ValueError("Ungleiche Anzahl von Messungen und Faserdurchmessern!")
-        self.ifssvalues = []  # Liste zurücksetzen
-        # Für jede Messung IFSS berechnen
-        for i, measurement in enumerate(self.measurements_data):
+        self.ifssvalues = []
+        for i, (max_force, embedding_length, fiber_diameter) in enumerate(
+                zip(self.max_forces_data, self.embeddinglengths, self.fiberdiameters)):
             try:
-                max_force = self.find_max_force_single(measurement)
-                embedding_length = self.find_single_embeddinglength(measurement)
-                fiber_diameter = self.fiberdiameters[i]
                 # Berechnung der IFSS -> F_max/(PI*l_e*d)
                 ifss = (max_force / (math.pi * embedding_length * fiber_diameter)) * (10 ** 6)
                 self.ifssvalues.append(round(ifss, 2))
             except Exception as e:
-                print(f"Fehler bei Messung {i}: {e}")
-    
-    def calculate_single_work(self, measurement: list[tuple[float, float]], embedding_length: float,
-                              max_allowed_length: float = None) -> float:
-        """
-        Berechnet die verrichtete Arbeit für eine einzelne Messung durch Integration.
-        Args: measurement: Liste von (distance, force) Tupeln einer Messung
-            embedding_length: Maximale Einbettlänge für diese Messung
-            max_allowed_length: Konfigurierbare maximale Einbetttiefe (Optional)
-        Returns: float: Berechnete Arbeit in µJ (Mikro-Joule)
-        """
-        # Wenn keine maximale Länge angegeben wurde, verwende die Klassenvariable
-        if max_allowed_length is None:
-            max_allowed_length = self.max_allowed_length
-            
-        # Extrahiere Weg- und Kraftwerte aus den Tupeln
-        distances = [point[0] for point in measurement]
-        forces = [point[1] for point in measurement]
-        # Konvertiere zu NumPy Arrays für effiziente Berechnung
-        distance_array = np.array(distances)
-        force_array = np.array(forces)
-        
-        # Begrenze embedding_length auf die konfigurierte maximale Länge
-        embedding_length = min(embedding_length, max_allowed_length)
-        # Beschränke die Daten auf den Bereich bis zur Einbettlänge
-        mask = distance_array <= embedding_length
-        limited_distances = distance_array[mask]
-        limited_forces = force_array[mask]
-        
-        # Sicherheitsprüfung der Datenlängen
-        if len(limited_distances) != len(limited_forces):
-            raise ValueError("Ungleiche Anzahl von Weg- und Kraftwerten nach Längenbegrenzung")
-        # Berechne das Integral (Arbeit)
-        work = np.trapezoid(limited_forces, limited_distances)
-        return round(work, 3)
-    
-    def calculate_all_works(self, max_allowed_length: float = None):
-        """
-        Berechnet die verrichtete Arbeit für alle Messungen.
-        Speichert die Ergebnisse in self.works für weitere Berechnungen.
+                self.logger.error(f"Fehler bei Messung {i}: {e}")
+        self._update_mapping()
 
-        Args:
-            max_allowed_length: Maximale Einbetttiefe (µm), wenn None wird self.max_allowed_length verwendet
+    def _cumulative_interval_works(self) -> list:
         """
-        # Verwende die übergebene maximale Länge oder die Klassenvariable
-        if max_allowed_length is None:
-            max_allowed_length = self.max_allowed_length
-        
-        # Initialisiere die Liste für die Arbeitswerte
-        self.works = []
-        # Für jede Messung die Arbeit berechnen
-        for measurement, embedding_length in zip(self.measurements_data, self.embeddinglengths):
-            try:
-                work = self.calculate_single_work(measurement, embedding_length, max_allowed_length)
-                self.works.append(work)
-            except Exception as e:
-                print(f"Fehler bei der Arbeitsberechnung: {e}")
-        # Aktualisiere das Mapping für statistische Berechnungen
-        self.data_mapping.update({'works': self.works})
-    
-    def calculate_single_work_intervals(self, measurement: list[tuple[float, float]],
-                                        embedding_length: float, max_allowed_length: float = None) -> list[float]:
-        """
-        Berechnet die Arbeit in 10 gleichen Intervallen für eine einzelne Messung.
-        Args:   measurement: Liste von (distance, force) Tupeln einer Messung
-                embedding_length: Maximale Einbettlänge für diese Messung
-                max_allowed_length: Konfigurierbare maximale Einbetttiefe (Optional)
-        Returns:Liste mit 10 Arbeitswerten, einer für jedes 10%-Intervall
-        """
-        # Wenn keine maximale Länge angegeben wurde, verwende die Klassenvariable
-        if max_allowed_length is None:
-            max_allowed_length = self.max_allowed_length
-            
-        # Extrahiere Weg- und Kraftwerte
-        distances = np.array([point[0] for point in measurement])
-        forces = np.array([point[1] for point in measurement])
-        
-        # Begrenze embedding_length auf die konfigurierte maximale Länge
-        embedding_length = min(embedding_length, max_allowed_length)
-        
-        # Beschränke auf Einbettlänge
-        mask = distances <= embedding_length
-        limited_distances = distances[mask]
-        limited_forces = forces[mask]
-        interval_works = []
-        
-        # Berechne Arbeit für jedes 10%-Intervall
-        for k in range(10):
-            start_percent = k * 10
-            end_percent = (k + 1) * 10
-            start_x = round(embedding_length * start_percent / 100, 4)
-            end_x = round(embedding_length * end_percent / 100, 4)
-            # Finde Werte im aktuellen Intervall
-            interval_mask = (start_x <= limited_distances) & (limited_distances <= end_x)
-            x_interval = limited_distances[interval_mask]
-            y_interval = limited_forces[interval_mask]
-            if len(x_interval) != len(y_interval):
-                print(f"Warnung: Ungleiche Längen im Intervall {k + 1}")
-                continue
-            if len(x_interval) > 0:  # Prüfe ob Daten im Intervall vorhanden
-                integral = np.trapezoid(y_interval, x_interval)
-                interval_works.append(round(integral, 3))
-            else:
-                interval_works.append(0.0)
-        return interval_works
-    
-    def calculate_all_work_intervals(self, max_allowed_length: float = None):
+        Arbeit bis zu jeder Intervallgrenze je Messung. Fehlen die laufenden
+        Integrale (z.B. bei von außen gesetzten Intervallen), werden sie aus den
+        Intervallarbeiten aufsummiert.
         """
-        Berechnet die Arbeitsintervalle für alle Messungen.
-
-        Args:
-            max_allowed_length: Maximale Einbetttiefe (µm), wenn None wird self.max_allowed_length verwendet
-        """
-        # Verwende die übergebene maximale Länge oder die Klassenvariable
-        if max_allowed_length is None:
-            max_allowed_length = self.max_allowed_length
-        
-        self.work_intervals = []  # Liste zurücksetzen
-        for measurement, embedding_length in zip(self.measurements_data, self.embeddinglengths):
-            try:
-                intervals = self.calculate_single_work_intervals(measurement, embedding_length, max_allowed_length)
-                self.work_intervals.append(intervals)
-            except Exception as e:
-                print(f"Fehler bei der Intervallberechnung: {e}")
-        self._update_mapping()  # Mapping aktualisieren
+        if len(self.cumulative_works) == len(self.work_intervals):
+            return self.cumulative_works
+        return [np.concatenate([[0.0], np.cumsum(intervals)]) for intervals in self.work_intervals]
 
     def calculate_normed_intervals(self):
-        """Normiert die Arbeitsintervalle durch Division durch die Gesamtarbeit."""
+        """
+        Normiert die Arbeitsintervalle durch Division durch die Gesamtarbeit.
+        Intervallanteile und kumulative Anteile stammen aus demselben laufenden Integral.
+        """
         self.normed_intervals = []
-        # Iteriere über Intervalle und Gesamtarbeiten
-        for intervals, total_work in zip(self.work_intervals, self.works):
+        self.cumulative_normed_works = []
+        # Iteriere über laufende Integrale und Gesamtarbeiten
+        for cumulative, total_work in zip(self._cumulative_interval_works(), self.works):
             if total_work != 0:  # Verhindere Division durch Null
-                normed_values = [round(interval / total_work, 4)
-                                 for interval in intervals]
-                self.normed_intervals.append(normed_values)
+                cumulative_normed = np.asarray(cumulative) / total_work
+                self.normed_intervals.append(np.round(np.diff(cumulative_normed), 4).tolist())
+                self.cumulative_normed_works.append(cumulative_normed[1:])
             else:
-                print("Warnung: Gesamtarbeit ist 0, überspringen dieser Messung")
+                self.logger.warning("Gesamtarbeit ist 0, überspringen dieser Messung")
         self._update_mapping()
 
     def calculate_interval_statistics(self):
         """Berechnet statistische Werte für die normierten Intervalle."""
         if not self.normed_intervals:
-            print("Keine normierten Intervalle vorhanden")
+            self.logger.warning("Keine normierten Intervalle vorhanden")
             return
-        # Für jede Intervallposition (0-9) über alle Messungen
-        n_intervals = len(self.normed_intervals[0])  # Sollte 10 sein
+        # Für jede Intervallposition über alle Messungen
+        n_intervals = len(self.normed_intervals[0])
         # Sammle Werte für jede Position
         interval_positions = [[] for _ in range(n_intervals)]
         for normed_measurement in self.normed_intervals:
@@ -410,34 +447,30 @@ class MeasurementAnalyzer:
     
     def get_cumulative_normed_work_statistics(self) -> dict:
         """
-        Berechnet die kumulativen statistischen Kennwerte der normierten Arbeit.
-        Nutzt die bestehenden Berechnungsmethoden für Mittelwert und Standardabweichung.
+        Berechnet die kumulativen statistischen Kennwerte der normierten Arbeit
+        aus den laufenden Integralen an den Intervallgrenzen.
 
         Returns:
-            Dictionary mit den kumulativen Werten für jede 10%-Position (10% bis 100%)
+            Dictionary mit den kumulativen Werten für jede Intervallgrenze (z.B. 10% bis 100%)
         """
         if not self.normed_intervals:
-            print("Keine normierten Intervalle vorhanden")
+            self.logger.warning("Keine normierten Intervalle vorhanden")
             return {}
+        if len(self.cumulative_normed_works) != len(self.normed_intervals):
+            self.calculate_normed_intervals()
         
-        statistics = {}
+        # Zeilen: Messungen, Spalten: Intervallgrenzen
+        cumulative = np.array(self.cumulative_normed_works)
+        means = np.mean(cumulative, axis=0)
+        stds = np.std(cumulative, axis=0)
+        n_intervals = cumulative.shape[1]
         
-        # Für jede Position (10% bis 100%) berechnen wir die kumulative Summe
-        for position in range(1, 11):  # 1 bis 10 für 10% bis 100%
-            # Sammle kumulative Summen bis zu dieser Position
-            cumulative_sums = []
-            for measurement in self.normed_intervals:
-                cum_sum = sum(measurement[:position])
-                cumulative_sums.append(cum_sum)
-            
-            # Berechne Statistiken mit den bestehenden Methoden
-            mean = np.mean(cumulative_sums)
-            std = np.std(cumulative_sums)
-            
-            position_key = f"{position * 10}%"
+        statistics = {}
+        for position in range(1, n_intervals + 1):
+            position_key = f"{position * 100 / n_intervals:g}%"
             statistics[position_key] = {
-                "mean": round(mean, 4),
-                "std": round(std, 4)
+                "mean": round(float(means[position - 1]), 4),
+                "std": round(float(stds[position - 1]), 4)
             }
         
         return statistics
@@ -450,10 +483,10 @@ class MeasurementAnalyzer:
             raise ValueError(f"Unbekannter Datentyp: {data_type}")
         data = self.data_mapping[data_type]
         if not data:
-            print("Warnung: Keine Daten in der Liste!")
+            self.logger.warning("Keine Daten in der Liste!")
             return 0.0
         result = float(np.mean(data))
-        print(f"Berechneter Mittelwert: {result}")
+        self.logger.debug(f"Berechneter Mittelwert ({data_type}): {result}")
         return result
 
     def calculate_stddev(self, data_type: str) -> float:
@@ -481,7 +514,7 @@ class MeasurementAnalyzer:
         data_array = data_array[~np.isnan(data_array)]
         
         if len(data_array) < 2:
-            print("Warnung: Zu wenige Datenpunkte für Z-Score Berechnung")
+            self.logger.warning("Zu wenige Datenpunkte für Z-Score Berechnung")
             return {
                 'z_scores': np.zeros_like(data_array),
                 'robust_z_scores': np.zeros_like(data_array),
@@ -541,8 +574,6 @@ class MeasurementAnalyzer:
         Args:
             max_allowed_length: Maximale Einbetttiefe (µm), wenn None wird self.max_allowed_length verwendet
         """
-        import math
-        
         # Verwende die übergebene maximale Länge oder die Klassenvariable
         if max_allowed_length is None:
             max_allowed_length = self.max_allowed_length
@@ -551,160 +582,33 @@ class MeasurementAnalyzer:
         
         # Überprüfen, ob alle benötigten Daten vorhanden sind
         if not self.works or not self.fiberdiameters or not self.embeddinglengths:
-            print("Warnung: Fehlende Daten für flächennormierte Arbeitsberechnung")
+            self.logger.warning("Fehlende Daten für flächennormierte Arbeitsberechnung")
             return
         
         # Überprüfen, ob alle Listen die gleiche Länge haben
         if len(self.works) != len(self.fiberdiameters) or len(self.works) != len(self.embeddinglengths):
-            print("Warnung: Ungleiche Längen der Datenlisten")
-            print(f"Arbeiten: {len(self.works)}, Durchmesser: {len(self.fiberdiameters)}, "
-                  f"Einbettlängen: {len(self.embeddinglengths)}")
+            self.logger.warning(f"Ungleiche Längen der Datenlisten - Arbeiten: {len(self.works)}, "
+                                f"Durchmesser: {len(self.fiberdiameters)}, Einbettlängen: {len(self.embeddinglengths)}")
             return
         
-        # Berechnung der flächennormierten Arbeit für jede Messung
-        for work, diameter, length in zip(self.works, self.fiberdiameters, self.embeddinglengths):
-            # Begrenze die Einbettlänge auf die maximale Länge
-            length = min(length, max_allowed_length)
-            
-            # Berechnung der Mantelfläche: PI * d * l_e
-            if diameter <= 0 or length <= 0:
-                print(f"Warnung: Ungültige Werte bei der Berechnung: d={diameter}, l_e={length}")
-                self.area_normalized_works.append(0.0)
-                continue
-            
-            surface_area = math.pi * diameter * length
-            
-            # Berechnung der flächennormierten Arbeit
-            area_norm_work = work / surface_area
-            
-            # Runden auf 4 Dezimalstellen und Speichern
-            self.area_normalized_works.append(round(area_norm_work, 4))
+        # Berechnung der flächennormierten Arbeit für alle Messungen gemeinsam: W / (PI * d * l_e)
+        self.area_normalized_works, invalid = series_area_normalized(
+            self.works, self.fiberdiameters, self.embeddinglengths, max_allowed_length)
+        for i in np.flatnonzero(invalid):
+            self.logger.warning(f"Ungültige Werte bei der Berechnung: d={self.fiberdiameters[i]}, "
+                                f"l_e={min(self.embeddinglengths[i], max_allowed_length)}")
         
-        print(f"\nFlächennormierte Arbeit berechnet: {len(self.area_normalized_works)} Werte")
+        self.logger.info(f"Flächennormierte Arbeit berechnet: {len(self.area_normalized_works)} Werte")
         if self.area_normalized_works:
             mean_value = self.calculate_mean('area_normalized_works')
             std_value = self.calculate_stddev('area_normalized_works')
-            print(f"Mittelwert: {mean_value:.4f} µJ/µm²")
-            print(f"Standardabweichung: {std_value:.4f} µJ/µm²")
+            self.logger.info(f"Mittelwert: {mean_value:.4f} µJ/µm², Standardabweichung: {std_value:.4f} µJ/µm²")
         
         # Mapping aktualisieren
         self._update_mapping()
         
         return self.area_normalized_works
     
-    def calculate_work_before_fmax(self, measurement: list[tuple[float, float]],
-                                   max_force_index: int) -> float:
-        """
-        Berechnet die Arbeit bis zum Erreichen der maximalen Kraft (F_max).
-
-        Args:
-            measurement: Liste von (distance, force) Tupeln einer Messung
-            max_force_index: Index des F_max-Punktes in der Messung
-
-        Returns:
-            float: Berechnete Arbeit bis F_max in µJ (Mikro-Joule)
-        """
-        if max_force_index <= 0:
-            return 0.0
-        
-        # Extrahiere Weg- und Kraftwerte bis zum F_max-Punkt
-        distances = [point[0] for point in measurement[:max_force_index + 1]]
-        forces = [point[1] for point in measurement[:max_force_index + 1]]
-        
-        # Konvertiere zu NumPy Arrays für effiziente Berechnung
-        distance_array = np.array(distances)
-        force_array = np.array(forces)
-        
-        # Berechne das Integral (Arbeit) bis zum F_max-Punkt
-        work = np.trapezoid(force_array, distance_array)
-        return round(work, 3)
-    
-    def calculate_work_after_fmax(self, measurement: list[tuple[float, float]],
-                                  max_force_index: int, embedding_length: float,
-                                  max_allowed_length: float = None) -> float:
-        """
-        Berechnet die Arbeit nach Erreichen der maximalen Kraft (F_max) bis zum Ende.
-
-        Args:
-            measurement: Liste von (distance, force) Tupeln einer Messung
-            max_force_index: Index des F_max-Punktes in der Messung
-            embedding_length: Maximale Einbettlänge für diese Messung
-            max_allowed_length: Konfigurierbare maximale Einbetttiefe (Optional)
-
-        Returns:
-            float: Berechnete Arbeit nach F_max in µJ (Mikro-Joule)
-        """
-        if max_force_index >= len(measurement) - 1:
-            return 0.0
-        
-        # Wenn keine maximale Länge angegeben wurde, verwende die Klassenvariable
-        if max_allowed_length is None:
-            max_allowed_length = self.max_allowed_length
-        
-        # Begrenze embedding_length auf die konfigurierte maximale Länge
-        embedding_length = min(embedding_length, max_allowed_length)
-        
-        # Extrahiere Weg- und Kraftwerte nach dem F_max-Punkt
-        distances = [point[0] for point in measurement[max_force_index:]]
-        forces = [point[1] for point in measurement[max_force_index:]]
-        
-        # Konvertiere zu NumPy Arrays für effiziente Berechnung
-        distance_array = np.array(distances)
-        force_array = np.array(forces)
-        
-        # Beschränke die Daten auf den Bereich bis zur Einbettlänge
-        mask = distance_array <= embedding_length
-        limited_distances = distance_array[mask]
-        limited_forces = force_array[mask]
-        
-        # Berechne das Integral (Arbeit) nach dem F_max-Punkt
-        work = np.trapezoid(limited_forces, limited_distances)
-        return round(work, 3)
-    
-    def calculate_all_work_segments(self, max_allowed_length: float = None):
-        """
-        Berechnet die Arbeiten vor und nach F_max für alle Messungen.
-        Speichert die Ergebnisse in self.work_before_fmax und self.work_after_fmax.
-
-        Args:
-            max_allowed_length: Maximale Einbetttiefe (µm), wenn None wird self.max_allowed_length verwendet
-        """
-        # Verwende die übergebene maximale Länge oder die Klassenvariable
-        if max_allowed_length is None:
-            max_allowed_length = self.max_allowed_length
-        
-        # Initialisiere die Listen für die Arbeitswerte
-        self.work_before_fmax = []
-        self.work_after_fmax = []
-        
-        if len(self.measurements_data) != len(self.embeddinglengths):
-            self.logger.error("Ungleiche Anzahl von Messungen und Einbettlängen")
-            return
-        
-        # Für jede Messung die Arbeiten vor und nach F_max berechnen
-        for i, (measurement, embedding_length) in enumerate(zip(self.measurements_data, self.embeddinglengths)):
-            try:
-                # Finde maximale Kraft und deren Index
-                max_point = max(measurement, key=lambda point: point[1])
-                max_force_index = measurement.index(max_point)
-                
-                # Berechne Arbeit bis zu F_max
-                work_before = self.calculate_work_before_fmax(measurement, max_force_index)
-                self.work_before_fmax.append(work_before)
-                
-                # Berechne Arbeit nach F_max
-                work_after = self.calculate_work_after_fmax(measurement, max_force_index, embedding_length,
-                                                            max_allowed_length)
-                self.work_after_fmax.append(work_after)
-            
-            except Exception as e:
-                self.logger.error(f"Fehler bei der Arbeitsberechnung für Messung {i}: {e}")
-                self.work_before_fmax.append(0.0)
-                self.work_after_fmax.append(0.0)
-        
-        # Aktualisiere das Mapping für statistische Berechnungen
-        self._update_mapping()
-    
     def calculate_area_normalized_work_segments(self, max_allowed_length: float = None):
         """
         Berechnet die flächennormierte Arbeit vor und nach F_max für jede Messung.
@@ -712,8 +616,6 @@ class MeasurementAnalyzer:
         Args:
             max_allowed_length: Maximale Einbetttiefe (µm), wenn None wird self.max_allowed_length verwendet
         """
-        import math
-        
         # Verwende die übergebene maximale Länge oder die Klassenvariable
         if max_allowed_length is None:
             max_allowed_length = self.max_allowed_length
@@ -737,29 +639,14 @@ class MeasurementAnalyzer:
                 f"Durchmesser: {len(self.fiberdiameters)}, Einbettlängen: {len(self.embeddinglengths)}")
             return
         
-        # Berechnung der flächennormierten Arbeit für jede Messung
-        for work_before, work_after, diameter, length in zip(
-                self.work_before_fmax, self.work_after_fmax, self.fiberdiameters, self.embeddinglengths):
-            
-            # Begrenze die Einbettlänge auf die maximale Länge
-            length = min(length, max_allowed_length)
-            
-            # Berechnung der Mantelfläche: PI * d * l_e
-            if diameter <= 0 or length <= 0:
-                self.logger.warning(f"Ungültige Werte bei der Berechnung: d={diameter}, l_e={length}")
-                self.area_normalized_before_fmax.append(0.0)
-                self.area_normalized_after_fmax.append(0.0)
-                continue
-            
-            surface_area = math.pi * diameter * length
-            
-            # Berechnung der flächennormierten Arbeit
-            area_norm_work_before = work_before / surface_area
-            area_norm_work_after = work_after / surface_area
-            
-            # Runden auf 4 Dezimalstellen und Speichern
-            self.area_normalized_before_fmax.append(round(area_norm_work_before, 4))
-            self.area_normalized_after_fmax.append(round(area_norm_work_after, 4))
+        # Berechnung der flächennormierten Arbeit für alle Messungen gemeinsam
+        self.area_normalized_before_fmax, invalid = series_area_normalized(
+            self.work_before_fmax, self.fiberdiameters, self.embeddinglengths, max_allowed_length)
+        self.area_normalized_after_fmax, _ = series_area_normalized(
+            self.work_after_fmax, self.fiberdiameters, self.embeddinglengths, max_allowed_length)
+        for i in np.flatnonzero(invalid):
+            self.logger.warning(f"Ungültige Werte bei der Berechnung: d={self.fiberdiameters[i]}, "
+                                f"l_e={min(self.embeddinglengths[i], max_allowed_length)}")
         
         self.logger.info(
             f"\nFlächennormierte Arbeit vor/nach F_max berechnet: {len(self.area_normalized_before_fmax)} Werte")
@@ -777,64 +664,58 @@ class MeasurementAnalyzer:
         # Mapping aktualisieren
         self._update_mapping()
     
+    def _log_moduli(self) -> None:
+        """Schreibt die Modulpunkte und den Verbundmodul je Messung aus self.curve_metrics ins Debug-Log."""
+        settings = self.modulus_settings
+        for i, metrics in enumerate(self.curve_metrics):
+            low_distance, low_force = metrics.modulus_point_low
+            high_distance, high_force = metrics.modulus_point_high
+            self.logger.debug(
+                f"Messung {i + 1}: F_max = {metrics.max_force:.2f} N, "
+                f"{settings.lower_fraction:.0%}: {low_force:.2f} N bei {low_distance:.2f} µm, "
+                f"{settings.upper_fraction:.0%}: {high_force:.2f} N bei {high_distance:.2f} µm, "
+                f"Verbundmodul ({settings.fit}): {metrics.force_modulus:.4f} N/µm")
+
     def calculate_force_modulus(self) -> None:
         """
         Berechnet den Verbundmodul (force_modulus) für alle Messungen.
 
-        Der Modul wird aus dem Anstieg zwischen 20% und 70% der Maximalkraft berechnet:
+        Der Modul wird aus dem Anstieg zwischen zwei Kraftniveaus vor F_max berechnet
+        (Standard: 20% und 70% der Maximalkraft, siehe self.modulus_settings):
         E_v = (F(70%) - F(20%)) / (s(70%) - s(20%))
 
-        Dabei werden die Messpunkte gesucht, die am nächsten an 20% bzw. 70%
-        der Maximalkraft liegen, um eine möglichst genaue Berechnung zu ermöglichen.
+        Dabei werden die Messpunkte gesucht, die am nächsten an den Kraftniveaus
+        liegen. Mit fit='lstsq' wird stattdessen die Ausgleichsgerade über alle
+        Punkte zwischen beiden Messpunkten verwendet. Alle Kurven der Messreihe
+        werden gemeinsam auf dem Spaltenspeicher berechnet (modulus_engine).
         """
-        self.force_moduli = []  # Liste zurücksetzen
+        settings = self.modulus_settings
+        result = compute_moduli(self.measurements_data, settings)
+        self.force_moduli = result.moduli.tolist()
 
-        for measurement in self.measurements_data:
-            try:
-                # Finde maximale Kraft und deren Index
-                max_point = max(measurement, key=lambda point: point[1])
-                max_force = max_point[1]
-                max_force_index = measurement.index(max_point)
-
-                # Berechne die exakten Zielwerte (20% und 70% von F_max)
-                target_20 = max_force * 0.2
-                target_70 = max_force * 0.7
-
-                # Betrachte nur Punkte bis zum Maximum
-                points_before_max = measurement[:max_force_index + 1]
-
-                # Finde die Punkte, die am nächsten an 20% und 70% liegen
-                point_20 = min(points_before_max,
-                               key=lambda p: abs(p[1] - target_20))
-                point_70 = min(points_before_max,
-                               key=lambda p: abs(p[1] - target_70))
-
-                # Debug-Ausgaben
-                print(f"Maximalkraft: {max_force:.2f} N")
-                print(f"Zielwerte: 20% = {target_20:.2f} N, 70% = {target_70:.2f} N")
-                print(f"Gefundene Punkte:")
-                print(f"  20%: Kraft = {point_20[1]:.2f} N, Weg = {point_20[0]:.2f} µm")
-                print(f"  70%: Kraft = {point_70[1]:.2f} N, Weg = {point_70[0]:.2f} µm")
-
-                # Prüfe, ob die Punkte in der richtigen Reihenfolge sind
-                if point_20[0] >= point_70[0]:
-                    print("Warnung: 20%-Punkt liegt nach 70%-Punkt - Messung übersprungen")
-                    self.force_moduli.append(0.0)
-                    continue
-
-                # Berechne den Verbundmodul
-                delta_force = point_70[1] - point_20[1]  # Kraftdifferenz in N
-                delta_distance = point_70[0] - point_20[0]  # Wegdifferenz in µm
-
-                modulus = delta_force / delta_distance  # Ergebnis in N/µm
-                self.force_moduli.append(round(modulus, 4))
-
-                print(f"Verbundmodul: {modulus:.4f} N/µm")
-                print("------------------------")
-
-            except Exception as e:
-                print(f"Fehler bei der Modulberechnung: {e}")
-                self.force_moduli.append(0.0)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for i, (distances, forces) in enumerate(self.measurements_data if debug else []):
+            low, high = int(result.index_low[i]), int(result.index_high[i])
+            if len(forces) == 0:
+                self.logger.debug(f"Messung {i + 1}: leere Kurve, Verbundmodul 0.0")
+                continue
+            self.logger.debug(
+                f"Messung {i + 1}: F_max = {forces[result.max_force_index[i]]:.2f} N, "
+                f"{settings.lower_fraction:.0%}: {forces[low]:.2f} N bei {distances[low]:.2f} µm, "
+                f"{settings.upper_fraction:.0%}: {forces[high]:.2f} N bei {distances[high]:.2f} µm, "
+                f"Verbundmodul ({settings.fit}): {self.force_moduli[i]:.4f} N/µm")
+            if not result.valid[i]:
+                self.logger.debug(f"Messung {i + 1}: unterer Punkt liegt nicht vor dem oberen - Modul 0.0")
+
+        # Kennwerte je Messung mit dem eingestellten Verfahren abgleichen
+        if len(self.curve_metrics) == len(self.measurements_data):
+            self.curve_metrics = [
+                replace(metrics, force_modulus=modulus,
+                        modulus_point_low=(float(distances[low]), float(forces[low])) if len(forces) else (0.0, 0.0),
+                        modulus_point_high=(float(distances[high]), float(forces[high])) if len(forces) else (0.0, 0.0))
+                for metrics, modulus, low, high, (distances, forces) in zip(
+                    self.curve_metrics, self.force_moduli, result.index_low, result.index_high,
+                    self.measurements_data)]
 
         # Aktualisiere das Mapping
         self._update_mapping()
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+directory_scanner.py - Verzeichnissuche mit os.scandir für große Messarchive
+
+Path.rglob und iterdir/is_dir fragen für jede Datei und jeden Ordner das
+Dateisystem einzeln ab; auf Netzlaufwerken bestimmen diese Aufrufe die Laufzeit.
+Der Scanner liest jeden Ordner mit einem einzigen os.scandir:
+
+- Datei/Ordner wird aus dem Verzeichniseintrag bestimmt (kein stat)
+- Größe und Änderungszeit der Messdateien kommen aus DirEntry.stat() (unter
+  Windows bereits im Eintrag enthalten, sonst ein stat je Datei, das im
+  DirEntry zwischengespeichert wird) und werden mit zurückgegeben, damit
+  nachfolgende Schritte (Ergebnis-Cache, Watch-Modus) nicht erneut stat aufrufen
+- Unterordner werden nebenläufig in Threads gelesen (asyncio, begrenzt durch
+  max_concurrency), die Einträge aber in derselben Reihenfolge geliefert wie
+  von rglob: Ordner in Tiefensuche, Dateien in Verzeichnisreihenfolge
+
+scan_specimen_entries liefert die Einträge als asynchronen Strom, sobald der
+jeweilige Ordner gelesen ist; scan_specimen_files sammelt sie für
+synchrone Aufrufer (FileHandler.find_specimen_files).
+"""
+
+# src/core/directory_scanner.py
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Iterator
+
+SPECIMEN_SUFFIX = '.txt'
+
+
+@dataclass(frozen=True)
+class SpecimenEntry:
+    """Gefundene Messdatei mit den Angaben aus dem Verzeichniseintrag"""
+    path: Path
+    name: str  # Dateiname ohne Endung (wie Path.stem)
+    size: int  # Dateigröße in Byte
+    mtime_ns: int  # Änderungszeit in ns
+
+    @property
+    def signature(self) -> tuple[int, int]:
+        """(Größe, Änderungszeit) zum Erkennen unveränderter Dateien"""
+        return self.size, self.mtime_ns
+
+
+def _matches(name: str, suffix: str) -> bool:
+    # Wie rglob: Groß-/Kleinschreibung nur unter Windows ignorieren
+    return os.path.normcase(name).endswith(suffix) and len(name) > len(suffix)
+
+
+def scan_directory(directory: Path, suffix: str = SPECIMEN_SUFFIX) -> tuple[list[SpecimenEntry], list[Path]]:
+    """
+    Liest einen Ordner mit einem os.scandir.
+
+    Returns:
+        (Messdateien, Unterordner) in Verzeichnisreihenfolge; verlinkte Ordner
+        werden wie bei rglob nicht betreten
+    """
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if _matches(entry.name, suffix) and not entry.is_dir():
+                        stat = entry.stat()
+                        files.append(SpecimenEntry(Path(entry.path), entry.name[:-len(suffix)],
+                                                   stat.st_size, stat.st_mtime_ns))
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(Path(entry.path))
+                except OSError:
+                    # Eintrag zwischen Auflisten und stat gelöscht oder nicht lesbar
+                    continue
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        pass
+    return files, subdirs
+
+
+def iter_specimen_entries(root: Path, suffix: str = SPECIMEN_SUFFIX) -> Iterator[SpecimenEntry]:
+    """Einträge nacheinander (ohne Threads), gleiche Reihenfolge wie scan_specimen_entries."""
+    stack = [Path(root)]
+    while stack:
+        files, subdirs = scan_directory(stack.pop(), suffix)
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+async def scan_specimen_entries(root: Path, suffix: str = SPECIMEN_SUFFIX,
+                                max_concurrency: int = 16) -> AsyncIterator[SpecimenEntry]:
+    """
+    Liefert die Messdateien unter root als asynchronen Strom.
+
+    Jeder Ordner wird in einem Thread gelesen, sobald sein Elternordner gelesen
+    ist; höchstens max_concurrency Ordner gleichzeitig. Die Einträge eines
+    Ordners werden geliefert, sobald er und alle vor ihm liegenden Ordner
+    gelesen sind.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def read(directory: Path) -> tuple[list[SpecimenEntry], list[Path]]:
+        async with semaphore:
+            return await asyncio.to_thread(scan_directory, directory, suffix)
+
+    def start(directories: Iterable[Path]) -> list[asyncio.Task]:
+        return [asyncio.ensure_future(read(directory)) for directory in directories]
+
+    stack = start([Path(root)])
+    try:
+        while stack:
+            files, subdirs = await stack.pop()
+            # Unterordner sofort anstoßen, ausgegeben wird trotzdem in Tiefensuche
+            stack.extend(reversed(start(subdirs)))
+            for entry in files:
+                yield entry
+    finally:
+        for task in stack:
+            task.cancel()
+
+
+def scan_specimen_files(root: Path, suffix: str = SPECIMEN_SUFFIX, max_concurrency: int = 16) -> list[SpecimenEntry]:
+    """
+    Alle Messdateien unter root in der Reihenfolge von root.rglob('*' + suffix).
+    Läuft bereits eine Ereignisschleife (z.B. im Notebook), wird nacheinander gesucht.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        async def collect() -> list[SpecimenEntry]:
+            return [entry async for entry in scan_specimen_entries(root, suffix, max_concurrency)]
+        return asyncio.run(collect())
+    return list(iter_specimen_entries(root, suffix))
+
+
+def scan_subfolders(parent: Path, ignore: Iterable[str] = ()) -> list[Path]:
+    """Unterordner von parent in Verzeichnisreihenfolge (wie iterdir), ohne stat je Eintrag."""
+    ignore = set(ignore)
+    with os.scandir(parent) as entries:
+        return [Path(entry.path) for entry in entries if entry.name not in ignore and entry.is_dir()]
@@ -0,0 +1,170 @@
+"""
+excel_streaming.py - Zeilenweises Schreiben von Tabellen in eine Excel-Datei
+
+Die Tabellen werden als ExportSheet (Blattname, DataFrame, mit/ohne Index)
+übergeben und Zeile für Zeile in die Arbeitsmappe geschrieben. Bevorzugt wird
+xlsxwriter im constant_memory-Modus, bei dem jede Zeile nach dem Schreiben auf
+die Festplatte ausgelagert wird. Ist xlsxwriter nicht installiert, wird
+openpyxl im write_only-Modus verwendet. Das Layout entspricht DataFrame.to_excel:
+fette Kopfzeile und Indexspalte, NaN als leere Zelle.
+"""
+
+# src/core/excel_streaming.py
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import math
+import pandas as pd
+
+STREAMING_ENGINES = ('xlsxwriter', 'openpyxl')
+# Maximale Länge eines Blattnamens in Excel
+MAX_SHEET_NAME = 31
+
+
+@dataclass
+class ExportSheet:
+    """Eine Tabelle für ein Excel-Blatt"""
+    name: str
+    frame: pd.DataFrame
+    index: bool = True  # Index als erste Spalte schreiben (wie DataFrame.to_excel)
+
+
+def available_engine(engine: Optional[str] = None) -> str:
+    """
+    Wählt die Streaming-Engine: die gewünschte oder die erste installierte.
+
+    Raises:
+        ImportError: Wenn keine der Engines installiert ist
+    """
+    candidates = [engine] if engine else list(STREAMING_ENGINES)
+    for name in candidates:
+        if name not in STREAMING_ENGINES:
+            raise ValueError(f"Unbekannte Excel-Engine: {name} (erlaubt: {', '.join(STREAMING_ENGINES)})")
+        try:
+            __import__(name)
+            return name
+        except ImportError:
+            continue
+    raise ImportError(f"Für den Streaming-Export wird eines der Pakete benötigt: {', '.join(candidates)}")
+
+
+def unique_sheet_name(name: str, prefix: str, used: set) -> str:
+    """Kürzt den Blattnamen auf 31 Zeichen und stellt bei Kollisionen das Präfix voran."""
+    candidate = name[:MAX_SHEET_NAME]
+    if candidate in used:
+        candidate = f"{prefix} {name}"[:MAX_SHEET_NAME]
+    counter = 2
+    base = candidate
+    while candidate in used:
+        suffix = f" ({counter})"
+        candidate = base[:MAX_SHEET_NAME - len(suffix)] + suffix
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+def _cell_value(value):
+    """Wandelt einen Tabellenwert in einen Excel-Wert um (None = leere Zelle)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if math.isnan(number):
+        return None
+    if math.isinf(number):
+        # Wie pandas: Unendlich als Text
+        return 'inf' if number > 0 else '-inf'
+    return number
+
+
+def _rows(sheet: ExportSheet):
+    """Liefert Kopfzeile und Datenzeilen; die erste Zelle jeder Datenzeile ist ggf. der Index."""
+    frame = sheet.frame
+    header = [str(column) for column in frame.columns]
+    if sheet.index:
+        header = [frame.index.name or ''] + header
+    yield header
+    for row in frame.itertuples(index=sheet.index, name=None):
+        yield [_cell_value(value) for value in row]
+
+
+def _write_xlsxwriter(path: Path, sheets: list[ExportSheet]) -> None:
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(str(path), {'constant_memory': True})
+    try:
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        index_format = workbook.add_format({'bold': True, 'border': 1, 'valign': 'top'})
+        for sheet in sheets:
+            worksheet = workbook.add_worksheet(sheet.name)
+            rows = _rows(sheet)
+            for col, title in enumerate(next(rows)):
+                if title:
+                    worksheet.write_string(0, col, title, header_format)
+            # constant_memory verlangt strikt aufsteigende Zeilen
+            for row_nr, row in enumerate(rows, start=1):
+                for col, value in enumerate(row):
+                    if value is None:
+                        continue
+                    cell_format = index_format if sheet.index and col == 0 else None
+                    if isinstance(value, str):
+                        worksheet.write_string(row_nr, col, value, cell_format)
+                    else:
+                        worksheet.write_number(row_nr, col, value, cell_format)
+    finally:
+        workbook.close()
+
+
+def _write_openpyxl(path: Path, sheets: list[ExportSheet]) -> None:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    workbook = Workbook(write_only=True)
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    bold = Font(bold=True)
+
+    for sheet in sheets:
+        worksheet = workbook.create_sheet(sheet.name)
+
+        def styled(value, align):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.font = bold
+            cell.border = border
+            cell.alignment = align
+            return cell
+
+        rows = _rows(sheet)
+        header_align = Alignment(horizontal='center', vertical='top')
+        index_align = Alignment(vertical='top')
+        worksheet.append([styled(title, header_align) if title else None for title in next(rows)])
+        for row in rows:
+            if sheet.index and row[0] is not None:
+                row[0] = styled(row[0], index_align)
+            worksheet.append(row)
+    workbook.save(path)
+
+
+def write_workbook_streaming(path: Path, sheets: list[ExportSheet], engine: Optional[str] = None) -> Path:
+    """
+    Schreibt alle Tabellen zeilenweise in eine Arbeitsmappe.
+
+    Args:
+        path: Zieldatei (.xlsx)
+        sheets: Tabellen in Blattreihenfolge, Blattnamen müssen eindeutig sein
+        engine: 'xlsxwriter', 'openpyxl' oder None (erste installierte)
+
+    Returns:
+        Pfad der geschriebenen Datei
+    """
+    engine = available_engine(engine)
+    if engine == 'xlsxwriter':
+        _write_xlsxwriter(path, sheets)
+    else:
+        _write_openpyxl(path, sheets)
+    return path
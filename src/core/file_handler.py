@@ -3,10 +3,9 @@ this code was made with the help of chatgpt, claude, stackoverflow .... u name i
 """
 # src/core/file_handler.py
 from pathlib import Path
-from tkinter import filedialog
-import tkinter as tk
 from typing import Optional
-from src.config.settings import naming_storage
+from src.config.settings import naming_storage, NamingInTheNameOf
+from src.core.directory_scanner import scan_specimen_files, scan_subfolders
 
 
 class FileHandler:
@@ -17,6 +16,8 @@ class FileHandler:
     @staticmethod
     def select_analysis_type() -> str:
         """Zeigt ein Fenster zur Auswahl des Analysetyps"""
+        # tkinter erst bei Bedarf laden, damit der Batch-Betrieb ohne GUI auskommt
+        import tkinter as tk
         root = tk.Tk()
         root.title("SFPO Analyzer - Analysetyp wählen")
         # Fenster in den Vordergrund
@@ -51,6 +52,8 @@ class FileHandler:
 
     @staticmethod
     def select_folder(analysis_type: str = '1') -> Optional[Path]:
+        import tkinter as tk
+        from tkinter import filedialog
         root = tk.Tk()
         root.withdraw()  # Hauptfenster verstecken aber initialisieren
 
@@ -80,20 +83,24 @@ class FileHandler:
         # Ignoriere spezielle Ordner wie 'plots', 'zscore_plots-auswertung' etc.
         ignore_folders = {'plots', 'zscore_plots-auswertung', 'box_plots-auswertung',
                           'violin_plots-auswertung'}
-        return [f for f in parent_folder.iterdir()
-                if f.is_dir() and f.name not in ignore_folders]
+        return scan_subfolders(parent_folder, ignore_folders)
 
     @staticmethod
-    def find_specimen_files() -> list[str]:
-        """find the .txt files"""
-        if not naming_storage.root_path:
+    def find_specimen_files(naming: NamingInTheNameOf = None) -> list[str]:
+        """
+        find the .txt files (in the given naming state, default: global naming_storage)
+        in rglob order; size and mtime of each file are kept in naming.file_entries
+        """
+        if naming is None:
+            naming = naming_storage
+        if not naming.root_path:
             raise ValueError("no folder selected")
 
-        specimen_files = []
-        for file_path in naming_storage.root_path.rglob("*.txt"):
-            specimen_files.append(file_path.stem)
+        entries = scan_specimen_files(naming.root_path)
+        specimen_files = [entry.name for entry in entries]
 
-        naming_storage.filenames = specimen_files
+        naming.filenames = specimen_files
+        naming.file_entries = {entry.path: entry for entry in entries}
         return specimen_files
     
     @staticmethod
@@ -105,6 +112,7 @@ class FileHandler:
         Returns:
             dict: Dictionary mit den ausgewählten Optionen
         """
+        import tkinter as tk
         # Erstelle das Hauptfenster
         root = tk.Tk()
         root.title("SFPO Analyzer - Analyseoptionen")
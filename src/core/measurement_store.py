@@ -0,0 +1,94 @@
+"""
+measurement_store.py - Spaltenorientierter Speicher für Kraft-Weg-Kurven
+
+Alle Messungen einer Messreihe liegen hintereinander in zwei zusammenhängenden
+float64-Arrays (Weg und Kraft). Ein Offset-Index legt fest, welcher Abschnitt
+zu welcher Probe gehört. Einzelne Kurven werden als Views ohne Kopie herausgegeben.
+"""
+
+# src/core/measurement_store.py
+from typing import Iterable, Iterator, NamedTuple
+import numpy as np
+
+
+class Curve(NamedTuple):
+    """Eine einzelne Kraft-Weg-Kurve als Paar von Array-Views."""
+    displacement: np.ndarray  # Weg in µm
+    force: np.ndarray  # Kraft in N
+
+
+class MeasurementStore:
+    """
+    Spaltenorientierter Container für alle Kraft-Weg-Kurven einer Messreihe.
+
+    displacement und force enthalten die Messpunkte aller Proben hintereinander,
+    offsets hat die Länge n_proben + 1. Kurve i liegt im Bereich
+    offsets[i]:offsets[i + 1].
+    """
+
+    def __init__(self, displacement: np.ndarray = None, force: np.ndarray = None,
+                 offsets: np.ndarray = None):
+        self.displacement = np.ascontiguousarray(
+            displacement if displacement is not None else np.empty(0), dtype=np.float64)
+        self.force = np.ascontiguousarray(
+            force if force is not None else np.empty(0), dtype=np.float64)
+        self.offsets = np.ascontiguousarray(
+            offsets if offsets is not None else np.zeros(1), dtype=np.int64)
+
+        if len(self.displacement) != len(self.force):
+            raise ValueError("Ungleiche Anzahl von Weg- und Kraftwerten")
+        if self.offsets[0] != 0 or self.offsets[-1] != len(self.force):
+            raise ValueError("Offset-Index passt nicht zu den Messdaten")
+
+    @classmethod
+    def from_curves(cls, curves: Iterable[tuple[np.ndarray, np.ndarray]]) -> 'MeasurementStore':
+        """Baut den Speicher aus einer Folge von (Weg, Kraft)-Arrays auf."""
+        displacements = []
+        forces = []
+        lengths = [0]
+        for displacement, force in curves:
+            displacements.append(np.asarray(displacement, dtype=np.float64))
+            forces.append(np.asarray(force, dtype=np.float64))
+            lengths.append(len(displacements[-1]))
+
+        if not displacements:
+            return cls()
+        return cls(np.concatenate(displacements), np.concatenate(forces), np.cumsum(lengths))
+
+    def append(self, displacement: np.ndarray, force: np.ndarray) -> None:
+        """Hängt eine einzelne Kurve an (kopiert die bestehenden Arrays)."""
+        displacement = np.asarray(displacement, dtype=np.float64)
+        force = np.asarray(force, dtype=np.float64)
+        if len(displacement) != len(force):
+            raise ValueError("Ungleiche Anzahl von Weg- und Kraftwerten")
+        self.displacement = np.concatenate([self.displacement, displacement])
+        self.force = np.concatenate([self.force, force])
+        self.offsets = np.append(self.offsets, self.offsets[-1] + len(force))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Anzahl der Messpunkte pro Kurve."""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Belegter Speicher der Arrays in Byte."""
+        return self.displacement.nbytes + self.force.nbytes + self.offsets.nbytes
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: int) -> Curve:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Messung {index} existiert nicht")
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return Curve(self.displacement[start:end], self.force[start:end])
+
+    def __iter__(self) -> Iterator[Curve]:
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,180 @@
+"""
+metric_kernels.py - Array-Kernels für die Kennwerte einer Kraft-Weg-Kurve
+
+Die Kernels arbeiten direkt auf den (displacement, force) Arrays aus dem
+MeasurementStore. compute_curve_metrics berechnet alle Kennwerte einer Kurve
+in einem Durchlauf und liefert exakt die Werte der früheren Einzelmethoden von
+MeasurementAnalyzer (np.trapezoid je Kennwert, siehe tests/test_metric_kernels.py).
+"""
+
+# src/core/metric_kernels.py
+from dataclasses import dataclass, field
+import numpy as np
+
+
+@dataclass
+class CurveMetrics:
+    """Alle Kennwerte einer einzelnen Messung"""
+    max_force: float  # F_max in N
+    max_force_index: int  # Index von F_max in der Kurve
+    embedding_length: float  # Einbettlänge in µm
+    work: float  # Gesamtarbeit in µJ
+    work_before_fmax: float  # Arbeit bis F_max in µJ
+    work_after_fmax: float  # Arbeit nach F_max in µJ
+    work_intervals: list[float] = field(default_factory=list)  # Arbeit je Intervall in µJ
+    cumulative_work: list[float] = field(default_factory=list)  # Arbeit bis zu jeder Intervallgrenze in µJ
+    modulus_point_low: tuple[float, float] = (0.0, 0.0)  # (Weg, Kraft) bei 20% F_max
+    modulus_point_high: tuple[float, float] = (0.0, 0.0)  # (Weg, Kraft) bei 70% F_max
+    force_modulus: float = 0.0  # Verbundmodul in N/µm
+
+
+def _trapezoid_segments(distances: np.ndarray, forces: np.ndarray) -> np.ndarray:
+    """
+    Flächen der einzelnen Trapeze zwischen benachbarten Messpunkten.
+    Gleiche Rechenreihenfolge wie np.trapezoid, damit Teilsummen bitgenau übereinstimmen.
+    """
+    return np.diff(distances) * (forces[1:] + forces[:-1]) / 2.0
+
+
+def compute_curve_metrics(distances: np.ndarray, forces: np.ndarray,
+                          max_allowed_length: float, n_intervals: int = 10) -> CurveMetrics:
+    """
+    Berechnet F_max, Einbettlänge, Arbeit, Arbeit vor/nach F_max, Intervallarbeiten
+    und die Punkte für den Verbundmodul einer Kurve in einem Durchlauf.
+
+    Args:
+        distances: Wegwerte der Messung in µm
+        forces: Kraftwerte der Messung in N
+        max_allowed_length: Maximale Einbetttiefe in µm
+        n_intervals: Anzahl gleich breiter Intervalle für die Arbeitsaufteilung
+
+    Returns:
+        CurveMetrics mit allen Kennwerten der Messung
+    """
+    if len(forces) == 0:
+        raise ValueError("Leere Messung - keine Kennwerte berechenbar")
+
+    # F_max und Einbettlänge
+    max_force_index = int(np.argmax(forces))
+    max_force = float(forces[max_force_index])
+    embedding_length = min(float(np.max(distances)), max_allowed_length)
+
+    # Trapezflächen der gesamten Kurve nur einmal berechnen
+    segments = _trapezoid_segments(distances, forces)
+    mask = distances <= embedding_length
+    all_inside = bool(mask.all())
+
+    # Gesamtarbeit bis zur Einbettlänge
+    if all_inside:
+        limited_distances, limited_forces, limited_segments = distances, forces, segments
+    else:
+        limited_distances, limited_forces = distances[mask], forces[mask]
+        limited_segments = _trapezoid_segments(limited_distances, limited_forces)
+    work = round(limited_segments.sum(), 3)
+
+    # Arbeit bis F_max
+    if max_force_index <= 0:
+        work_before = 0.0
+    else:
+        work_before = round(segments[:max_force_index].sum(), 3)
+
+    # Arbeit nach F_max bis zur Einbettlänge
+    if max_force_index >= len(forces) - 1:
+        work_after = 0.0
+    elif all_inside:
+        work_after = round(segments[max_force_index:].sum(), 3)
+    else:
+        after_mask = mask[max_force_index:]
+        work_after = round(np.trapezoid(forces[max_force_index:][after_mask],
+                                        distances[max_force_index:][after_mask]), 3)
+
+    cumulative = work_at_positions(limited_distances, limited_forces,
+                                   cumulative_trapezoid(limited_segments),
+                                   interval_bounds(embedding_length, n_intervals))
+    work_intervals = [round(value, 3) for value in np.diff(cumulative).tolist()]
+
+    # Punkte bei 20% und 70% von F_max vor dem Maximum
+    forces_before_max = forces[:max_force_index + 1]
+    index_low = int(np.argmin(np.abs(forces_before_max - max_force * 0.2)))
+    index_high = int(np.argmin(np.abs(forces_before_max - max_force * 0.7)))
+    point_low = (float(distances[index_low]), float(forces[index_low]))
+    point_high = (float(distances[index_high]), float(forces[index_high]))
+
+    # Verbundmodul, 0.0 wenn der 20%-Punkt nicht vor dem 70%-Punkt liegt
+    if point_low[0] >= point_high[0]:
+        force_modulus = 0.0
+    else:
+        force_modulus = round((point_high[1] - point_low[1]) / (point_high[0] - point_low[0]), 4)
+
+    return CurveMetrics(
+        max_force=max_force,
+        max_force_index=max_force_index,
+        embedding_length=embedding_length,
+        work=work,
+        work_before_fmax=work_before,
+        work_after_fmax=work_after,
+        work_intervals=work_intervals,
+        cumulative_work=cumulative.tolist(),
+        modulus_point_low=point_low,
+        modulus_point_high=point_high,
+        force_modulus=force_modulus
+    )
+
+
+def interval_bounds(embedding_length: float, n_intervals: int) -> np.ndarray:
+    """Grenzen von n_intervals gleich breiten Intervallen zwischen 0 und der Einbettlänge."""
+    if n_intervals < 1:
+        raise ValueError(f"Anzahl der Intervalle muss positiv sein: {n_intervals}")
+    return np.linspace(0.0, embedding_length, n_intervals + 1)
+
+
+def cumulative_trapezoid(segments: np.ndarray) -> np.ndarray:
+    """Laufendes Trapezintegral: Arbeit bis zu jedem Messpunkt (erster Wert 0)."""
+    cumulative = np.empty(len(segments) + 1)
+    cumulative[0] = 0.0
+    np.cumsum(segments, out=cumulative[1:])
+    return cumulative
+
+
+def work_at_positions(distances: np.ndarray, forces: np.ndarray, cumulative: np.ndarray,
+                      positions: np.ndarray) -> np.ndarray:
+    """
+    Arbeit bis zu den Wegpositionen aus dem laufenden Trapezintegral.
+
+    Für jede Position wird der Messabschnitt gesucht, in dem der Weg die Position
+    erstmals erreicht. Die Kraft an der Position wird linear interpoliert und das
+    Teiltrapez bis dorthin addiert. Das entspricht dem Trapezintegral mit einem
+    zusätzlichen Messpunkt an der Grenze, Abschnitte zwischen zwei Intervallen
+    gehen also nicht verloren. Aufwand O(n) für das Integral und O(k log n) für
+    k Positionen; bei nicht monotonem Weg zählt das erste Erreichen.
+
+    Args:
+        distances, forces: Kurve in Aufnahmereihenfolge
+        cumulative: cumulative_trapezoid der Kurve
+        positions: Aufsteigende Wegpositionen in µm
+
+    Returns:
+        Arbeit in µJ bis zu jeder Position
+    """
+    positions = np.asarray(positions, dtype=float)
+    if len(distances) < 2:
+        return np.zeros(len(positions))
+
+    # Bisher erreichter Weg; für monotone Kurven identisch mit distances
+    reached = np.maximum.accumulate(distances)
+    # Erster Punkt, an dem die Position erreicht ist (0: vor dem Kurvenbeginn, n: nie erreicht)
+    found = np.searchsorted(reached, positions, side='left')
+    inside = (found > 0) & (found < len(distances))
+    start = np.where(inside, found - 1, 0)
+    end = np.where(inside, found, 0)
+
+    x0, x1 = distances[start], distances[end]
+    f0, f1 = forces[start], forces[end]
+    width = x1 - x0
+    fraction = np.divide(positions - x0, width, out=np.zeros(len(positions)), where=width > 0)
+    partial = (positions - x0) * (f0 + (f0 + fraction * (f1 - f0))) / 2.0
+
+    work = np.where(inside, cumulative[start] + partial, 0.0)
+    # Positionen hinter dem größten Weg: Arbeit bis zu dessen erstem Erreichen
+    work[found >= len(distances)] = cumulative[int(np.argmax(distances))]
+    return work
@@ -0,0 +1,139 @@
+"""
+modulus_engine.py - Verbundmodul aller Kurven einer Messreihe in einem Durchlauf
+
+Der Verbundmodul ist der Anstieg der Kraft-Weg-Kurve vor F_max zwischen zwei
+Kraftniveaus (Standard: 20% und 70% von F_max). Gesucht werden jeweils die
+Messpunkte vor dem Maximum, deren Kraft dem Niveau am nächsten liegt.
+
+Die Berechnung arbeitet auf den flachen Arrays des MeasurementStore: Maxima,
+nächstgelegene Punkte und Fensterregression werden per ufunc.reduceat für alle
+Kurven gleichzeitig bestimmt, ohne Python-Schleife über die Proben.
+
+- 'secant': Sekante zwischen den beiden Punkten (bisheriges Verfahren)
+- 'lstsq': Ausgleichsgerade (kleinste Quadrate) über alle Punkte im Fenster
+"""
+
+# src/core/modulus_engine.py
+from dataclasses import dataclass
+import numpy as np
+from src.core.measurement_store import MeasurementStore
+
+MODULUS_FITS = ('secant', 'lstsq')
+
+
+@dataclass(frozen=True)
+class ModulusSettings:
+    """Parameter der Modulberechnung"""
+    lower_fraction: float = 0.2  # Unteres Kraftniveau als Anteil von F_max
+    upper_fraction: float = 0.7  # Oberes Kraftniveau als Anteil von F_max
+    fit: str = 'secant'  # 'secant' oder 'lstsq'
+
+    def __post_init__(self):
+        if not 0.0 <= self.lower_fraction < self.upper_fraction <= 1.0:
+            raise ValueError(f"Ungültiges Modulfenster: {self.lower_fraction} - {self.upper_fraction} "
+                             f"(erwartet 0 <= unten < oben <= 1)")
+        if self.fit not in MODULUS_FITS:
+            raise ValueError(f"Unbekanntes Modulverfahren: {self.fit} (erlaubt: {', '.join(MODULUS_FITS)})")
+
+
+@dataclass
+class ModulusResult:
+    """Ergebnisse je Kurve (Indizes relativ zum Kurvenanfang)"""
+    moduli: np.ndarray  # Verbundmodul in N/µm, 0.0 wenn nicht bestimmbar
+    max_force_index: np.ndarray
+    index_low: np.ndarray
+    index_high: np.ndarray
+    valid: np.ndarray  # False: unterer Punkt liegt nicht vor dem oberen (Modul 0.0)
+
+
+def first_position(mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Erste Position je Kurve, an der mask gilt (jede Kurve muss mindestens eine haben)."""
+    hits = np.flatnonzero(mask)
+    return hits[np.searchsorted(hits, starts)]
+
+
+def _nearest(force: np.ndarray, starts: np.ndarray, lengths: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Erster Punkt je Abschnitt mit minimalem Abstand zur Zielkraft (wie np.argmin)."""
+    distance = np.abs(force - np.repeat(targets, lengths))
+    best = np.minimum.reduceat(distance, starts)
+    return first_position(distance == np.repeat(best, lengths), starts)
+
+
+def compute_moduli(store: MeasurementStore, settings: ModulusSettings = ModulusSettings()) -> ModulusResult:
+    """
+    Berechnet den Verbundmodul aller Kurven einer Messreihe.
+
+    Args:
+        store: Kurven der Messreihe (leere Kurven erhalten Modul 0.0)
+        settings: Kraftniveaus und Verfahren
+
+    Returns:
+        ModulusResult mit einem Eintrag je Kurve
+    """
+    n_curves = len(store)
+    lengths_all = store.lengths
+    filled = lengths_all > 0
+    moduli = np.zeros(n_curves)
+    max_index = np.zeros(n_curves, dtype=np.int64)
+    index_low = np.zeros(n_curves, dtype=np.int64)
+    index_high = np.zeros(n_curves, dtype=np.int64)
+    valid = np.zeros(n_curves, dtype=bool)
+    if not filled.any():
+        return ModulusResult(moduli, max_index, index_low, index_high, valid)
+
+    starts = store.offsets[:-1][filled]
+    lengths = lengths_all[filled]
+
+    # F_max und dessen erste Position je Kurve (einziger Durchlauf über die ganzen Kurven)
+    max_force = np.maximum.reduceat(store.force, starts)
+    peak = first_position(store.force == np.repeat(max_force, lengths), starts)
+
+    # Weiter nur mit den Abschnitten bis F_max, zusammengezogen zu neuen flachen Arrays
+    pre_lengths = peak - starts + 1
+    pre_starts = np.concatenate([[0], np.cumsum(pre_lengths)[:-1]])
+    gather = np.arange(int(pre_lengths.sum())) + np.repeat(starts - pre_starts, pre_lengths)
+    displacement, force = store.displacement[gather], store.force[gather]
+
+    low = _nearest(force, pre_starts, pre_lengths, settings.lower_fraction * max_force)
+    high = _nearest(force, pre_starts, pre_lengths, settings.upper_fraction * max_force)
+    ordered = displacement[low] < displacement[high]
+
+    if settings.fit == 'secant':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (force[high] - force[low]) / (displacement[high] - displacement[low])
+    else:
+        # Regression über alle Punkte low..high je Kurve, Weg auf den unteren Punkt zentriert
+        position = np.arange(len(force))
+        window = (position >= np.repeat(low, pre_lengths)) & (position <= np.repeat(high, pre_lengths))
+        x = np.where(window, displacement - np.repeat(displacement[low], pre_lengths), 0.0)
+        y = np.where(window, force, 0.0)
+        count = np.add.reduceat(window.astype(np.float64), pre_starts)
+        sum_x = np.add.reduceat(x, pre_starts)
+        sum_y = np.add.reduceat(y, pre_starts)
+        sum_xx = np.add.reduceat(x * x, pre_starts)
+        sum_xy = np.add.reduceat(x * y, pre_starts)
+        denominator = count * sum_xx - sum_x * sum_x
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (count * sum_xy - sum_x * sum_y) / denominator
+        ordered &= (count >= 2) & (denominator > 0)
+
+    # Runden wie bisher mit round() je Wert
+    moduli[filled] = [round(float(value), 4) if ok else 0.0 for value, ok in zip(slope, ordered)]
+    max_index[filled] = peak - starts
+    index_low[filled] = low - pre_starts
+    index_high[filled] = high - pre_starts
+    valid[filled] = ordered
+    return ModulusResult(moduli, max_index, index_low, index_high, valid)
+
+
+def curve_modulus(distances: np.ndarray, forces: np.ndarray,
+                  settings: ModulusSettings = ModulusSettings()) -> tuple[float, int, int]:
+    """
+    Verbundmodul einer einzelnen Kurve.
+
+    Returns:
+        (Modul in N/µm, Index unterer Punkt, Index oberer Punkt)
+    """
+    store = MeasurementStore(distances, forces, np.array([0, len(forces)]))
+    result = compute_moduli(store, settings)
+    return float(result.moduli[0]), int(result.index_low[0]), int(result.index_high[0])
@@ -0,0 +1,161 @@
+"""
+numba_kernels.py - Kompilierte Kennwert-Kernels (optional, benötigt numba)
+
+Alternative zu den NumPy-Kernels in batch_kernels.py: jede Kurve wird in
+einer kompilierten Schleife in einem einzigen Durchlauf ausgewertet, die
+Kurven einer Messreihe laufen mit prange parallel. Zwischenergebnisse über
+die ganze Messreihe (Schlüssel, Masken, Teilsummen) entfallen.
+
+Das Modul wird nur über batch_kernels.resolve_kernel_backend geladen; ohne
+installiertes numba schlägt der Import fehl und es wird NumPy verwendet.
+Die kompilierten Funktionen werden im __pycache__ zwischengespeichert
+(cache=True), spätere Läufe sparen die Übersetzungszeit. Die Anzahl der
+Threads je Prozess lässt sich mit NUMBA_NUM_THREADS begrenzen, z.B. wenn
+mehrere Messreihen parallel im Prozess-Pool ausgewertet werden.
+
+Laufende Integrale werden wie np.cumsum der Reihe nach summiert und stimmen
+mit compute_curve_metrics bitgenau überein; Gesamtsummen (dort paarweise mit
+np.sum) bis auf die Rundung der Gleitkommaaddition.
+"""
+
+# src/core/numba_kernels.py
+import numpy as np
+from numba import njit, prange
+from src.core.batch_kernels import SeriesArrays
+from src.core.measurement_store import MeasurementStore
+from src.core.modulus_engine import ModulusSettings, ModulusResult, compute_moduli as compute_moduli_numpy
+
+
+@njit(parallel=True, cache=True)
+def _series_kernel(displacement, force, offsets, max_allowed_length, n_intervals, max_force_index,
+                   embedding_length, work, work_before, work_after, cumulative_work, all_inside):
+    for curve in prange(len(offsets) - 1):
+        start = offsets[curve]
+        end = offsets[curve + 1]
+
+        # F_max und größter Weg, jeweils erstes Auftreten
+        peak = start
+        reach = start
+        for k in range(start + 1, end):
+            if force[k] > force[peak]:
+                peak = k
+            if displacement[k] > displacement[reach]:
+                reach = k
+        length = min(displacement[reach], max_allowed_length)
+        inside = True
+        for k in range(start, end):
+            if displacement[k] > length:
+                inside = False
+                break
+
+        # Laufendes Trapezintegral, Arbeit nach F_max getrennt summiert
+        running = np.empty(end - start)
+        running[0] = 0.0
+        after = 0.0
+        for k in range(start + 1, end):
+            segment = (displacement[k] - displacement[k - 1]) * (force[k] + force[k - 1]) / 2.0
+            running[k - start] = running[k - start - 1] + segment
+            if k > peak:
+                after += segment
+
+        # Intervallgrenzen aufsteigend: erster Punkt, an dem der bisher erreichte Weg die Grenze erreicht
+        step = length / n_intervals
+        position = start
+        reached = displacement[start]
+        for j in range(n_intervals + 1):
+            bound = j * step if j < n_intervals else length
+            while position < end and reached < bound:
+                position += 1
+                if position < end and displacement[position] > reached:
+                    reached = displacement[position]
+            if position == start:
+                value = 0.0
+            elif position == end:
+                # Grenze hinter dem größten Weg: Arbeit bis zu dessen erstem Erreichen
+                value = running[reach - start]
+            else:
+                x0 = displacement[position - 1]
+                f0 = force[position - 1]
+                width = displacement[position] - x0
+                fraction = (bound - x0) / width if width > 0 else 0.0
+                value = running[position - 1 - start] + (bound - x0) * (
+                    f0 + (f0 + fraction * (force[position] - f0))) / 2.0
+            cumulative_work[curve, j] = value
+
+        max_force_index[curve] = peak - start
+        embedding_length[curve] = length
+        work[curve] = running[end - start - 1]
+        work_before[curve] = running[peak - start]
+        work_after[curve] = after
+        all_inside[curve] = inside
+
+
+@njit(parallel=True, cache=True)
+def _secant_kernel(displacement, force, offsets, lower_fraction, upper_fraction,
+                   slopes, max_force_index, index_low, index_high, valid):
+    for curve in prange(len(offsets) - 1):
+        start = offsets[curve]
+        end = offsets[curve + 1]
+        if end > start:
+            peak = start
+            for k in range(start + 1, end):
+                if force[k] > force[peak]:
+                    peak = k
+
+            # Nächstgelegene Punkte zu beiden Kraftniveaus vor F_max (erstes Auftreten wie np.argmin)
+            low_target = lower_fraction * force[peak]
+            high_target = upper_fraction * force[peak]
+            low = start
+            high = start
+            for k in range(start + 1, peak + 1):
+                if abs(force[k] - low_target) < abs(force[low] - low_target):
+                    low = k
+                if abs(force[k] - high_target) < abs(force[high] - high_target):
+                    high = k
+
+            ordered = displacement[low] < displacement[high]
+            if ordered:
+                slopes[curve] = (force[high] - force[low]) / (displacement[high] - displacement[low])
+            max_force_index[curve] = peak - start
+            index_low[curve] = low - start
+            index_high[curve] = high - start
+            valid[curve] = ordered
+
+
+def series_arrays(store: MeasurementStore, max_allowed_length: float, n_intervals: int = 10) -> SeriesArrays:
+    """Numba-Backend von batch_kernels.series_arrays (Kurven dürfen nicht leer sein)."""
+    n_curves = len(store)
+    arrays = SeriesArrays(
+        max_force=np.maximum.reduceat(store.force, store.offsets[:-1]),
+        max_force_index=np.zeros(n_curves, dtype=np.int64),
+        embedding_length=np.zeros(n_curves),
+        work=np.zeros(n_curves),
+        work_before_fmax=np.zeros(n_curves),
+        work_after_fmax=np.zeros(n_curves),
+        cumulative_work=np.zeros((n_curves, n_intervals + 1)),
+        all_inside=np.zeros(n_curves, dtype=np.bool_)
+    )
+    _series_kernel(store.displacement, store.force, store.offsets, float(max_allowed_length), int(n_intervals),
+                   arrays.max_force_index, arrays.embedding_length, arrays.work, arrays.work_before_fmax,
+                   arrays.work_after_fmax, arrays.cumulative_work, arrays.all_inside)
+    return arrays
+
+
+def compute_moduli(store: MeasurementStore, settings: ModulusSettings = ModulusSettings()) -> ModulusResult:
+    """
+    Numba-Backend von modulus_engine.compute_moduli für die Sekante; die
+    Ausgleichsgerade ('lstsq') wird mit der NumPy-Variante berechnet.
+    """
+    if settings.fit != 'secant':
+        return compute_moduli_numpy(store, settings)
+    n_curves = len(store)
+    slopes = np.zeros(n_curves)
+    max_index = np.zeros(n_curves, dtype=np.int64)
+    index_low = np.zeros(n_curves, dtype=np.int64)
+    index_high = np.zeros(n_curves, dtype=np.int64)
+    valid = np.zeros(n_curves, dtype=np.bool_)
+    _secant_kernel(store.displacement, store.force, store.offsets, float(settings.lower_fraction),
+                   float(settings.upper_fraction), slopes, max_index, index_low, index_high, valid)
+    # Runden wie in modulus_engine mit round() je Wert
+    moduli = np.array([round(value, 4) if ok else 0.0 for value, ok in zip(slopes.tolist(), valid.tolist())])
+    return ModulusResult(moduli, max_index, index_low, index_high, valid)
@@ -0,0 +1,190 @@
+"""
+parquet_exporter.py - Spaltenorientierter Export als Parquet- oder Arrow-IPC-Datensatz
+
+Neben den Excel-Dateien können Rohkurven, Kennwerte je Probe und Statistiken je
+Messreihe als partitionierte Datensätze geschrieben werden:
+
+    <Ordner>/curves/series=<Name>/part-0.parquet      Weg und Kraft aller Messpunkte
+    <Ordner>/metrics/series=<Name>/part-0.parquet     Kennwerte je Probe
+    <Ordner>/statistics/series=<Name>/part-0.parquet  Mittelwerte und Standardabweichungen
+
+Die Partitionierung nach Messreihe (Hive-Schema) erlaubt es, in Notebooks oder
+späteren Läufen gezielt einzelne Messreihen zu lesen, ohne die Rohdateien erneut
+zu parsen (siehe read_table). Arrow-IPC-Dateien werden beim Lesen per
+Memory-Mapping eingebunden. Benötigt das optionale Paket pyarrow.
+"""
+
+# src/core/parquet_exporter.py
+from pathlib import Path
+from typing import Optional
+import logging
+import numpy as np
+from src.core.data_statistics import MeasurementAnalyzer
+
+COLUMNAR_FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}  # Name -> pyarrow.dataset-Format
+FILE_EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow'}
+TABLE_NAMES = ('curves', 'metrics', 'statistics')
+PARTITION_COLUMN = 'series'
+
+
+def _require_pyarrow():
+    """Importiert pyarrow erst bei Bedarf, damit der restliche Analyzer ohne das Paket läuft."""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError("Für den Parquet/Arrow-Export wird das Paket 'pyarrow' benötigt "
+                          "(pip install pyarrow)") from e
+    return pa, ds
+
+
+def _check_format(file_format: str) -> None:
+    if file_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unbekanntes Format: {file_format} (erlaubt: {', '.join(COLUMNAR_FORMATS)})")
+
+
+def _float_column(values, n: int) -> np.ndarray:
+    """Wandelt eine Ergebnisliste in ein float-Array der Länge n um (fehlende Werte: NaN)."""
+    column = np.full(n, np.nan)
+    values = np.asarray(values if values is not None else [], dtype=float)[:n]
+    column[:len(values)] = values
+    return column
+
+
+class ColumnarExporter:
+    """
+    Sammelt Messreihen wie der ExcelExporter und schreibt sie als partitionierte
+    Parquet- oder Arrow-IPC-Datensätze.
+    """
+
+    def __init__(self, output_folder: Path, file_format: str = 'parquet'):
+        """
+        Args:
+            output_folder: Zielordner der Datensätze (je Tabelle ein Unterordner)
+            file_format: 'parquet' oder 'arrow' (Arrow IPC / Feather V2)
+        """
+        _check_format(file_format)
+        self.output_folder = Path(output_folder)
+        self.file_format = file_format
+        self.series: dict[str, MeasurementAnalyzer] = {}
+        self.logger = logging.getLogger('SFPO_Analyzer')
+
+    def add_measurement_series(self, name: str, analyzer: MeasurementAnalyzer) -> None:
+        """Fügt eine ausgewertete Messreihe hinzu."""
+        if analyzer:
+            self.series[name] = analyzer
+
+    @staticmethod
+    def specimen_names(analyzer: MeasurementAnalyzer) -> list[str]:
+        """Probennamen in Messreihenfolge (Ersatzname, falls die Sortierung nicht passt)."""
+        n = len(analyzer.measurements_data) or len(analyzer.max_forces_data)
+        good_ones = analyzer.sorting.good_ones or []
+        if len(good_ones) == n:
+            return list(good_ones)
+        return [f"Messung {i + 1}" for i in range(n)]
+
+    @staticmethod
+    def _series_column(pa, name: str, n: int):
+        """Partitionsspalte als Dictionary-Array (ein Eintrag statt n Zeichenketten)."""
+        return pa.DictionaryArray.from_arrays(pa.array(np.zeros(n, dtype=np.int32)), pa.array([name]))
+
+    def _curve_batch(self, pa, name: str, analyzer: MeasurementAnalyzer):
+        """Alle Messpunkte einer Messreihe; die Probe ist dictionary-codiert."""
+        store = analyzer.measurements_data
+        lengths = store.lengths
+        specimens = pa.DictionaryArray.from_arrays(
+            pa.array(np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)),
+            pa.array(self.specimen_names(analyzer)))
+        sample = np.arange(len(store.force), dtype=np.int64) - np.repeat(store.offsets[:-1], lengths)
+        return pa.table({
+            PARTITION_COLUMN: self._series_column(pa, name, len(store.force)),
+            'specimen': specimens,
+            'sample': pa.array(sample.astype(np.int32)),
+            'displacement': store.displacement,
+            'force': store.force,
+        })
+
+    def _metrics_batch(self, pa, name: str, analyzer: MeasurementAnalyzer):
+        """Kennwerte je Probe; Arbeitsintervalle als Listenspalte."""
+        names = self.specimen_names(analyzer)
+        n = len(names)
+        return pa.table({
+            PARTITION_COLUMN: self._series_column(pa, name, n),
+            'specimen': pa.array(names, pa.string()),
+            'fiber_diameter': _float_column(analyzer.fiberdiameters, n),
+            'max_force': _float_column(analyzer.max_forces_data, n),
+            'embedding_length': _float_column(analyzer.embeddinglengths, n),
+            'ifss': _float_column(analyzer.ifssvalues, n),
+            'work': _float_column(analyzer.works, n),
+            'work_before_fmax': _float_column(analyzer.work_before_fmax, n),
+            'work_after_fmax': _float_column(analyzer.work_after_fmax, n),
+            'force_modulus': _float_column(analyzer.force_moduli, n),
+            'area_normalized_work': _float_column(getattr(analyzer, 'area_normalized_works', None), n),
+            'work_intervals': pa.array([list(map(float, intervals)) for intervals in analyzer.work_intervals[:n]]
+                                       + [None] * max(n - len(analyzer.work_intervals), 0),
+                                       pa.list_(pa.float64())),
+        })
+
+    def _statistics_batch(self, pa, name: str, analyzer: MeasurementAnalyzer):
+        """Mittelwerte und Standardabweichungen der Messreihe (wie die Excel-Haupttabelle, leer: NaN)."""
+        analyzer._update_mapping()
+        columns = {PARTITION_COLUMN: self._series_column(pa, name, 1),
+                   'n_specimens': pa.array([len(analyzer.max_forces_data)], pa.int32())}
+        for key, label in (('forces', 'max_force'), ('lengths', 'embedding_length'), ('ifss', 'ifss'),
+                           ('works', 'work'), ('force_modulus', 'force_modulus'),
+                           ('area_normalized_works', 'area_normalized_work')):
+            data = analyzer.data_mapping[key]
+            columns[f'{label}_mean'] = pa.array([float(np.mean(data)) if data else np.nan])
+            columns[f'{label}_std'] = pa.array([float(np.std(data)) if data else np.nan])
+        return pa.table(columns)
+
+    def save(self) -> dict[str, Path]:
+        """
+        Schreibt die drei Datensätze. Bereits vorhandene Partitionen derselben
+        Messreihen werden ersetzt, andere Messreihen bleiben erhalten.
+
+        Returns:
+            Tabellenname -> Ordner des Datensatzes
+        """
+        pa, ds = _require_pyarrow()
+        builders = {'curves': self._curve_batch, 'metrics': self._metrics_batch,
+                    'statistics': self._statistics_batch}
+        written = {}
+        for table_name in TABLE_NAMES:
+            tables = [builders[table_name](pa, name, analyzer) for name, analyzer in self.series.items()]
+            if not tables:
+                continue
+            target = self.output_folder / table_name
+            ds.write_dataset(
+                tables, target,
+                format=COLUMNAR_FORMATS[self.file_format],
+                partitioning=[PARTITION_COLUMN], partitioning_flavor='hive',
+                basename_template=f"part-{{i}}.{FILE_EXTENSIONS[self.file_format]}",
+                existing_data_behavior='delete_matching')
+            written[table_name] = target
+            self.logger.info(f"{table_name} ({self.file_format}) gespeichert in: {target}")
+        return written
+
+
+def open_dataset(folder: Path, table_name: str, file_format: str = 'parquet'):
+    """Öffnet einen exportierten Datensatz als pyarrow.dataset.Dataset (Partition 'series')."""
+    _check_format(file_format)
+    pa, ds = _require_pyarrow()
+    return ds.dataset(Path(folder) / table_name, format=COLUMNAR_FORMATS[file_format], partitioning='hive')
+
+
+def read_table(folder: Path, table_name: str, series: Optional[list[str]] = None,
+               columns: Optional[list[str]] = None, file_format: str = 'parquet'):
+    """
+    Liest einen Datensatz, optional nur für ausgewählte Messreihen.
+
+    Der Filter auf 'series' wird auf die Partitionen angewendet, es werden nur
+    die Dateien der gewünschten Messreihen gelesen.
+
+    Returns:
+        pyarrow.Table (mit to_pandas() in einen DataFrame umwandelbar)
+    """
+    _, ds = _require_pyarrow()
+    dataset = open_dataset(folder, table_name, file_format)
+    row_filter = ds.field(PARTITION_COLUMN).isin(series) if series else None
+    return dataset.to_table(columns=columns, filter=row_filter)
@@ -0,0 +1,166 @@
+"""
+plot_scheduler.py - Paralleles Rendern der DataPlotter-Diagramme
+
+Jeder Plot-Aufruf wird als picklebarer PlotJob beschrieben: Name der
+DataPlotter-Methode, die benötigten Messreihen, Zielordner und Parameter.
+Methoden, die pro Messreihe eine eigene Abbildung speichern, werden in einen
+Job je Messreihe aufgeteilt. Die Jobs laufen in Worker-Prozessen mit dem
+Agg-Backend, Fortschritt und Fehler werden pro Job gemeldet.
+"""
+
+# src/core/plot_scheduler.py
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+import copy
+import logging
+import os
+import time
+from src.core.measurement_store import MeasurementStore
+
+# DataPlotter-Methoden, die für jede Messreihe eigenständige Abbildungen erzeugen
+PER_SERIES_FUNCTIONS = frozenset({
+    'save_plots_for_series',
+    'create_work_interval_plots',
+    'create_normalized_plots',
+    'create_mean_normalized_plots',
+    'create_violin_plots',
+    'create_z_score_plots',
+})
+# Methoden, die die Kraft-Weg-Kurven selbst benötigen
+CURVE_FUNCTIONS = frozenset({'save_plots_for_series'})
+# Methode, die den globalen Plot-Stil für alle folgenden Plots setzt
+STYLE_FUNCTION = 'save_plots_for_series'
+
+
+@dataclass
+class PlotJob:
+    """Beschreibung eines Plot-Aufrufs, der in einem anderen Prozess ausgeführt werden kann"""
+    function: str  # Name der DataPlotter-Methode
+    series: dict  # Messreihenname -> Analyzer
+    folder: Path  # Zielordner
+    kwargs: dict = field(default_factory=dict)  # Weitere Parameter der Methode
+    apply_style: bool = False  # DataPlotter.setup_plot_style vor dem Rendern anwenden
+    label: str = ""  # Bezeichnung für Fortschritt und Fehlermeldungen
+
+
+@dataclass
+class PlotJobResult:
+    """Ergebnis eines Plot-Jobs"""
+    label: str
+    success: bool
+    duration: float  # Sekunden
+    error: Optional[str] = None
+
+
+def render_plot_job(job: PlotJob) -> PlotJobResult:
+    """Rendert einen PlotJob (läuft im Worker-Prozess oder seriell im Hauptprozess)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from src.core.data_plotting import DataPlotter
+
+    start = time.perf_counter()
+    try:
+        # Gleicher Stil wie bei der seriellen Ausführung in main()
+        plt.rcdefaults()
+        if job.apply_style:
+            DataPlotter.setup_plot_style()
+        getattr(DataPlotter, job.function)(job.series, job.folder, **job.kwargs)
+        return PlotJobResult(job.label, True, time.perf_counter() - start)
+    except Exception as e:
+        return PlotJobResult(job.label, False, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    finally:
+        plt.close('all')
+
+
+def _without_curves(analyzer):
+    """Flache Kopie eines Analyzers ohne Kurvendaten, damit nur Kennwerte übertragen werden."""
+    light = copy.copy(analyzer)
+    light.measurements_data = MeasurementStore()
+    light.specimen_headers = []
+    light.result_cache = None
+    return light
+
+
+class PlotScheduler:
+    """
+    Sammelt Plot-Aufrufe als PlotJobs und rendert sie in einem Prozess-Pool.
+
+    Die Reihenfolge der add-Aufrufe entspricht der seriellen Reihenfolge; sie
+    bestimmt nur, ob der Plot-Stil von save_plots_for_series für einen Job gilt.
+    """
+
+    def __init__(self, analyzers_dict: dict, max_workers: Optional[int] = None, parallel: bool = True):
+        self.analyzers_dict = analyzers_dict
+        self.max_workers = max_workers
+        self.parallel = parallel
+        self.jobs: list[PlotJob] = []
+        self._style_applied = False
+        self._light_analyzers = {name: _without_curves(analyzer) for name, analyzer in analyzers_dict.items()}
+        self.logger = logging.getLogger('SFPO_Analyzer')
+
+    def add(self, function: str, folder: Path, **kwargs) -> None:
+        """
+        Plant einen DataPlotter-Aufruf ein.
+
+        Args:
+            function: Name der DataPlotter-Methode, z.B. 'create_boxplots'
+            folder: Zielordner der Plots
+            **kwargs: Weitere Parameter der Methode
+        """
+        if function == STYLE_FUNCTION:
+            self._style_applied = True
+        source = self.analyzers_dict if function in CURVE_FUNCTIONS else self._light_analyzers
+
+        if function in PER_SERIES_FUNCTIONS:
+            for name, analyzer in source.items():
+                self.jobs.append(PlotJob(function, {name: analyzer}, folder, kwargs,
+                                         self._style_applied, f"{function} [{name}]"))
+        else:
+            self.jobs.append(PlotJob(function, dict(source), folder, kwargs, self._style_applied, function))
+
+    def run(self) -> list[PlotJobResult]:
+        """
+        Rendert alle eingeplanten Jobs und meldet Fortschritt und Fehler pro Job.
+
+        Returns:
+            Ergebnisse in der Reihenfolge der Fertigstellung
+        """
+        jobs, self.jobs = self.jobs, []
+        if not jobs:
+            return []
+        total = len(jobs)
+        results = []
+        start = time.perf_counter()
+
+        if not self.parallel or total == 1:
+            for job in jobs:
+                results.append(render_plot_job(job))
+                self._report(results[-1], len(results), total)
+        else:
+            # Worker-Prozesse übernehmen das Backend über die Umgebung
+            os.environ["MPLBACKEND"] = "Agg"
+            self.logger.info(f"Rendere {total} Plot-Jobs parallel (Worker: {self.max_workers or 'alle Kerne'})")
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(render_plot_job, job): job for job in jobs}
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # z.B. abgebrochener Worker-Prozess
+                        result = PlotJobResult(futures[future].label, False, 0.0, f"{type(e).__name__}: {e}")
+                    results.append(result)
+                    self._report(result, len(results), total)
+
+        failed = [result for result in results if not result.success]
+        self.logger.info(f"Plots fertig: {total - len(failed)}/{total} erfolgreich "
+                         f"in {time.perf_counter() - start:.1f} s")
+        return results
+
+    def _report(self, result: PlotJobResult, done: int, total: int) -> None:
+        if result.success:
+            self.logger.info(f"[{done}/{total}] {result.label} ({result.duration:.1f} s)")
+        else:
+            self.logger.error(f"[{done}/{total}] {result.label} fehlgeschlagen: {result.error}")
@@ -0,0 +1,236 @@
+"""
+plot_templates.py - Wiederverwendbare Abbildungen für die Plots pro Messreihe
+
+Die Diagramme pro Messreihe (Kraft-Weg-Kurven, Arbeitsintervalle, normierte
+Arbeit) unterscheiden sich nur in den Daten. Ein Template baut Abbildung,
+Achsen, Ticks, Schriftarten und Gitter einmal auf; für jede Messreihe werden
+nur die Linien- bzw. Balkendaten (set_data, set_height) und der Titel
+ausgetauscht, bevor gespeichert wird.
+
+Die Templates verwenden matplotlib.figure.Figure direkt und sind damit nicht
+bei pyplot registriert. Sie überleben plt.close('all') und werden pro Prozess
+in einem Cache gehalten, sodass auch die Worker des PlotSchedulers sie über
+mehrere Jobs hinweg wiederverwenden.
+"""
+
+# src/core/plot_templates.py
+from pathlib import Path
+import matplotlib as mpl
+from matplotlib.figure import Figure
+import numpy as np
+
+
+def interval_centers(n_intervals: int = 10) -> np.ndarray:
+    """Mittelpunkte von n_intervals gleich breiten Intervallen in Prozent."""
+    return (np.arange(n_intervals) + 0.5) * (100 / n_intervals)
+
+
+# Mittelpunkte der 10%-Intervalle (Standardeinteilung)
+INTERVAL_CENTERS = interval_centers(10)
+# Beschriftung der x-Achse in 20%-Schritten
+PERCENT_TICKS = np.arange(0, 101, 20)
+# Auflösung beim Speichern
+SAVE_DPI = 300
+# rcParams, die beim Aufbau eines Templates eingefroren werden
+STYLE_KEYS = ('lines.linewidth', 'axes.linewidth', 'xtick.major.width', 'ytick.major.width',
+              'font.size', 'axes.labelsize', 'axes.titlesize', 'xtick.labelsize', 'ytick.labelsize')
+
+_template_cache: dict = {}
+
+
+def get_template(template_cls, *args):
+    """
+    Liefert ein Template aus dem prozessweiten Cache oder baut es neu auf.
+
+    Der Schlüssel enthält die relevanten rcParams, da diese beim Aufbau
+    übernommen werden (z.B. nach DataPlotter.setup_plot_style).
+    """
+    key = (template_cls, args, tuple(mpl.rcParams[name] for name in STYLE_KEYS))
+    template = _template_cache.get(key)
+    if template is None:
+        template = _template_cache[key] = template_cls(*args)
+    return template
+
+
+def clear_templates() -> None:
+    """Verwirft alle zwischengespeicherten Templates."""
+    _template_cache.clear()
+
+
+def _bold_tick_labels(labels, fontsize=None) -> None:
+    for label in labels:
+        if fontsize is not None:
+            label.set_fontsize(fontsize)
+        label.set_fontweight('bold')
+
+
+def _update_errorbar(container, x, means, stds) -> None:
+    """Setzt neue Werte für einen mit ax.errorbar erzeugten ErrorbarContainer."""
+    data_line, caplines, barlinecols = container.lines
+    x = np.asarray(x, dtype=float)
+    means = np.asarray(means, dtype=float)
+    stds = np.asarray(stds, dtype=float)
+    low, high = means - stds, means + stds
+
+    if data_line is not None:
+        data_line.set_data(x, means)
+    if caplines:
+        caplines[0].set_data(x, low)
+        caplines[1].set_data(x, high)
+    for collection in barlinecols:
+        collection.set_segments([np.array([[xi, lo], [xi, hi]]) for xi, lo, hi in zip(x, low, high)])
+
+
+class SeriesPlotTemplate:
+    """Basisklasse: Abbildung und Achse werden einmal aufgebaut und pro Messreihe neu befüllt."""
+    figsize = (10, 8)
+
+    def __init__(self):
+        self.figure = Figure(figsize=self.figsize)
+        self.ax = self.figure.add_subplot()
+        self._lines = []
+
+    def _line(self, index: int, **kwargs):
+        """Gibt die Linie mit dem Index zurück und legt fehlende Linien an."""
+        while len(self._lines) <= index:
+            line, = self.ax.plot([], [], **kwargs)
+            self._lines.append(line)
+        return self._lines[index]
+
+    def _set_lines(self, series, style) -> None:
+        """
+        Überträgt die Datenreihen auf die Linien des Templates; überzählige Linien werden ausgeblendet.
+
+        Args:
+            series: Folge von (x, y)-Paaren
+            style: Funktion Index -> Linienparameter für neu angelegte Linien
+        """
+        count = 0
+        for i, (x, y) in enumerate(series):
+            line = self._line(i, **style(i))
+            line.set_data(x, y)
+            line.set_visible(True)
+            count += 1
+        for line in self._lines[count:]:
+            line.set_visible(False)
+
+    def _autoscale(self) -> None:
+        """Skaliert die Achsen auf die neuen Daten wie beim Neuzeichnen mit pyplot."""
+        ax = self.ax
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
+        # set_xticks erweitert die Achse auf 0-100 %, daher wie bisher nach den Daten setzen
+        ax.set_xticks(PERCENT_TICKS)
+        _bold_tick_labels(ax.get_xticklabels() + ax.get_yticklabels(), 22)
+
+    def save(self, path: Path) -> None:
+        self.figure.savefig(path, dpi=SAVE_DPI, bbox_inches='tight')
+
+
+class CurvePlotTemplate(SeriesPlotTemplate):
+    """Kraft-Weg-Kurven einer Messreihe (höchstens 10 Messungen, Plasma-Farben)"""
+    figsize = (12, 9)
+
+    def __init__(self, max_embedding_length: float = 1000.0):
+        super().__init__()
+        self.x_range = (0.0, max_embedding_length)
+        self.colors = mpl.colormaps['plasma'](np.linspace(0, 1, 10))
+        ax = self.ax
+        for color in self.colors:
+            self._line(len(self._lines), color=color)
+
+        # Achsenlimits und Ticks sind für alle Messreihen gleich
+        ax.set_xlim(0, max_embedding_length)
+        ax.set_ylim(0, 0.3)
+        tick_step = max_embedding_length / 5
+        ax.set_xticks(np.arange(0, max_embedding_length + 1, tick_step))
+        ax.set_yticks(np.arange(0, 0.31, 0.05))
+        ax.tick_params(axis='both', which='major', pad=2)
+        _bold_tick_labels(ax.get_xticklabels() + ax.get_yticklabels())
+
+        ax.set_xlabel('Displacement [µm]', fontweight='bold', labelpad=2)
+        ax.set_ylabel('Force [N]', fontweight='bold', labelpad=2)
+        ax.grid(True)
+        self.figure.tight_layout(pad=2.0)
+
+    def render(self, measurements, path: Path) -> None:
+        # Wie bisher: höchstens so viele Kurven wie Farben
+        curves = [measurement for measurement, _ in zip(measurements, self.colors)]
+        self._set_lines(curves, lambda i: {})
+        self.save(path)
+
+
+class NormalizedWorkTemplate(SeriesPlotTemplate):
+    """Normierte Arbeit pro Intervall, eine Linie pro Messung"""
+
+    def __init__(self, n_intervals: int = 10):
+        super().__init__()
+        self.centers = interval_centers(n_intervals)
+        self.colors = mpl.colormaps['plasma'](np.linspace(0, 1, 10))
+        ax = self.ax
+        self.title = ax.set_title('', fontsize=24, fontweight='bold')
+        ax.set_xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
+        ax.set_ylabel('Normierte Arbeit pro Intervall', fontsize=24, fontweight='bold')
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+    def render(self, name: str, normed_intervals, path: Path) -> None:
+        self._set_lines(((self.centers, values) for values in normed_intervals),
+                        lambda i: {'color': self.colors[i % len(self.colors)], 'marker': 'o'})
+        self._autoscale()
+        self.title.set_text(f'Normierte Arbeit - {name}')
+        self.save(path)
+
+
+class MeanNormalizedWorkTemplate(SeriesPlotTemplate):
+    """Mittelwert und Standardabweichung der normierten Arbeit pro Intervall"""
+
+    def __init__(self, n_intervals: int = 10):
+        super().__init__()
+        ax = self.ax
+        self.centers = interval_centers(n_intervals)
+        zeros = np.zeros(n_intervals)
+        self.errorbar = ax.errorbar(self.centers, zeros, yerr=zeros,
+                                    fmt='b-', linewidth=2, ecolor='red', elinewidth=1,
+                                    capsize=5, capthick=1, marker='o',
+                                    label='Mittelwert mit Standardabweichung')
+        self.title = ax.set_title('', fontsize=24, fontweight='bold')
+        ax.set_xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
+        ax.set_ylabel('Normierte Arbeit pro Intervall', fontsize=24, fontweight='bold')
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+    def render(self, name: str, means, stds, path: Path) -> None:
+        _update_errorbar(self.errorbar, self.centers, means, stds)
+        self._autoscale()
+        self.title.set_text(f'Mittlere normierte Arbeit - {name}')
+        self.save(path)
+
+
+class WorkIntervalTemplate(SeriesPlotTemplate):
+    """Mittlere Arbeit pro Intervall als Balken mit Fehlerbalken"""
+    figsize = (12, 8)
+
+    def __init__(self, n_intervals: int = 10):
+        super().__init__()
+        ax = self.ax
+        self.centers = interval_centers(n_intervals)
+        zeros = np.zeros(n_intervals)
+        # Balken füllen 80% der Intervallbreite
+        self.bars = ax.bar(self.centers, zeros, width=80 / n_intervals, color='lightblue', edgecolor='blue',
+                           linewidth=1.5, alpha=0.7, label='Mittlere Arbeit pro Intervall')
+        self.errorbar = ax.errorbar(self.centers, zeros, yerr=zeros, fmt='none', ecolor='red',
+                                    elinewidth=1.5, capsize=5, capthick=1.5)
+        self.title = ax.set_title('', fontsize=24, fontweight='bold')
+        ax.set_xlabel('Relative Position [%]', fontsize=24, fontweight='bold')
+        ax.set_ylabel('Arbeit [µJ]', fontsize=24, fontweight='bold')
+        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+        ax.spines['right'].set_visible(False)
+        ax.spines['top'].set_visible(False)
+
+    def render(self, name: str, means, stds, path: Path) -> None:
+        for bar, mean in zip(self.bars, means):
+            bar.set_height(mean)
+        _update_errorbar(self.errorbar, self.centers, means, stds)
+        self._autoscale()
+        self.title.set_text(f'Arbeitsintervalle - {name}')
+        self.figure.tight_layout()
+        self.save(path)
@@ -0,0 +1,232 @@
+"""
+result_cache.py - Festplatten-Cache für eingelesene Kurven und Kennwerte je Probe
+
+Jede Probe wird unter einem Schlüssel aus Dateiinhalt (Hash) bzw. Größe+Änderungszeit
+und den Analyseparametern (max. Einbetttiefe, Anzahl der Intervalle, Modulfenster) abgelegt.
+Ein Eintrag ist eine .npz-Datei mit bereinigter Kurve, Kopfdaten und Kennwerten.
+Bei einem erneuten Lauf werden nur neue oder geänderte Dateien eingelesen und berechnet.
+
+Die Zugriffszeit eines Eintrags steckt in seiner Änderungszeit. Dadurch braucht der
+Cache keine gemeinsame Indexdatei und kann von mehreren Prozessen genutzt werden.
+Standardmäßig liegt er im Cache-Ordner des Benutzers (default_cache_folder), nie
+neben den Rohdaten, die z.B. auf einer schreibgeschützten Laborfreigabe liegen können.
+get und put dürfen aus mehreren Threads gleichzeitig aufgerufen werden.
+"""
+
+# src/core/result_cache.py
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+import numpy as np
+from src.core.measurement_store import Curve
+from src.core.metric_kernels import CurveMetrics
+from src.core.modulus_engine import ModulusSettings
+from src.core.specimen_parser import SpecimenHeader
+
+CACHE_VERSION = 2  # Erhöhen, wenn sich Kennwertberechnung oder Format ändern
+KEY_MODES = ('content', 'stat')
+
+
+def default_cache_folder() -> Path:
+    """Cache-Ordner des Benutzers: %LOCALAPPDATA% unter Windows, sonst $XDG_CACHE_HOME bzw. ~/.cache."""
+    if os.name == 'nt' and os.environ.get('LOCALAPPDATA'):
+        base = Path(os.environ['LOCALAPPDATA'])
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return base / 'SFPO_Analyzer'
+
+
+@dataclass
+class CachedSpecimen:
+    """Inhalt eines Cache-Eintrags"""
+    curve: Curve
+    header: SpecimenHeader
+    metrics: Optional[CurveMetrics] = None
+
+
+@dataclass
+class CacheStats:
+    """Zähler der aktuellen Sitzung"""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+
+class MetricsCache:
+    """
+    Cache für Kurven und Kennwerte einzelner Messdateien mit LRU-Verdrängung
+    nach Gesamtgröße.
+    """
+
+    def __init__(self, cache_folder: Path, max_size_mb: float = 512.0, key_mode: str = 'content'):
+        """
+        Args:
+            cache_folder: Ordner für die Cache-Einträge
+            max_size_mb: Maximale Gesamtgröße, darüber werden die ältesten Einträge gelöscht
+            key_mode: 'content' (Hash über den Dateiinhalt) oder 'stat' (Größe und Änderungszeit)
+
+        Raises:
+            OSError: Wenn der Cache-Ordner nicht angelegt werden kann
+        """
+        if key_mode not in KEY_MODES:
+            raise ValueError(f"Unbekannter Schlüsselmodus '{key_mode}', erlaubt: {KEY_MODES}")
+        self.cache_folder = Path(cache_folder)
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 ** 2)
+        self.key_mode = key_mode
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+        self.logger = logging.getLogger('SFPO_Analyzer')
+
+    def __getstate__(self) -> dict:
+        # Der Cache wird mit dem Analyzer aus Worker-Prozessen zurückgegeben, Sperren sind nicht picklebar
+        state = self.__dict__.copy()
+        del state['_stats_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+
+    def _count(self, counter: str, n: int = 1) -> None:
+        """Erhöht einen Zähler in self.stats (threadsicher)."""
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + n)
+
+    @property
+    def needs_content(self) -> bool:
+        """True, wenn der Schlüssel den Dateiinhalt benötigt."""
+        return self.key_mode == 'content'
+
+    def make_key(self, file_path: Path, max_allowed_length: float, n_intervals: int,
+                 raw: bytes = None, signature: Optional[tuple[int, int]] = None,
+                 modulus_settings: Optional[ModulusSettings] = None) -> str:
+        """
+        Bildet den Schlüssel aus Datei und Analyseparametern.
+
+        Args:
+            file_path: Pfad der Messdatei
+            max_allowed_length: Maximale Einbetttiefe in µm
+            n_intervals: Anzahl der Arbeitsintervalle
+            raw: Bereits gelesener Dateiinhalt (vermeidet erneutes Lesen im Modus 'content')
+            signature: (Größe, Änderungszeit in ns) aus der Verzeichnissuche (vermeidet stat im Modus 'stat')
+            modulus_settings: Kraftniveaus und Verfahren des Verbundmoduls (Standard: 20%/70%, Sekante)
+        """
+        if self.key_mode == 'content':
+            if raw is None:
+                raw = Path(file_path).read_bytes()
+            file_key = hashlib.blake2b(raw, digest_size=20).hexdigest()
+        else:
+            if signature is None:
+                stat = Path(file_path).stat()
+                signature = (stat.st_size, stat.st_mtime_ns)
+            file_key = f"{Path(file_path).resolve()}|{signature[0]}|{signature[1]}"
+        modulus = modulus_settings or ModulusSettings()
+        parameters = json.dumps([CACHE_VERSION, file_key, float(max_allowed_length), int(n_intervals),
+                                 modulus.lower_fraction, modulus.upper_fraction, modulus.fit])
+        return hashlib.blake2b(parameters.encode(), digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_folder / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[CachedSpecimen]:
+        """Liefert den Eintrag zum Schlüssel oder None."""
+        entry_path = self._entry_path(key)
+        try:
+            with np.load(entry_path, allow_pickle=False) as entry:
+                curve = Curve(entry['displacement'].copy(), entry['force'].copy())
+                meta = json.loads(entry['meta'].item())
+        except FileNotFoundError:
+            self._count('misses')
+            return None
+        except Exception as e:
+            # Beschädigter Eintrag wird verworfen und neu berechnet
+            self.logger.warning(f"Cache-Eintrag {entry_path.name} unlesbar, wird verworfen: {e}")
+            entry_path.unlink(missing_ok=True)
+            self._count('misses')
+            return None
+
+        # Zugriff vermerken (LRU über die Änderungszeit)
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self._count('hits')
+
+        header = SpecimenHeader(**meta['header'])
+        metrics = None
+        if meta.get('metrics') is not None:
+            metric_values = meta['metrics']
+            metric_values['modulus_point_low'] = tuple(metric_values['modulus_point_low'])
+            metric_values['modulus_point_high'] = tuple(metric_values['modulus_point_high'])
+            metrics = CurveMetrics(**metric_values)
+        return CachedSpecimen(curve=curve, header=header, metrics=metrics)
+
+    def put(self, key: str, specimen: CachedSpecimen) -> None:
+        """Schreibt einen Eintrag (atomar über eine temporäre Datei)."""
+        meta = {
+            'header': asdict(specimen.header),
+            'metrics': asdict(specimen.metrics) if specimen.metrics is not None else None
+        }
+        entry_path = self._entry_path(key)
+        tmp_path = self.cache_folder / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+        try:
+            np.savez(tmp_path,
+                     displacement=np.asarray(specimen.curve.displacement, dtype=np.float64),
+                     force=np.asarray(specimen.curve.force, dtype=np.float64),
+                     meta=np.array(json.dumps(meta)))
+            os.replace(tmp_path, entry_path)
+            self._count('writes')
+        except OSError as e:
+            self.logger.warning(f"Cache-Eintrag konnte nicht geschrieben werden: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [entry for entry in os.scandir(self.cache_folder)
+                if entry.is_file() and entry.name.endswith('.npz') and '.tmp.' not in entry.name]
+
+    def size_bytes(self) -> int:
+        """Aktuelle Gesamtgröße aller Einträge."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self) -> int:
+        """
+        Löscht die am längsten nicht genutzten Einträge, bis die Gesamtgröße
+        unter max_size_mb liegt. Gibt die Anzahl gelöschter Einträge zurück.
+        """
+        entries = [(entry.stat().st_mtime_ns, entry.stat().st_size, Path(entry.path))
+                   for entry in self._entries()]
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_size_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+        self._count('evictions', removed)
+        return removed
+
+    def clear(self) -> None:
+        """Löscht alle Einträge."""
+        for entry in self._entries():
+            Path(entry.path).unlink(missing_ok=True)
+
+    def report(self) -> str:
+        """Kurzer Bericht über Trefferquote und Belegung."""
+        lookups = self.stats.hits + self.stats.misses
+        hit_rate = self.stats.hits / lookups if lookups else 0.0
+        entries = self._entries()
+        size_mb = sum(entry.stat().st_size for entry in entries) / 1024 ** 2
+        return (f"Cache {self.cache_folder}: {self.stats.hits} Treffer, {self.stats.misses} Fehlzugriffe "
+                f"({hit_rate:.0%}), {self.stats.writes} geschrieben, {self.stats.evictions} verdrängt, "
+                f"{len(entries)} Einträge, {size_mb:.1f} / {self.max_size_bytes / 1024 ** 2:.0f} MB")
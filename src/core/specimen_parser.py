@@ -0,0 +1,136 @@
+"""
+specimen_parser.py - Einlesen einer Messdatei mit genau einem Dateizugriff
+
+Eine Messdatei besteht aus einem 40-zeiligen Kopf (Faserdurchmesser in Zeile 20)
+und einem tabulatorgetrennten Datenblock Zeit/Weg/Kraft. Die Datei wird einmal
+als Bytes gelesen, der Kopf in einen SpecimenHeader überführt und der Datenblock
+per NumPy-Massenkonvertierung in Float-Arrays umgewandelt.
+"""
+
+# src/core/specimen_parser.py
+from dataclasses import dataclass, field
+from pathlib import Path
+import io
+import logging
+import warnings
+import numpy as np
+from src.core.measurement_store import Curve
+
+HEADER_LINES = 40  # Anzahl der Kopfzeilen vor dem Datenblock
+DIAMETER_LINE = 20  # Zeile mit dem Faserdurchmesser (1-basiert)
+
+
+@dataclass
+class SpecimenHeader:
+    """Strukturierte Kopfdaten einer Messdatei"""
+    fiber_diameter: float = 0.0  # Faserdurchmesser in µm
+    fields: dict[str, str] = field(default_factory=dict)  # Schlüssel -> Wert aus den Kopfzeilen
+    lines: list[str] = field(default_factory=list)  # Rohzeilen des Kopfes
+
+
+@dataclass
+class ParsedSpecimen:
+    """Ergebnis des Einlesens einer Messdatei"""
+    path: Path
+    header: SpecimenHeader
+    curve: Curve
+
+
+class SpecimenParser:
+    """
+    Liest Messdateien mit einem Dateizugriff: Kopf und Datenblock kommen
+    aus demselben Byte-Puffer.
+    """
+
+    def __init__(self, max_allowed_length: float = 1000.0):
+        self.max_allowed_length = max_allowed_length
+        self.logger = logging.getLogger('SFPO_Analyzer')
+
+    def parse(self, file_path: Path) -> ParsedSpecimen:
+        """
+        Liest eine Messdatei und liefert Kopfdaten und bereinigte Kraft-Weg-Kurve.
+        """
+        return self.parse_bytes(Path(file_path).read_bytes(), file_path)
+
+    def parse_bytes(self, raw: bytes, file_path: Path = None) -> ParsedSpecimen:
+        """
+        Wie parse, aber für bereits gelesene Dateiinhalte (z.B. nach dem Hashen für den Cache).
+        """
+        parts = raw.split(b'\n', HEADER_LINES)
+        if len(parts) <= HEADER_LINES:
+            raise ValueError(f"Datei hat weniger als {HEADER_LINES} Kopfzeilen: {file_path}")
+
+        header = self.parse_header(parts[:HEADER_LINES], file_path)
+        data = self.parse_numeric_block(parts[HEADER_LINES])
+        if len(data) == 0:
+            # Wie beim bisherigen pandas-Einlesen (EmptyDataError): Datei wird übersprungen
+            raise ValueError(f"Datei enthält keine Messwerte: {file_path}")
+        path = Path(file_path) if file_path is not None else None
+        return ParsedSpecimen(path, header, self.clean_curve(data[:, 1], data[:, 2]))
+
+    def parse_header(self, header_lines: list[bytes], file_path: Path = None) -> SpecimenHeader:
+        """Überführt die Kopfzeilen in einen SpecimenHeader."""
+        lines = [line.decode('latin-1').rstrip('\r') for line in header_lines]
+        fields = {}
+        for line in lines:
+            key, _, value = line.partition('\t')
+            key = key.strip()
+            if key and key not in fields:
+                fields[key] = value.strip()
+
+        try:
+            fiber_diameter = float(lines[DIAMETER_LINE - 1].split('\t')[1].strip())
+        except (IndexError, ValueError) as e:
+            self.logger.warning(f"Faserdurchmesser in Zeile {DIAMETER_LINE} nicht lesbar ({file_path}): {e}")
+            fiber_diameter = 0.0
+        return SpecimenHeader(fiber_diameter=fiber_diameter, fields=fields, lines=lines)
+
+    @staticmethod
+    def parse_numeric_block(block: bytes) -> np.ndarray:
+        """
+        Wandelt den Datenblock (Zeit, Weg, Kraft) in ein (n, 3) Float-Array um.
+        Schneller Weg über np.fromstring, bei unregelmäßigen Zeilen Rückfall auf pandas.
+        """
+        if SpecimenParser.has_three_fields_per_line(block):
+            try:
+                with warnings.catch_warnings():
+                    # fromstring meldet abgebrochenes Parsen nur als Warnung
+                    warnings.simplefilter('error')
+                    values = np.fromstring(block.decode('latin-1'), dtype=np.float64, sep=' ')
+                # Jede Zeile hat drei Felder; nicht numerische Felder verkürzen das Ergebnis
+                n_lines = block.count(b'\n') + (0 if block.endswith(b'\n') or not block else 1)
+                if values.size == 3 * n_lines:
+                    return values.reshape(-1, 3)
+            except (ValueError, DeprecationWarning):
+                pass
+
+        # Unregelmäßige Zeilen: pandas füllt fehlende Werte mit NaN, diese fallen bei der Bereinigung weg;
+        # zusätzliche Spalten werden wie beim bisherigen Einlesen (usecols) ignoriert
+        import pandas as pd
+        df = pd.read_csv(
+            io.BytesIO(block),
+            delimiter="\t",
+            header=None,
+            encoding='unicode_escape',
+            names=["Time", "Displacement", "Force"],
+            usecols=["Time", "Displacement", "Force"])
+        return df.to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def has_three_fields_per_line(block: bytes) -> bool:
+        """
+        Prüft, ob jede Zeile des Datenblocks genau zwei Tabulatoren (drei Felder) enthält.
+        Eine reine Gesamtzählung reicht nicht: fehlende und überzählige Werte in
+        verschiedenen Zeilen würden sich ausgleichen und die Spalten verschieben.
+        """
+        buffer = np.frombuffer(block, dtype=np.uint8)
+        line_ends = np.flatnonzero(buffer == ord('\n'))
+        if block and not block.endswith(b'\n'):
+            line_ends = np.append(line_ends, len(buffer))
+        tabs_per_line = np.diff(np.searchsorted(np.flatnonzero(buffer == ord('\t')), line_ends), prepend=0)
+        return bool(np.all(tabs_per_line == 2))
+
+    def clean_curve(self, displacement: np.ndarray, force: np.ndarray) -> Curve:
+        """Entfernt Punkte außerhalb von 0 < Weg < max. Einbetttiefe und negative Kräfte."""
+        mask = (displacement > 0) & (displacement < self.max_allowed_length) & (force >= 0)
+        return Curve(np.ascontiguousarray(displacement[mask]), np.ascontiguousarray(force[mask]))
@@ -11,16 +11,72 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
-import statsmodels.api as sm
-from statsmodels.formula.api import ols
-from statsmodels.stats.multicomp import pairwise_tukeyhsd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+import hashlib
+import os
+from typing import Dict, Any, Hashable, Optional
 import logging
 from datetime import datetime
 import traceback
 
+DEFAULT_BOOTSTRAP_MEMORY_MB = 256  # Speicherbudget für die Bootstrap-Indexmatrix
+
+
+def bootstrap_statistics(data: np.ndarray,
+                         n_bootstrap: int,
+                         rng: np.random.Generator,
+                         memory_budget_mb: float = DEFAULT_BOOTSTRAP_MEMORY_MB
+                         ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Zieht alle Bootstrap-Stichproben als (n_bootstrap, n) Indexmatrix und berechnet
+    Mittelwert, Median und Standardabweichung (ddof=1) zeilenweise.
+    Übersteigt die Matrix das Speicherbudget, wird in Blöcken von Zeilen gerechnet.
+
+    Args:
+        data: Bereinigte Originaldaten (ohne NaN)
+        n_bootstrap: Anzahl der Bootstrap-Stichproben
+        rng: Zufallsgenerator für die Indizes
+        memory_budget_mb: Maximaler Speicher für einen Block in MB
+
+    Returns:
+        Tupel (means, medians, stds) mit je n_bootstrap Werten
+    """
+    n = len(data)
+    means = np.empty(n_bootstrap)
+    medians = np.empty(n_bootstrap)
+    stds = np.empty(n_bootstrap)
+
+    # Pro Element: Index (int64), gezogener Wert und Kopie für den Median (je float64)
+    bytes_per_row = 24 * n
+    rows_per_block = max(1, int(memory_budget_mb * 1024 ** 2 // bytes_per_row))
+
+    for start in range(0, n_bootstrap, rows_per_block):
+        end = min(start + rows_per_block, n_bootstrap)
+        samples = data[rng.integers(0, n, size=(end - start, n))]
+        means[start:end] = samples.mean(axis=1)
+        medians[start:end] = np.median(samples, axis=1)
+        stds[start:end] = samples.std(axis=1, ddof=1)  # ddof=1 für unverzerrte Schätzung
+    return means, medians, stds
+
+
+def stable_hash(value: Hashable) -> int:
+    """
+    Prozessunabhängiger 64-Bit-Hash eines Schlüsselteils.
+    hash() ist für Strings je Interpreterlauf zufällig und taugt daher nicht als Seed.
+    """
+    return int.from_bytes(hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def task_seed_sequence(seed: int, key: Hashable) -> np.random.SeedSequence:
+    """
+    Zufallsstrom einer Bootstrap-Aufgabe, abgeleitet aus Seed und Aufgabenschlüssel.
+    Ein Schlüssel (Messgröße, Messreihe) liefert unabhängig von Reihenfolge, Anzahl
+    der übrigen Aufgaben und vorherigen Aufrufen immer denselben Strom.
+    """
+    parts = key if isinstance(key, tuple) else (key,)
+    return np.random.SeedSequence(seed, spawn_key=tuple(stable_hash(part) for part in parts))
+
 
 class StatisticalAnalyzer:
     """
@@ -28,17 +84,28 @@ class StatisticalAnalyzer:
     Unterstützt Bootstrap-Verfahren und ANOVA-Tests.
     """
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, seed: int = 42,
+                 memory_budget_mb: float = DEFAULT_BOOTSTRAP_MEMORY_MB,
+                 n_workers: Optional[int] = None):
         """
         Initialisiert den StatisticalAnalyzer.
 
         Args:
             logger: Logger-Instanz für Protokollierung (optional)
+            seed: Startwert der Zufallsgeneratoren
+            memory_budget_mb: Speicherbudget der Bootstrap-Indexmatrizen, bei parallelen
+                              Aufgaben auf die gleichzeitig laufenden Threads aufgeteilt
+            n_workers: Anzahl der Threads für Bootstrap-Aufgaben (None: Standard des Thread-Pools)
         """
         self.logger = logger or logging.getLogger('SFPO_Analyzer')
 
         # Für Reproduzierbarkeit einen festen Seed setzen
-        np.random.seed(42)
+        np.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+        # Startwert der unabhängigen Zufallsströme je (Messgröße, Messreihe)
+        self.seed = seed
+        self.memory_budget_mb = memory_budget_mb
+        self.n_workers = n_workers
 
         # Einstellungen für Plots
         sns.set_style("whitegrid")
@@ -52,13 +119,17 @@ class StatisticalAnalyzer:
         self.bootstrap_results = {}
         self.anova_results = {}
     
-    def bootstrap_sample(self, data: np.ndarray, n_bootstrap: int = 1000) -> Dict[str, Any]:
+    def bootstrap_sample(self, data: np.ndarray, n_bootstrap: int = 1000,
+                         rng: Optional[np.random.Generator] = None,
+                         memory_budget_mb: Optional[float] = None) -> Dict[str, Any]:
         """
         Führt Bootstrap-Resampling für einen einzelnen Datensatz durch.
 
         Args:
             data: Originaldaten als NumPy-Array
             n_bootstrap: Anzahl der Bootstrap-Stichproben
+            rng: Eigener Zufallsgenerator (Standard: Generator des Analyzers)
+            memory_budget_mb: Speicherbudget dieser Analyse (Standard: Budget des Analyzers)
 
         Returns:
             Dictionary mit Bootstrap-Statistiken
@@ -108,24 +179,11 @@ class StatisticalAnalyzer:
         n = len(data)
         self.logger.info(f"Führe Bootstrap mit {n_bootstrap} Wiederholungen für {n} Datenpunkte durch")
         
-        # Speicher für Bootstrap-Statistiken
-        bootstrap_means = np.zeros(n_bootstrap)
-        bootstrap_medians = np.zeros(n_bootstrap)
-        bootstrap_stds = np.zeros(n_bootstrap)
-        
-        # Erzeuge n_bootstrap Stichproben mit Zurücklegen
+        # Alle Stichproben auf einmal ziehen (blockweise bei großem n_bootstrap * n)
         try:
-            for i in range(n_bootstrap):
-                # Ziehe zufällige Indizes mit Zurücklegen
-                indices = np.random.choice(n, size=n, replace=True)
-                
-                # Erstelle Bootstrap-Stichprobe
-                bootstrap_sample = data[indices]
-                
-                # Berechne und speichere Statistiken
-                bootstrap_means[i] = np.mean(bootstrap_sample)
-                bootstrap_medians[i] = np.median(bootstrap_sample)
-                bootstrap_stds[i] = np.std(bootstrap_sample, ddof=1)  # ddof=1 für unverzerrte Schätzung
+            bootstrap_means, bootstrap_medians, bootstrap_stds = bootstrap_statistics(
+                data, n_bootstrap, rng if rng is not None else self.rng,
+                memory_budget_mb if memory_budget_mb is not None else self.memory_budget_mb)
         except Exception as e:
             self.logger.error(f"Fehler bei der Bootstrap-Berechnung: {e}")
             self.logger.error(traceback.format_exc())
@@ -207,15 +265,9 @@ class StatisticalAnalyzer:
         
         try:
             # Erzeuge eine große Menge an Bootstrap-Samples
-            all_samples = np.zeros(n_bootstrap * n)
-            
-            # Erzeuge n_bootstrap Stichproben mit Zurücklegen
-            for i in range(n_bootstrap):
-                # Ziehe zufällige Indizes mit Zurücklegen
-                indices = np.random.choice(n, size=n, replace=True)
-                
-                # Erstelle Bootstrap-Stichprobe und speichere sie
-                all_samples[i * n:(i + 1) * n] = data[indices]
+            # Erzeuge n_bootstrap Stichproben mit Zurücklegen in einem Zug
+            indices = np.random.choice(n, size=(n_bootstrap, n), replace=True)
+            all_samples = data[indices].ravel()
             
             # Wähle zufällig target_size Elemente aus allen Samples
             if len(all_samples) >= target_size:
@@ -238,34 +290,66 @@ class StatisticalAnalyzer:
             else:
                 return data
 
-    def perform_bootstrap_analysis(self, data_dict: Dict[str, np.ndarray], output_folder: Path = None) -> Dict[
-        str, Dict[str, Any]]:
+    def run_bootstrap_tasks(self, tasks: list[tuple[Hashable, np.ndarray]],
+                            n_bootstrap: int = 1000) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Führt mehrere Bootstrap-Analysen parallel in einem Thread-Pool aus.
+
+        Jede Aufgabe erhält einen aus ihrem Schlüssel abgeleiteten Zufallsstrom
+        (task_seed_sequence). Die Ergebnisse sind daher unabhängig von der Anzahl
+        der Threads, von wiederholten Aufrufen und von den übrigen Aufgaben bitgenau
+        reproduzierbar. Das Speicherbudget wird auf die gleichzeitig laufenden Threads
+        aufgeteilt, damit der Spitzenverbrauch insgesamt im Budget bleibt.
+
+        Args:
+            tasks: Liste von (Schlüssel, Daten), z.B. ((Messgröße, Messreihe), Werte)
+            n_bootstrap: Anzahl der Bootstrap-Stichproben
+
+        Returns:
+            Dictionary Schlüssel -> Bootstrap-Ergebnis in der Reihenfolge der Aufgaben
+        """
+        # Leere Datensätze aussortieren
+        valid_tasks = []
+        for key, data in tasks:
+            if data is None or len(data) == 0:
+                self.logger.warning(f"Keine Daten für {key}, überspringe Bootstrap-Analyse")
+                continue
+            valid_tasks.append((key, data))
+
+        if not valid_tasks:
+            return {}
+
+        # Gleichzeitig laufende Aufgaben (Standard wie ThreadPoolExecutor) teilen sich das Budget
+        n_workers = self.n_workers or min(32, (os.cpu_count() or 1) + 4)
+        n_workers = min(n_workers, len(valid_tasks))
+        task_budget_mb = self.memory_budget_mb / n_workers
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(self.bootstrap_sample, data, n_bootstrap,
+                                np.random.default_rng(task_seed_sequence(self.seed, key)), task_budget_mb)
+                for key, data in valid_tasks]
+            return {key: future.result() for (key, _), future in zip(valid_tasks, futures)}
+
+    def perform_bootstrap_analysis(self, data_dict: Dict[str, np.ndarray], output_folder: Path = None,
+                                   n_bootstrap: int = 1000) -> Dict[str, Dict[str, Any]]:
         """
         Führt eine vollständige Bootstrap-Analyse für mehrere Datensätze durch.
 
         Args:
             data_dict: Dictionary mit Messnamen als Schlüssel und Daten als Werte
             output_folder: Ordner zum Speichern der Ergebnisplots (optional)
+            n_bootstrap: Anzahl der Bootstrap-Stichproben
 
         Returns:
             Dictionary mit Bootstrap-Ergebnissen für jeden Datensatz
         """
-        results = {}
+        self.logger.info(f"Starte Bootstrap-Analyse für {len(data_dict)} Datensätze")
+        results = self.run_bootstrap_tasks(list(data_dict.items()), n_bootstrap)
 
-        for name, data in data_dict.items():
-            self.logger.info(f"Starte Bootstrap-Analyse für {name}")
-
-            # Überprüfe, ob Daten vorhanden sind
-            if data is None or len(data) == 0:
-                self.logger.warning(f"Keine Daten für {name}, überspringe Bootstrap-Analyse")
-                continue
-
-            # Führe Bootstrap durch
-            bootstrap_result = self.bootstrap_sample(data)
-            results[name] = bootstrap_result
-
-            # Erstelle und speichere Visualisierung, wenn output_folder angegeben ist
-            if output_folder is not None:
+        # Visualisierung im Hauptthread, matplotlib ist nicht threadsicher
+        if output_folder is not None:
+            for name, bootstrap_result in results.items():
                 self.visualize_bootstrap(name, bootstrap_result, output_folder)
 
         # Speichere Ergebnisse für spätere Verwendung
@@ -341,6 +425,12 @@ class StatisticalAnalyzer:
         Returns:
             Dictionary mit ANOVA-Ergebnissen
         """
+        # scipy und statsmodels werden nur für die ANOVA gebraucht und erst hier geladen
+        from scipy import stats
+        import statsmodels.api as sm
+        from statsmodels.formula.api import ols
+        from statsmodels.stats.multicomp import pairwise_tukeyhsd
+        
         # Überprüfe, ob genügend Gruppen vorhanden sind
         if len(data_dict) < 2:
             self.logger.warning(f"Mindestens 2 Gruppen für ANOVA benötigt, aber nur {len(data_dict)} bereitgestellt")
@@ -457,6 +547,8 @@ class StatisticalAnalyzer:
             variable_name: Name der abhängigen Variable für Beschriftungen
             output_folder: Ordner zum Speichern der Plots
         """
+        from scipy import stats
+        
         # Stelle sicher, dass der Ausgabeordner existiert
         output_folder.mkdir(exist_ok=True, parents=True)
         
@@ -606,20 +698,18 @@ class StatisticalAnalyzer:
         # 1. Bootstrap-Analyse für jede Messgröße und jede Messreihe
         self.logger.info("Führe Bootstrap-Analysen durch...")
 
-        # F_max Bootstrap
-        if f_max_data:
-            results['bootstrap']['F_max'] = self.perform_bootstrap_analysis(
-                f_max_data, bootstrap_folder)
-
-        # Arbeit Bootstrap
-        if work_data:
-            results['bootstrap']['Arbeit'] = self.perform_bootstrap_analysis(
-                work_data, bootstrap_folder)
-
-        # IFSS Bootstrap
-        if ifss_data:
-            results['bootstrap']['IFSS'] = self.perform_bootstrap_analysis(
-                ifss_data, bootstrap_folder)
+        # Alle Kombinationen (Messgröße, Messreihe) in fester Reihenfolge gemeinsam verteilen
+        variable_data = {'F_max': f_max_data, 'Arbeit': work_data, 'IFSS': ifss_data}
+        tasks = [((variable, name), data)
+                 for variable, data_dict in variable_data.items()
+                 for name, data in data_dict.items()]
+        bootstrap_by_key = self.run_bootstrap_tasks(tasks, bootstrap_n)
+
+        # Ergebnisse einsortieren und Plots seriell im Hauptthread erzeugen
+        for (variable, name), bootstrap_result in bootstrap_by_key.items():
+            results['bootstrap'].setdefault(variable, {})[name] = bootstrap_result
+            self.visualize_bootstrap(name, bootstrap_result, bootstrap_folder)
+        self.bootstrap_results = results['bootstrap']
 
         # 2. ANOVA für jede Messgröße, wenn mindestens 2 Messreihen vorhanden sind
         self.logger.info("Führe ANOVA-Analysen durch...")
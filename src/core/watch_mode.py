@@ -0,0 +1,279 @@
+"""
+watch_mode.py - Inkrementelle Auswertung eines Messordners ohne GUI
+
+Der SeriesWatcher überwacht einen Überordner mit Messreihen per Polling.
+Neue oder geänderte Messdateien (*a.txt) werden eingelesen und gemeinsam mit
+dem konfigurierten Kernel-Backend berechnet, die Kennwerte aller übrigen Proben
+bleiben im Speicher. Danach werden nur die Mittelwerte, Standardabweichungen
+und Intervallstatistiken der betroffenen Messreihe neu gebildet.
+
+Da jede Excel-Datei alle Messreihen enthält, werden die Dateien gebündelt
+geschrieben: erst wenn export_delay Sekunden lang keine weitere Änderung
+aufgetreten ist, und immer unter festen Dateinamen ohne Zeitstempel, damit
+nachgelagerte Werkzeuge denselben Dateien folgen können.
+
+Aufruf: python -m src.main --mode watch --root <Überordner> [--interval 2.0] [--export-delay 10.0]
+"""
+
+# src/core/watch_mode.py
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+import logging
+import time
+from src.config.settings import NamingInTheNameOf, SortOf
+from src.core.data_sorter import DataSorter
+from src.core.data_statistics import MeasurementAnalyzer, AnalysisConfig
+from src.core.file_handler import FileHandler
+from src.core.batch_kernels import compute_series_metrics
+from src.core.measurement_store import Curve, MeasurementStore
+from src.core.metric_kernels import CurveMetrics
+from src.core.modulus_engine import ModulusSettings
+from src.core.specimen_parser import SpecimenParser, SpecimenHeader, ParsedSpecimen
+
+
+@dataclass
+class SpecimenRecord:
+    """Eingelesene und berechnete Probe mit Dateisignatur"""
+    size: int
+    mtime_ns: int
+    curve: Curve
+    header: SpecimenHeader
+    metrics: CurveMetrics
+
+
+@dataclass
+class SeriesState:
+    """Zustand einer überwachten Messreihe"""
+    folder: Path
+    naming: NamingInTheNameOf = field(default_factory=NamingInTheNameOf)
+    sorting: SortOf = field(default_factory=SortOf)
+    records: dict[str, SpecimenRecord] = field(default_factory=dict)  # Dateiname -> Probe
+    failed: dict[str, tuple[int, int]] = field(default_factory=dict)  # Dateiname -> Signatur fehlerhafter Dateien
+    analyzer: Optional[MeasurementAnalyzer] = None
+
+
+class SeriesWatcher:
+    """
+    Überwacht alle Messreihen unterhalb von root_folder und wertet nur
+    neue oder geänderte Proben aus.
+    """
+
+    def __init__(self, root_folder: Path, config: Optional[AnalysisConfig] = None,
+                 output_folder: Optional[Path] = None, poll_interval: float = 2.0, export_delay: float = 10.0):
+        """
+        Args:
+            root_folder: Überordner mit den Messreihen-Ordnern
+            config: Analysekonfiguration (Einbetttiefe, Arbeitsintervalle, Modul, Kernel-Backend, Export)
+            output_folder: Ordner für die Excel-Dateien (Standard: root_folder / 'SFPO_Ergebnisse')
+            poll_interval: Wartezeit zwischen zwei Durchläufen in Sekunden
+            export_delay: Ruhezeit nach der letzten Änderung bis zum Excel-Export in Sekunden
+        """
+        self.root_folder = Path(root_folder)
+        self.config = config or AnalysisConfig()
+        self.output_folder = output_folder or self.root_folder / "SFPO_Ergebnisse"
+        self.poll_interval = poll_interval
+        self.export_delay = export_delay
+        self.parser = SpecimenParser(self.config.max_embedding_length)
+        self.modulus_settings = ModulusSettings(self.config.modulus_lower_fraction,
+                                                self.config.modulus_upper_fraction, self.config.modulus_fit)
+        self.series: dict[str, SeriesState] = {}
+        self.exported_files: list[Path] = []
+        self.export_pending = False  # Änderungen seit dem letzten Export
+        self.last_change = 0.0  # time.monotonic() der letzten Änderung
+        self.logger = logging.getLogger('SFPO_Analyzer')
+
+    def scan_series(self, state: SeriesState) -> bool:
+        """
+        Gleicht eine Messreihe mit dem Dateisystem ab.
+        Liest nur neue oder geänderte Dateien ein und entfernt gelöschte. Die Kennwerte
+        der eingelesenen Dateien werden gemeinsam (compute_series_metrics) berechnet.
+
+        Returns:
+            True, wenn sich die Messreihe verändert hat
+        """
+        state.naming.update_paths(state.folder)
+        FileHandler.find_specimen_files(state.naming)
+        try:
+            DataSorter.analyze_filenames(state.naming, state.sorting)
+        except ValueError:
+            # Ordner ohne Messdateien
+            return False
+
+        changed = False
+        pending = []  # (Dateiname, Signatur, eingelesene Probe, war bereits vorhanden)
+        good_ones = set(state.sorting.good_ones)
+        for name in list(state.records):
+            if name not in good_ones:
+                del state.records[name]
+                changed = True
+
+        for name in state.sorting.good_ones:
+            path = state.folder / f"{name}.txt"
+            entry = state.naming.file_entries.get(path)
+            if entry is not None:
+                # Größe und Änderungszeit stammen bereits aus der Verzeichnissuche
+                signature = entry.signature
+            else:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns)
+            record = state.records.get(name)
+            if record is not None and (record.size, record.mtime_ns) == signature:
+                continue
+            if state.failed.get(name) == signature:
+                continue
+
+            try:
+                specimen = self.parser.parse(path)
+                if len(specimen.curve.force) == 0:
+                    raise ValueError("Leere Messung - keine Kennwerte berechenbar")
+            except Exception as e:
+                self.logger.error(f"Fehler beim Auswerten von {path}: {e}")
+                state.failed[name] = signature
+                continue
+            pending.append((name, signature, specimen, record is not None))
+
+        if pending:
+            changed = True
+            self.compute_records(state, pending)
+        return changed
+
+    def compute_records(self, state: SeriesState,
+                        pending: list[tuple[str, tuple[int, int], ParsedSpecimen, bool]]) -> None:
+        """Berechnet die Kennwerte der neu eingelesenen Proben mit dem konfigurierten Kernel-Backend."""
+        store = MeasurementStore.from_curves(specimen.curve for _, _, specimen, _ in pending)
+        metrics = compute_series_metrics(store, self.config.max_embedding_length, self.config.work_interval_count,
+                                         self.modulus_settings, backend=self.config.kernel_backend)
+        for (name, signature, specimen, updated), curve_metrics in zip(pending, metrics):
+            state.failed.pop(name, None)
+            state.records[name] = SpecimenRecord(*signature, specimen.curve, specimen.header, curve_metrics)
+            self.logger.info(f"{'Aktualisiert' if updated else 'Neu'}: {state.folder.name}/{name}")
+
+    def rebuild_aggregates(self, state: SeriesState) -> None:
+        """Bildet den Analyzer der Messreihe aus den gespeicherten Proben neu (ohne Dateizugriff)."""
+        # Reihenfolge wie bei der normalen Auswertung (Sortierreihenfolge der Dateinamen)
+        names = [name for name in state.sorting.good_ones if name in state.records]
+        if not names:
+            state.analyzer = None
+            return
+        records = [state.records[name] for name in names]
+
+        analyzer = MeasurementAnalyzer(self.config.max_embedding_length, state.naming, state.sorting)
+        analyzer.n_intervals = self.config.work_interval_count
+        analyzer.modulus_settings = self.modulus_settings
+        analyzer.kernel_backend = self.config.kernel_backend
+        analyzer.load_specimens([r.curve for r in records], [r.header for r in records],
+                                [r.metrics for r in records])
+        analyzer.calculate_area_normalized_works(max_allowed_length=self.config.max_embedding_length)
+        analyzer.calculate_area_normalized_work_segments(max_allowed_length=self.config.max_embedding_length)
+        if self.config.calculate_work_intervals:
+            analyzer.calculate_normed_intervals()
+            analyzer.calculate_interval_statistics()
+        state.analyzer = analyzer
+
+    def export(self) -> list[Path]:
+        """
+        Schreibt die Excel-Dateien für alle Messreihen unter festen Dateinamen neu
+        und entfernt Dateien, die nicht mehr erzeugt werden.
+        """
+        # Import hier, damit der Watch-Modus ohne Export-Abhängigkeiten startet
+        from src.core.excel_exporter import ExcelExporter
+
+        exporter = ExcelExporter(output_folder=self.output_folder, timestamped=False)
+        for name in sorted(self.series):
+            if self.series[name].analyzer is not None:
+                exporter.add_measurement_series(name, self.series[name].analyzer)
+        if not exporter.interval_data:
+            for old_path in self.exported_files:
+                old_path.unlink(missing_ok=True)
+            self.exported_files = []
+            return []
+
+        if self.config.excel_export_mode == 'consolidated':
+            tables = None if self.config.calculate_work_intervals else ['ergebnisse']
+            written = exporter.save_consolidated(self.config.excel_workbooks, tables, self.config.excel_engine)
+        else:
+            written = [exporter.save_to_excel()]
+            if self.config.calculate_work_intervals:
+                written.append(exporter.save_work_intervals_to_excel())
+                written.append(exporter.save_boxplot_data_to_excel())
+                written.append(exporter.save_area_normalized_work_to_excel())
+                written.append(exporter.save_work_segments_to_excel())
+        written = [path for path in written if path]
+
+        # Nicht mehr erzeugte Dateien entfernen (z.B. ohne flächennormierte Arbeit)
+        for old_path in self.exported_files:
+            if old_path not in written:
+                old_path.unlink(missing_ok=True)
+        self.exported_files = written
+        return written
+
+    def flush_export(self, force: bool = False) -> None:
+        """
+        Exportiert ausstehende Änderungen, sobald seit der letzten Änderung export_delay
+        Sekunden vergangen sind (force: sofort). Ist eine Datei gesperrt (z.B. in Excel
+        geöffnet), bleibt der Export ausstehend und wird im nächsten Durchlauf wiederholt.
+        """
+        if not self.export_pending or not self.config.export_to_excel:
+            return
+        if not force and time.monotonic() - self.last_change < self.export_delay:
+            return
+        start = time.perf_counter()
+        try:
+            written = self.export()
+        except OSError as e:
+            self.logger.warning(f"Excel-Export fehlgeschlagen, neuer Versuch im nächsten Durchlauf: {e}")
+            return
+        self.export_pending = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.logger.info(f"Excel-Dateien aktualisiert: {len(written)} ({elapsed_ms:.0f} ms)")
+
+    def poll_once(self) -> list[str]:
+        """
+        Ein Überwachungsdurchlauf über alle Messreihen.
+
+        Returns:
+            Namen der Messreihen, die sich geändert haben
+        """
+        start = time.perf_counter()
+        folders = {folder.name: folder for folder in FileHandler.get_measurement_series_folders(self.root_folder)
+                   if folder != self.output_folder}
+
+        changed_series = []
+        for name in list(self.series):
+            if name not in folders:
+                del self.series[name]
+                changed_series.append(name)
+
+        for name, folder in sorted(folders.items()):
+            state = self.series.setdefault(name, SeriesState(folder=folder))
+            if self.scan_series(state):
+                self.rebuild_aggregates(state)
+                changed_series.append(name)
+
+        if changed_series:
+            self.export_pending = True
+            self.last_change = time.monotonic()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.logger.info(f"Aktualisiert: {', '.join(changed_series)} ({elapsed_ms:.0f} ms)")
+        self.flush_export()
+        return changed_series
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """Überwacht den Ordner, bis max_polls erreicht ist oder mit Strg+C abgebrochen wird."""
+        self.logger.info(f"Überwache {self.root_folder} (alle {self.poll_interval} s, Abbruch mit Strg+C)")
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                self.poll_once()
+                polls += 1
+                if max_polls is None or polls < max_polls:
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            self.logger.info("Überwachung beendet")
+        # Ausstehende Änderungen nicht verlieren
+        self.flush_export(force=True)
+
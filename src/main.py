@@ -4,12 +4,18 @@ from src.core.file_handler import FileHandler
 from src.core.data_sorter import DataSorter
 from src.utils.debug_printer import DebugPrinter
 from src.utils.logger_setup import LoggerSetup
-from src.core.data_plotting import DataPlotter
-from src.core.excel_exporter import ExcelExporter
-from src.config.settings import naming_storage
-from src.core.statistical_analysis import StatisticalAnalyzer
+from src.config.settings import naming_storage, sort_storage, NamingInTheNameOf, SortOf
+from src.core.result_cache import MetricsCache, default_cache_folder
+from src.core.modulus_engine import ModulusSettings
+from src.utils.stage_profiler import StageProfiler, StageRecord
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-import matplotlib.pyplot as plt
+import argparse
+import logging
+import os
+import sys
 import numpy as np
 from typing import Optional, Dict
 
@@ -18,7 +24,10 @@ def process_single_series(
         logger,
         debug_printer,
         folder_path: Optional[Path] = None,
-        config: Optional[AnalysisConfig] = None
+        config: Optional[AnalysisConfig] = None,
+        naming: Optional[NamingInTheNameOf] = None,
+        sorting: Optional[SortOf] = None,
+        profiler: Optional[StageProfiler] = None
 ) -> Optional[MeasurementAnalyzer]:
     """Verarbeitet eine einzelne Messreihe mit konfigurierbaren Analyseschritten
 
@@ -27,10 +36,19 @@ def process_single_series(
         debug_printer: Debug-Printer-Instanz
         folder_path: Wenn gegeben, wird dieser Pfad verwendet, sonst wird nach Auswahl gefragt
         config: Konfigurationsobjekt zur Steuerung der Analyseschritte
+        naming: Pfadzustand der Messreihe (Standard: globales naming_storage)
+        sorting: Sortierzustand der Messreihe (Standard: globales sort_storage)
+        profiler: Misst die Verarbeitungsschritte je Messreihe (Standard: keine Messung)
     """
     # Standardkonfiguration wenn keine angegeben
     if config is None:
         config = AnalysisConfig()
+    if profiler is None:
+        profiler = StageProfiler(enabled=False)
+    if naming is None:
+        naming = naming_storage
+    if sorting is None:
+        sorting = sort_storage
     
     try:
         # Ordnerauswahl oder Pfadübernahme
@@ -41,92 +59,123 @@ def process_single_series(
                 return None
         else:
             selected_path = folder_path
-            naming_storage.update_paths(selected_path)
+        naming.update_paths(selected_path)
+        profiler.series = naming.main_folder
+        with profiler.stage('Archiv öffnen'):
+            archive = open_series_archive(config, naming.main_folder, logger)
         
-        # Dateien finden und sortieren
-        found_files = FileHandler.find_specimen_files()
-        if not found_files:
-            logger.warning("Keine Messdateien im ausgewählten Ordner gefunden")
-            return None
-        
-        debug_printer.print_file_handling_results()
-        DataSorter.analyze_filenames()
-        debug_printer.print_sorting_results()
+        if archive is not None:
+            # Probenliste aus dem Kurvenarchiv, die Textdateien werden nicht geöffnet
+            sorting.good_ones = archive.specimen_names(naming.main_folder)
+            sorting.bad_ones = archive.bad_ones(naming.main_folder)
+            sorting.good_ones_nr = len(sorting.good_ones)
+            sorting.bad_ones_nr = len(sorting.bad_ones)
+            naming.filenames = sorting.good_ones + sorting.bad_ones
+            debug_printer.print_sorting_results()
+        else:
+            # Dateien finden und sortieren
+            with profiler.stage('Dateisuche') as stage:
+                found_files = FileHandler.find_specimen_files(naming)
+                stage.items = len(naming.filenames) if found_files else 0
+            if not found_files:
+                logger.warning("Keine Messdateien im ausgewählten Ordner gefunden")
+                return None
+            
+            debug_printer.print_file_handling_results()
+            with profiler.stage('Sortierung', len(naming.filenames)):
+                DataSorter.analyze_filenames(naming, sorting)
+            debug_printer.print_sorting_results()
         
         # Analyse durchführen
-        analyzer = MeasurementAnalyzer()
+        analyzer = MeasurementAnalyzer(naming=naming, sorting=sorting)
         # Setze die konfigurierte maximale Einbetttiefe
         analyzer.max_allowed_length = config.max_embedding_length
-        
-        paths = analyzer.get_measurement_paths()
-        print(f"Gefundene Messpfade: {len(paths)}")
-        
-        analyzer.read_all_measurements()
-        print(f"Eingelesene Messungen: {len(analyzer.measurements_data)}")
+        analyzer.n_intervals = config.work_interval_count
+        analyzer.modulus_settings = ModulusSettings(config.modulus_lower_fraction, config.modulus_upper_fraction,
+                                                    config.modulus_fit)
+        analyzer.kernel_backend = config.kernel_backend
+        analyzer.read_workers = config.read_workers
+        if archive is not None:
+            with profiler.stage('Einlesen (Archiv)') as stage:
+                analyzer.load_from_archive(archive, naming.main_folder)
+                stage.items = len(analyzer.measurements_data)
+            logger.info(f"Messungen aus dem Archiv {archive.path.name}: {len(analyzer.measurements_data)}")
+        else:
+            analyzer.result_cache = open_result_cache(config, logger)
+            
+            paths = analyzer.get_measurement_paths()
+            logger.info(f"Gefundene Messpfade: {len(paths)}")
+            
+            with profiler.stage('Einlesen') as stage:
+                analyzer.read_all_measurements()
+                stage.items = len(analyzer.measurements_data)
+            logger.info(f"Eingelesene Messungen: {len(analyzer.measurements_data)}")
+            if analyzer.read_errors:
+                logger.warning(f"{len(analyzer.read_errors)} Messdateien konnten nicht gelesen werden und fehlen "
+                               f"in der Auswertung: {', '.join(error.path.name for error in analyzer.read_errors)}")
         
         # Grundlegende Berechnungen
-        analyzer.process_all_fiberdiameters()
-        analyzer.check_data_consistency()
-        analyzer.find_all_max_forces()
-        analyzer.find_all_embeddinglengths()
+        with profiler.stage('Faserdurchmesser', len(analyzer.measurements_data)):
+            analyzer.process_all_fiberdiameters()
+            analyzer.check_data_consistency()
         
-        # Verwende die konfigurierte Einbetttiefe für die Berechnungen
-        analyzer.calculate_all_works(max_allowed_length=config.max_embedding_length)
-        analyzer.interfaceshearstrength()
+        # Alle Kennwerte (F_max, Einbettlänge, Arbeit, Segmente, Intervalle, Modul, IFSS)
+        # für alle Kurven gemeinsam mit der konfigurierten Einbetttiefe
+        with profiler.stage('Kennwerte', len(analyzer.measurements_data)):
+            analyzer.calculate_all_metrics(max_allowed_length=config.max_embedding_length)
+        if analyzer.result_cache is not None:
+            logger.info(analyzer.result_cache.report())
         
         # Flächennormierte Arbeit berechnen, unabhängig von der Konfiguration
-        print("\n=== Berechnung der flächennormierten Arbeit ===")
+        logger.info("=== Berechnung der flächennormierten Arbeit ===")
         try:
             # Dies stellt sicher, dass die area_normalized_works Liste immer befüllt wird
-            area_norm_works = analyzer.calculate_area_normalized_works(max_allowed_length=config.max_embedding_length)
+            with profiler.stage('Flächennormierte Arbeit', len(analyzer.works)):
+                area_norm_works = analyzer.calculate_area_normalized_works(
+                    max_allowed_length=config.max_embedding_length)
             
             # Ausgabe der Ergebnisse
             if area_norm_works and len(area_norm_works) > 0:
                 mean_value = analyzer.calculate_mean('area_normalized_works')
                 std_value = analyzer.calculate_stddev('area_normalized_works')
-                print(f"✅ Flächennormierte Arbeit erfolgreich berechnet: {len(area_norm_works)} Werte")
-                print(f"   Mittelwert: {mean_value:.4f} µJ/µm²")
-                print(f"   Standardabweichung: {std_value:.4f} µJ/µm²")
+                logger.info(f"✅ Flächennormierte Arbeit erfolgreich berechnet: {len(area_norm_works)} Werte")
+                logger.info(f"   Mittelwert: {mean_value:.4f} µJ/µm²")
+                logger.info(f"   Standardabweichung: {std_value:.4f} µJ/µm²")
             else:
-                print("⚠️ Keine gültigen Werte für die flächennormierte Arbeit berechnet!")
+                logger.warning("⚠️ Keine gültigen Werte für die flächennormierte Arbeit berechnet!")
         except Exception as e:
-            print(f"❌ Fehler bei der Berechnung der flächennormierten Arbeit: {str(e)}")
-            import traceback
-            traceback.print_exc()
-        print("=" * 45)
+            logger.exception(f"❌ Fehler bei der Berechnung der flächennormierten Arbeit: {str(e)}")
         
         # Berechnung der Arbeitssegmente (vor und nach F_max)
-        print("\n=== Berechnung der Arbeitssegmente (vor und nach F_max) ===")
+        logger.info("=== Berechnung der Arbeitssegmente (vor und nach F_max) ===")
         try:
-            analyzer.calculate_all_work_segments(max_allowed_length=config.max_embedding_length)
-            
-            # Ausgabe der Ergebnisse
+            # Die Segmente stammen bereits aus calculate_all_metrics
             if analyzer.work_before_fmax and len(analyzer.work_before_fmax) > 0:
                 mean_before = analyzer.calculate_mean('work_before_fmax')
                 std_before = analyzer.calculate_stddev('work_before_fmax')
                 mean_after = analyzer.calculate_mean('work_after_fmax')
                 std_after = analyzer.calculate_stddev('work_after_fmax')
                 
-                print(f"✅ Arbeitssegmente erfolgreich berechnet: {len(analyzer.work_before_fmax)} Werte")
-                print(f"   Arbeit bis F_max: Mittelwert: {mean_before:.4f} µJ, Standardabweichung: {std_before:.4f} µJ")
-                print(f"   Arbeit nach F_max: Mittelwert: {mean_after:.4f} µJ, Standardabweichung: {std_after:.4f} µJ")
+                logger.info(f"✅ Arbeitssegmente erfolgreich berechnet: {len(analyzer.work_before_fmax)} Werte")
+                logger.info(f"   Arbeit bis F_max: Mittelwert: {mean_before:.4f} µJ, "
+                            f"Standardabweichung: {std_before:.4f} µJ")
+                logger.info(f"   Arbeit nach F_max: Mittelwert: {mean_after:.4f} µJ, "
+                            f"Standardabweichung: {std_after:.4f} µJ")
                 
                 # Prozentualer Anteil der Arbeit bis F_max an der Gesamtarbeit
                 if mean_before + mean_after > 0:
                     percent_before = (mean_before / (mean_before + mean_after)) * 100
-                    print(f"   Anteil der Arbeit bis F_max: {percent_before:.1f}%")
+                    logger.info(f"   Anteil der Arbeit bis F_max: {percent_before:.1f}%")
             else:
-                print("⚠️ Keine gültigen Werte für die Arbeitssegmente berechnet!")
+                logger.warning("⚠️ Keine gültigen Werte für die Arbeitssegmente berechnet!")
         except Exception as e:
-            print(f"❌ Fehler bei der Berechnung der Arbeitssegmente: {str(e)}")
-            import traceback
-            traceback.print_exc()
-        print("=" * 45)
+            logger.exception(f"❌ Fehler bei der Berechnung der Arbeitssegmente: {str(e)}")
         
         # Berechnung der flächennormierten Arbeitssegmente
-        print("\n=== Berechnung der flächennormierten Arbeitssegmente ===")
+        logger.info("=== Berechnung der flächennormierten Arbeitssegmente ===")
         try:
-            analyzer.calculate_area_normalized_work_segments(max_allowed_length=config.max_embedding_length)
+            with profiler.stage('Flächennormierte Segmente', len(analyzer.work_before_fmax)):
+                analyzer.calculate_area_normalized_work_segments(max_allowed_length=config.max_embedding_length)
             
             # Ausgabe der Ergebnisse
             if hasattr(analyzer, 'area_normalized_before_fmax') and analyzer.area_normalized_before_fmax and len(
@@ -136,53 +185,50 @@ def process_single_series(
                 mean_after = analyzer.calculate_mean('area_normalized_after_fmax')
                 std_after = analyzer.calculate_stddev('area_normalized_after_fmax')
                 
-                print(
-                    f"✅ Flächennormierte Arbeitssegmente erfolgreich berechnet: {len(analyzer.area_normalized_before_fmax)} Werte")
-                print(
-                    f"   Arbeit bis F_max: Mittelwert: {mean_before:.4f} µJ/µm², Standardabweichung: {std_before:.4f} µJ/µm²")
-                print(
-                    f"   Arbeit nach F_max: Mittelwert: {mean_after:.4f} µJ/µm², Standardabweichung: {std_after:.4f} µJ/µm²")
+                logger.info(f"✅ Flächennormierte Arbeitssegmente erfolgreich berechnet: "
+                            f"{len(analyzer.area_normalized_before_fmax)} Werte")
+                logger.info(f"   Arbeit bis F_max: Mittelwert: {mean_before:.4f} µJ/µm², "
+                            f"Standardabweichung: {std_before:.4f} µJ/µm²")
+                logger.info(f"   Arbeit nach F_max: Mittelwert: {mean_after:.4f} µJ/µm², "
+                            f"Standardabweichung: {std_after:.4f} µJ/µm²")
                 
                 # Prozentualer Anteil der flächennormierten Arbeit bis F_max an der Gesamtarbeit
                 if mean_before + mean_after > 0:
                     percent_before = (mean_before / (mean_before + mean_after)) * 100
-                    print(f"   Anteil der flächennormierten Arbeit bis F_max: {percent_before:.1f}%")
+                    logger.info(f"   Anteil der flächennormierten Arbeit bis F_max: {percent_before:.1f}%")
             else:
-                print("⚠️ Keine gültigen Werte für die flächennormierten Arbeitssegmente berechnet!")
+                logger.warning("⚠️ Keine gültigen Werte für die flächennormierten Arbeitssegmente berechnet!")
         except Exception as e:
-            print(f"❌ Fehler bei der Berechnung der flächennormierten Arbeitssegmente: {str(e)}")
-            import traceback
-            traceback.print_exc()
-        print("=" * 45)
-        
-        # In der main.py, wo die anderen statistischen Ausgaben sind
-        if config.calculate_work_intervals:
-            print("\nKumulative normierte Arbeit:")
-            stats = analyzer.get_cumulative_normed_work_statistics()
-            print("Position | Mittelwert ± Standardabweichung")
-            print("-" * 45)
-            for position in sorted(stats.keys(), key=lambda x: float(x.strip('%'))):
-                mean = stats[position]["mean"]
-                std = stats[position]["std"]
-                print(f"{position:8} | {mean:.4f} ± {std:.4f}")
+            logger.exception(f"❌ Fehler bei der Berechnung der flächennormierten Arbeitssegmente: {str(e)}")
         
         # Optionale Arbeitsberechnungen
         if config.calculate_work_intervals:
-            # Übergebe die konfigurierte Einbetttiefe
-            analyzer.calculate_all_work_intervals(max_allowed_length=config.max_embedding_length)
-            print("\nArbeitsintervalle:")
-            for i, intervals in enumerate(analyzer.work_intervals, 1):
-                print(f"Messung {i}: {intervals}")
+            # Die Arbeitsintervalle stammen bereits aus calculate_all_metrics
+            # Einzelwerte je Messung nur im Debug-Log, bei tausenden Proben sonst ein Großteil der Laufzeit
+            if logger.isEnabledFor(logging.DEBUG):
+                with profiler.stage('Ausgabe Arbeitsintervalle', len(analyzer.work_intervals)):
+                    logger.debug("Arbeitsintervalle:\n" + "\n".join(
+                        f"Messung {i}: {intervals}" for i, intervals in enumerate(analyzer.work_intervals, 1)))
             
-            analyzer.calculate_normed_intervals()
-            analyzer.calculate_interval_statistics()
+            with profiler.stage('Normierte Intervalle', len(analyzer.work_intervals)):
+                analyzer.calculate_normed_intervals()
+                analyzer.calculate_interval_statistics()
             
-            print("\nStatistik der normierten Intervalle:")
-            for i in range(10):
-                print(f"Intervall {i + 1}: "
-                      f"{analyzer.mean_normed_intervals[i]:.3f} ± "
-                      f"{analyzer.stddev_normed_intervals[i]:.3f} "
-                      f"(rel. Stdabw: {analyzer.rel_stddev_normed_intervals[i]:.1%})")
+            logger.info("Statistik der normierten Intervalle:\n" + "\n".join(
+                f"Intervall {i + 1}: "
+                f"{analyzer.mean_normed_intervals[i]:.3f} ± "
+                f"{analyzer.stddev_normed_intervals[i]:.3f} "
+                f"(rel. Stdabw: {analyzer.rel_stddev_normed_intervals[i]:.1%})"
+                for i in range(len(analyzer.mean_normed_intervals))))
+            
+            with profiler.stage('Kumulative Statistik', len(analyzer.cumulative_normed_works)):
+                stats = analyzer.get_cumulative_normed_work_statistics()
+            lines = ["Kumulative normierte Arbeit:", "Position | Mittelwert ± Standardabweichung", "-" * 45]
+            for position in sorted(stats.keys(), key=lambda x: float(x.strip('%'))):
+                mean = stats[position]["mean"]
+                std = stats[position]["std"]
+                lines.append(f"{position:8} | {mean:.4f} ± {std:.4f}")
+            logger.info("\n".join(lines))
         
         return analyzer
     
@@ -194,6 +240,129 @@ def process_single_series(
         return None
 
 
+def open_series_archive(config: AnalysisConfig, series: str, logger):
+    """
+    Öffnet das konfigurierte Kurvenarchiv, wenn es die Messreihe aktuell enthält.
+    Fehlt die Messreihe oder wurden Messdateien seither geändert, werden die
+    Textdateien eingelesen (Rückgabe None).
+    """
+    if config.curve_archive is None:
+        return None
+    from src.core.curve_archive import CurveArchive
+    try:
+        archive = CurveArchive(config.curve_archive)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Kurvenarchiv nicht lesbar ({e}), lese Textdateien")
+        return None
+    if series not in archive:
+        logger.info(f"Messreihe {series} nicht im Kurvenarchiv, lese Textdateien")
+        return None
+    if archive.max_allowed_length < config.max_embedding_length:
+        logger.warning(f"Kurvenarchiv wurde mit max. Einbetttiefe {archive.max_allowed_length} µm erstellt, "
+                       f"lese Textdateien")
+        return None
+    changed = archive.changed_specimens(series)
+    if changed:
+        logger.warning(f"{len(changed)} Messdateien von {series} seit dem Archivieren geändert, lese Textdateien")
+        return None
+    return archive
+
+
+def open_result_cache(config: AnalysisConfig, logger) -> Optional[MetricsCache]:
+    """
+    Öffnet den Ergebnis-Cache (config.cache_folder bzw. Cache-Ordner des Benutzers).
+    Ist der Ordner nicht beschreibbar, wird ohne Cache ausgewertet (Rückgabe None).
+    """
+    if not config.use_result_cache:
+        return None
+    cache_folder = config.cache_folder or default_cache_folder()
+    try:
+        return MetricsCache(cache_folder, max_size_mb=config.cache_max_mb, key_mode=config.cache_key_mode)
+    except OSError as e:
+        logger.warning(f"Ergebnis-Cache {cache_folder} nicht verfügbar ({e}), werte ohne Cache aus")
+        return None
+
+
+def build_curve_archive(root: Path, archive_path: Path, mode: str, max_embedding_length: float,
+                        dtype: str, logger) -> Optional[Path]:
+    """Überführt die Messreihe (single) bzw. alle Messreihen im Überordner in ein Kurvenarchiv."""
+    from src.core.curve_archive import build_archive
+    series_folders = [root] if mode == "single" else FileHandler.get_measurement_series_folders(root)
+    try:
+        return build_archive(series_folders, archive_path, max_embedding_length, dtype)
+    except (OSError, ValueError) as e:
+        logger.error(f"Kurvenarchiv konnte nicht erstellt werden: {e}")
+        return None
+
+
+@dataclass
+class SeriesResult:
+    """Picklebares Ergebnis der Analyse einer Messreihe (auch aus Worker-Prozessen)"""
+    name: str
+    analyzer: Optional[MeasurementAnalyzer] = None
+    error: Optional[str] = None
+    timings: list[StageRecord] = field(default_factory=list)  # Laufzeiten der Schritte (config.profile_stages)
+
+
+def _init_series_worker(level: int = logging.INFO) -> None:
+    """Richtet in frisch gestarteten Worker-Prozessen eine Konsolenausgabe für den Logger ein."""
+    logger = logging.getLogger('SFPO_Analyzer')
+    if not logger.handlers:
+        logger.setLevel(level)
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+
+
+def analyze_series_folder(folder: Path, config: AnalysisConfig) -> SeriesResult:
+    """
+    Analysiert eine Messreihe mit eigenem Pfad- und Sortierzustand.
+    Greift nicht auf die globalen Instanzen zu und kann daher in einem Worker-Prozess laufen.
+    """
+    logger = logging.getLogger('SFPO_Analyzer')
+    naming = NamingInTheNameOf()
+    sorting = SortOf()
+    profiler = StageProfiler(enabled=config.profile_stages, trace_memory=config.profile_memory)
+    try:
+        analyzer = process_single_series(
+            logger,
+            DebugPrinter(naming, sorting),
+            folder,
+            config=config,
+            naming=naming,
+            sorting=sorting,
+            profiler=profiler
+        )
+    except Exception as e:
+        return SeriesResult(name=folder.name, error=str(e), timings=profiler.records)
+    if analyzer is None:
+        return SeriesResult(name=folder.name, error="Analyse fehlgeschlagen", timings=profiler.records)
+    return SeriesResult(name=folder.name, analyzer=analyzer, timings=profiler.records)
+
+
+def analyze_series_folders(
+        series_folders: list[Path],
+        config: AnalysisConfig,
+        logger
+) -> list[SeriesResult]:
+    """
+    Analysiert alle Messreihen, bei config.parallel_series in einem Prozess-Pool.
+    Die Ergebnisse kommen in der Reihenfolge von series_folders zurück.
+    """
+    if not config.parallel_series or len(series_folders) < 2:
+        results = []
+        for folder in series_folders:
+            logger.info(f"\nAnalysiere Messreihe: {folder.name}")
+            results.append(analyze_series_folder(folder, config))
+        return results
+    
+    logger.info(f"Analysiere {len(series_folders)} Messreihen parallel "
+                f"(Worker: {config.max_workers or 'alle Kerne'})")
+    with ProcessPoolExecutor(max_workers=config.max_workers, initializer=_init_series_worker,
+                             initargs=(logger.getEffectiveLevel(),)) as executor:
+        return list(executor.map(analyze_series_folder, series_folders, repeat(config)))
+
+
 def perform_statistical_analysis(
         analyzers_dict: Dict[str, MeasurementAnalyzer],
         config: AnalysisConfig,
@@ -214,8 +383,13 @@ def perform_statistical_analysis(
     stats_folder.mkdir(exist_ok=True)
     logger.info(f"Statistische Analysen werden in {stats_folder} gespeichert")
     
-    # Initialisiere den StatisticalAnalyzer
-    stat_analyzer = StatisticalAnalyzer(logger=logger)
+    # Initialisiere den StatisticalAnalyzer (scipy/statsmodels/seaborn nur bei Bedarf laden)
+    from src.core.statistical_analysis import StatisticalAnalyzer
+    stat_analyzer = StatisticalAnalyzer(
+        logger=logger,
+        memory_budget_mb=config.bootstrap_memory_mb,
+        n_workers=config.bootstrap_workers
+    )
     
     # Führe statistische Analysen durch, wenn konfiguriert
     if config.perform_bootstrap or config.perform_anova:
@@ -240,44 +414,15 @@ def perform_statistical_analysis(
             logger.info("ANOVA-Analyse wurde durchgeführt")
 
 
-def main():
-    # Setup logging
-    logger = LoggerSetup.setup_logger()
-    debug_printer = DebugPrinter()
-    logger.info("Starting SFPO Analysis")
-    
-    # Analysetyp wählen
-    analysis_type = FileHandler.select_analysis_type()
-    
-    # Standardeinstellungen für Einbetttiefe
-    max_embedding_length = 1000.0
-    
-    # Dictionary für Analyseoptionen initialisieren - immer ein gültiges Standardwerte-Dictionary
-    analysis_options = {
-        "max_embedding_length": max_embedding_length,
-        "perform_bootstrap": False,
-        "perform_anova": False,
-        "bootstrap_samples": 1000,
-        "anova_target_size": 10,
-        "create_statistical_plots": True
-    }
-    
-    # Statistische Optionen wählen
-    if analysis_type == '2':  # Nur für Mehrfachanalyse statistische Optionen anbieten
-        logger.info("Analyseoptionen auswählen")
-        user_options = FileHandler.select_statistical_options()  # Verwende FileHandler
-        
-        # Aktualisiere Optionen nur, wenn gültige Werte zurückgegeben wurden
-        if user_options:
-            analysis_options.update(user_options)
-        
-        logger.info(f"Gewählte Analyseoptionen: {analysis_options}")
-        
-        # Aktualisiere die Einbetttiefe mit dem aktuellen Wert aus den Optionen
-        max_embedding_length = analysis_options["max_embedding_length"]
-        logger.info(f"Gewählte maximale Einbetttiefe: {max_embedding_length} µm")
+def build_configs(analysis_options: dict) -> tuple[AnalysisConfig, AnalysisConfig]:
+    """
+    Erstellt die Konfigurationen für Einzel- und Mehrfachanalyse aus den Analyseoptionen.
+
+    Returns:
+        Tupel (Schnelltest-Konfiguration, vollständige Konfiguration)
+    """
+    max_embedding_length = analysis_options["max_embedding_length"]
     
-    # Konfigurationen definieren
     quick_test_config = AnalysisConfig(
         max_embedding_length=max_embedding_length,  # Neue Konfigurationseinstellung
         calculate_zscores=False,
@@ -291,51 +436,488 @@ def main():
         export_to_excel=True,
         # Statistische Optionen
         perform_bootstrap=False,
-        perform_anova=False
+        perform_anova=False,
+        # Kurven für die Kraft-Weg-Plots ausdünnen
+        curve_decimation=analysis_options.get("curve_decimation", 'minmax'),
+        decimation_pixels=analysis_options.get("decimation_pixels"),
+        export_decimated_curves=analysis_options.get("export_decimated_curves", False),
+        curve_archive=analysis_options.get("curve_archive"),
+        work_interval_count=analysis_options.get("work_interval_count", 10),
+        modulus_lower_fraction=analysis_options.get("modulus_lower_fraction", 0.2),
+        modulus_upper_fraction=analysis_options.get("modulus_upper_fraction", 0.7),
+        modulus_fit=analysis_options.get("modulus_fit", 'secant'),
+        kernel_backend=analysis_options.get("kernel_backend", 'numpy'),
+        read_workers=analysis_options.get("read_workers", 8),
+        profile_stages=analysis_options.get("profile_stages", False),
+        profile_memory=analysis_options.get("profile_memory", False)
     )
     
     # Vollständige Konfiguration für Mehrfachanalyse mit statistischen Optionen
     full_analysis_config = AnalysisConfig(
         # Neue Konfiguration für Einbetttiefe
         max_embedding_length=max_embedding_length,
+        # Nächtliche Wiederholungsläufe: unveränderte Proben aus dem Cache laden
+        use_result_cache=analysis_options.get("use_result_cache", True),
+        cache_folder=analysis_options.get("cache_folder"),
         # Alle grundlegenden Optionen standardmäßig True
         # Füge statistische Optionen hinzu
         perform_bootstrap=analysis_options["perform_bootstrap"],
         perform_anova=analysis_options["perform_anova"],
         bootstrap_samples=analysis_options["bootstrap_samples"],
         anova_target_size=analysis_options["anova_target_size"],
-        create_statistical_plots=analysis_options["create_statistical_plots"]
+        create_statistical_plots=analysis_options["create_statistical_plots"],
+        # Parallelisierung der Messreihen (None: alle Kerne)
+        parallel_series=analysis_options.get("jobs") != 1,
+        max_workers=analysis_options.get("jobs"),
+        excel_export_mode=analysis_options.get("excel_export_mode", 'separate'),
+        columnar_export=analysis_options.get("columnar_export"),
+        curve_decimation=analysis_options.get("curve_decimation", 'minmax'),
+        decimation_pixels=analysis_options.get("decimation_pixels"),
+        export_decimated_curves=analysis_options.get("export_decimated_curves", False),
+        curve_archive=analysis_options.get("curve_archive"),
+        work_interval_count=analysis_options.get("work_interval_count", 10),
+        modulus_lower_fraction=analysis_options.get("modulus_lower_fraction", 0.2),
+        modulus_upper_fraction=analysis_options.get("modulus_upper_fraction", 0.7),
+        modulus_fit=analysis_options.get("modulus_fit", 'secant'),
+        kernel_backend=analysis_options.get("kernel_backend", 'numpy'),
+        read_workers=analysis_options.get("read_workers", 8),
+        profile_stages=analysis_options.get("profile_stages", False),
+        profile_memory=analysis_options.get("profile_memory", False)
     )
+    return quick_test_config, full_analysis_config
+
+
+def plot_single_series(analyzer: MeasurementAnalyzer, max_embedding_length: float,
+                       decimation: Optional[str] = 'minmax', decimation_pixels: Optional[int] = None,
+                       dpi: float = 150) -> list:
+    """
+    Erstellt den Kraft-Weg-Plot aller Messungen einer einzelnen Messreihe.
+
+    Die Kurven werden vor dem Plotten auf die Ausgabeauflösung (Breite x dpi)
+    ausgedünnt. Gibt die geplotteten Kurven zurück, z.B. für den CSV-Export.
+    """
+    import matplotlib.pyplot as plt
+    from src.core.curve_decimation import resolve_pixels, decimate_curves
+    
+    figure_width = 10
+    plt.figure(figsize=(figure_width, 7))
+    colors = plt.cm.plasma(np.linspace(0, 1, len(analyzer.measurements_data)))
+    curves = decimate_curves(analyzer.measurements_data, decimation,
+                             resolve_pixels(figure_width, dpi, decimation_pixels), (0.0, max_embedding_length))
+    
+    for i, (measurement, color) in enumerate(zip(curves, colors)):
+        distances, forces = measurement
+        plt.plot(distances, forces, color=color, label=f'Messung {i + 1}')
+    
+    # Verwende die konfigurierte maximale Einbetttiefe
+    plt.xlim(0, max_embedding_length)
+    plt.ylim(0, 0.3)
+    plt.xticks(
+        np.arange(0, max_embedding_length + 1, max_embedding_length / 5),
+        fontsize=26, fontweight='bold')
+    plt.yticks(np.arange(0, 0.31, 0.05), fontsize=26, fontweight='bold')
+    
+    plt.xlabel('Displacement [µm]', fontsize=30, fontweight='bold')
+    plt.ylabel('Force [N]', fontsize=30, fontweight='bold')
+    plt.grid(True)
+    return curves
+
+
+def run_multi_series(parent_folder: Path, config: AnalysisConfig, logger,
+                     profiler: Optional[StageProfiler] = None) -> None:
+    """
+    Analysiert alle Messreihen im Überordner und speichert Excel-Dateien,
+    Plots und statistische Analysen im Unterordner 'SFPO_Ergebnisse'.
+    Mit aktivem profiler werden die Laufzeiten aller Schritte (auch aus den
+    Worker-Prozessen) als SFPO_Laufzeiten.json/.xlsx dort abgelegt.
+    """
+    from src.core.excel_exporter import ExcelExporter
+    
+    if profiler is None:
+        profiler = StageProfiler(enabled=config.profile_stages, trace_memory=config.profile_memory)
+    
+    # Erstelle einen Ergebnisordner innerhalb des ausgewählten Ordners
+    results_folder = parent_folder / "SFPO_Ergebnisse"
+    results_folder.mkdir(exist_ok=True)
+    logger.info(f"Ergebnisse werden in {results_folder} gespeichert")
+
+    # Exporter mit dem Ergebnisordner initialisieren
+    exporter = ExcelExporter(output_folder=results_folder)
+    with profiler.stage('Messreihen suchen') as stage:
+        series_folders = FileHandler.get_measurement_series_folders(parent_folder)
+        stage.items = len(series_folders)
+    analyzers_dict = {}
+
+    # Jede Messreihe mit eigenem Zustand analysieren, Ergebnisse in Ordnerreihenfolge zusammenführen
+    with profiler.stage('Messreihen analysieren', len(series_folders)):
+        results = analyze_series_folders(series_folders, config, logger)
+    for result in results:
+        profiler.merge(result.timings)
+        if result.analyzer:
+            exporter.add_measurement_series(result.name, result.analyzer)
+            analyzers_dict[result.name] = result.analyzer
+        else:
+            logger.warning(f"Überspringe Messreihe {result.name} - {result.error}")
+
+    if analyzers_dict and config.columnar_export:
+        # Rohkurven und Kennwerte spaltenorientiert für Notebooks und spätere Läufe
+        from src.core.parquet_exporter import ColumnarExporter
+        columnar_exporter = ColumnarExporter(config.columnar_folder or results_folder / "SFPO_Daten",
+                                             config.columnar_export)
+        with profiler.stage('Spaltenexport', len(analyzers_dict)):
+            for name, analyzer in analyzers_dict.items():
+                columnar_exporter.add_measurement_series(name, analyzer)
+            try:
+                columnar_exporter.save()
+            except ImportError as e:
+                logger.error(str(e))
+
+    if analyzers_dict:
+        # Export und Plot-Erstellung basierend auf Konfiguration
+        if config.export_to_excel:
+            # Speichere alle Excel-Dateien automatisch im Ergebnisordner
+            consolidated = config.excel_export_mode == 'consolidated'
+            with profiler.stage('Excel-Export', len(analyzers_dict)):
+                if consolidated:
+                    # Alle Tabellen einmal aufbauen und gestreamt in eine (oder wenige) Arbeitsmappen schreiben
+                    tables = None if config.calculate_work_intervals else ['ergebnisse']
+                    saved_paths = exporter.save_consolidated(config.excel_workbooks, tables, config.excel_engine)
+                    for path in saved_paths:
+                        logger.info(f"Excel-Export gespeichert in: {path}")
+                    save_path = saved_paths[0] if saved_paths else None
+                else:
+                    save_path = exporter.save_to_excel()
+
+            if save_path and isinstance(save_path, Path):
+                # Plots als Jobs sammeln und gemeinsam (parallel) rendern
+                from src.core.plot_scheduler import PlotScheduler
+                plot_scheduler = PlotScheduler(
+                    analyzers_dict,
+                    max_workers=config.plot_workers,
+                    parallel=config.parallel_plots
+                )
+                
+                # Erstelle den Hauptordner für alle Plots
+                plots_base_folder = results_folder / "plots-auswertung"
+                plots_base_folder.mkdir(exist_ok=True)
+
+                # Speichere Arbeitsintervalle wenn aktiviert (im Gesamtexport bereits enthalten)
+                if config.calculate_work_intervals and not consolidated:
+                    intervals_path = exporter.save_work_intervals_to_excel()
+                    exporter.save_boxplot_data_to_excel()
+
+                    # Neue separate Excel-Datei für flächennormierte Arbeit
+                    area_norm_path = exporter.save_area_normalized_work_to_excel()
+                    if area_norm_path:
+                        logger.info(f"Flächennormierte Arbeitsdaten gespeichert in: {area_norm_path}")
+
+                    # Neue Excel-Datei für Arbeitssegmente speichern
+                    work_segments_path = exporter.save_work_segments_to_excel()
+                    if work_segments_path:
+                        logger.info(f"Arbeitssegmente gespeichert in: {work_segments_path}")
+
+                # Erstelle verschiedene Plots basierend auf Konfiguration
+                if config.create_standard_plots:
+                    standard_plots_folder = plots_base_folder / "kraft_weg-plots"
+                    standard_plots_folder.mkdir(exist_ok=True)
+                    # Übergebe die maximale Einbetttiefe an die Plot-Funktion
+                    plot_scheduler.add(
+                        'save_plots_for_series',
+                        standard_plots_folder,
+                        max_embedding_length=config.max_embedding_length,
+                        decimation=config.curve_decimation,
+                        decimation_pixels=config.decimation_pixels,
+                        export_curves=config.export_decimated_curves
+                    )
+
+                if config.create_boxplots:
+                    boxplots_folder = plots_base_folder / "box_plots"
+                    boxplots_folder.mkdir(exist_ok=True)
+                    plot_scheduler.add('create_boxplots', boxplots_folder)
+
+                    # Neuer Aufruf für den flächennormierten Arbeits-Boxplot
+                    plot_scheduler.add('create_area_normalized_work_boxplot', boxplots_folder)
+
+                # Erstelle einen eigenen Ordner für die flächennormierten Arbeitsplots
+                area_norm_plots_folder = plots_base_folder / "flaechennormierte_arbeit_plots"
+                area_norm_plots_folder.mkdir(exist_ok=True)
+
+                # Erstelle die neuen Visualisierungen
+                plot_scheduler.add('create_area_normalized_work_plot', area_norm_plots_folder)
+
+                # Erstelle einen eigenen Ordner für die Arbeitssegmente
+                work_segments_folder = plots_base_folder / "arbeitssegmente_plots"
+                work_segments_folder.mkdir(exist_ok=True)
+
+                # Erstelle Boxplots für Arbeitssegmente
+                plot_scheduler.add('create_work_segment_boxplots', work_segments_folder)
+                # Erstelle Balkendiagramme für Vergleich der Arbeitssegmente
+                plot_scheduler.add('create_work_segment_comparison_plot', work_segments_folder)
+
+                # Erstelle Boxplots für flächennormierte Arbeitssegmente
+                plot_scheduler.add('create_area_normalized_work_segment_boxplots', work_segments_folder)
+                # Erstelle Balkendiagramme für Vergleich der flächennormierten Arbeitssegmente
+                plot_scheduler.add('create_area_normalized_work_segment_comparison_plot', work_segments_folder)
+
+                if config.create_work_interval_plots:
+                    work_intervals_folder = plots_base_folder / "arbeitsintervalle"
+                    work_intervals_folder.mkdir(exist_ok=True)
+                    plot_scheduler.add('create_work_interval_plots', work_intervals_folder)
+
+                if config.create_normalized_plots:
+                    normalized_folder = plots_base_folder / "normierte_arbeit"
+                    normalized_folder.mkdir(exist_ok=True)
+                    plot_scheduler.add('create_normalized_plots', normalized_folder)
+
+                    # Methode für gemeinsamen Plot aller normierten Arbeitsintervalle
+                    plot_scheduler.add('create_combined_normalized_plots', normalized_folder)
+
+                if config.create_normalized_plots:
+                    mean_normalized_folder = plots_base_folder / "mittlere_normierte_arbeit"
+                    mean_normalized_folder.mkdir(exist_ok=True)
+                    plot_scheduler.add('create_mean_normalized_plots', mean_normalized_folder)
+
+                if config.create_violin_plots:
+                    violin_folder = plots_base_folder / "violin_plots"
+                    violin_folder.mkdir(exist_ok=True)
+                    plot_scheduler.add('create_violin_plots', violin_folder)
+
+                if config.create_zscore_plots and config.calculate_zscores:
+                    zscore_folder = plots_base_folder / "zscore_plots"
+                    zscore_folder.mkdir(exist_ok=True)
+                    plot_scheduler.add('create_z_score_plots', zscore_folder)
+
+                with profiler.stage('Plots') as stage:
+                    stage.items = len(plot_scheduler.run())
+
+                # Statistische Analysen (Bootstrap und ANOVA)
+                if config.perform_bootstrap or config.perform_anova:
+                    with profiler.stage('Statistik', len(analyzers_dict)):
+                        perform_statistical_analysis(
+                            analyzers_dict=analyzers_dict,
+                            config=config,
+                            output_folder=results_folder,
+                            logger=logger
+                        )
+
+                logger.info(f"Alle Ergebnisse gespeichert in: {results_folder}")
+    else:
+        logger.warning("Keine erfolgreichen Analysen durchgeführt")
+    
+    if profiler.enabled:
+        for path in profiler.save_report(results_folder):
+            logger.info(f"Laufzeitbericht gespeichert in: {path}")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Kommandozeilenoptionen für den Batch-Betrieb ohne GUI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="SFPO Analyzer. Ohne --root startet die interaktive Auswahl per Dialog.")
+    parser.add_argument("--root", type=Path, default=None,
+                        help="Messreihen-Ordner (single) bzw. Überordner mit Messreihen (multi/watch)")
+    parser.add_argument("--mode", choices=["single", "multi", "watch"], default="multi",
+                        help="Einzelne Messreihe, alle Messreihen oder Watch-Modus (Standard: multi)")
+    parser.add_argument("--max-embedding", type=float, default=1000.0,
+                        help="Maximale Einbetttiefe in µm (Standard: 1000)")
+    parser.add_argument("--bootstrap", type=int, default=0, metavar="N",
+                        help="Bootstrap-Analyse mit N Stichproben (0: aus)")
+    parser.add_argument("--anova", action="store_true", help="ANOVA zwischen den Messreihen")
+    parser.add_argument("--anova-target-size", type=int, default=10,
+                        help="Zielgröße je Gruppe für die ANOVA (Standard: 10)")
+    parser.add_argument("--no-statistical-plots", action="store_true",
+                        help="Keine Plots für Bootstrap und ANOVA erstellen")
+    parser.add_argument("--jobs", type=int, default=None, metavar="N",
+                        help="Anzahl paralleler Worker für die Messreihen (1: seriell, Standard: alle Kerne)")
+    parser.add_argument("--intervals", type=int, default=10, metavar="N",
+                        help="Anzahl gleich breiter Arbeitsintervalle über die Einbettlänge (Standard: 10)")
+    parser.add_argument("--modulus-window", type=float, nargs=2, default=[0.2, 0.7], metavar=("UNTEN", "OBEN"),
+                        help="Kraftniveaus für den Verbundmodul als Anteil von F_max (Standard: 0.2 0.7)")
+    parser.add_argument("--modulus-fit", choices=["secant", "lstsq"], default="secant",
+                        help="Verbundmodul als Sekante oder Ausgleichsgerade im Fenster (Standard: secant)")
+    parser.add_argument("--kernels", choices=["numpy", "numba", "auto"], default="numpy",
+                        help="Backend der Kennwertberechnung; numba nur, wenn installiert (Standard: numpy)")
+    parser.add_argument("--read-workers", type=int, default=8, metavar="N",
+                        help="Threads zum Einlesen der Messdateien je Messreihe (1: nacheinander)")
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction, default=True,
+                        help="Kurven und Kennwerte je Probe zwischenspeichern (Mehrfachanalyse, Standard: an)")
+    parser.add_argument("--cache-dir", type=Path, default=None, metavar="ORDNER",
+                        help=f"Ordner des Ergebnis-Caches (Standard: {default_cache_folder()})")
+    parser.add_argument("--decimation", choices=["minmax", "lttb", "none"], default="minmax",
+                        help="Ausdünnung der Kraft-Weg-Kurven vor dem Plotten (Standard: minmax)")
+    parser.add_argument("--decimation-pixels", type=int, default=None, metavar="N",
+                        help="Ausgabeauflösung für die Ausdünnung in Pixeln (Standard: Breite der Abbildung)")
+    parser.add_argument("--export-curves", action="store_true",
+                        help="Ausgedünnte Kurven als CSV neben den Kraft-Weg-Plots speichern")
+    parser.add_argument("--excel", choices=["separate", "consolidated"], default="separate",
+                        help="Excel-Export: eine Datei je Tabellengruppe oder alle Tabellen gestreamt in einer Datei")
+    parser.add_argument("--columnar", choices=["parquet", "arrow"], default=None,
+                        help="Kurven, Kennwerte und Statistiken zusätzlich als partitionierten Datensatz speichern")
+    parser.add_argument("--build-archive", type=Path, default=None, metavar="DATEI",
+                        help="Messdateien einmalig in ein binäres Kurvenarchiv überführen und beenden")
+    parser.add_argument("--archive-dtype", choices=["float32", "float64"], default="float64",
+                        help="Datentyp der Kurven im Archiv (Standard: float64)")
+    parser.add_argument("--archive", type=Path, default=None, metavar="DATEI",
+                        help="Kurven aus dem Archiv laden statt die Textdateien einzulesen")
+    parser.add_argument("--profile", action="store_true",
+                        help="Laufzeit, CPU-Zeit und Speicher je Verarbeitungsschritt messen (SFPO_Laufzeiten)")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Mit --profile zusätzlich den Spitzenwert der Allokationen messen (tracemalloc, langsam)")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING"], default="INFO",
+                        help="Ausführlichkeit von Konsole und Log-Datei (DEBUG: Einzelwerte je Messung)")
+    parser.add_argument("--interval", type=float, default=2.0,
+                        help="Abfrageintervall im Watch-Modus in Sekunden")
+    parser.add_argument("--export-delay", type=float, default=10.0,
+                        help="Watch-Modus: Excel-Export erst nach so vielen Sekunden ohne weitere Änderung")
+    return parser
+
+
+def run_headless(args: argparse.Namespace, logger, profiler: Optional[StageProfiler] = None) -> None:
+    """Führt die Auswertung ohne Dialoge mit den Kommandozeilenoptionen aus."""
+    if profiler is None:
+        profiler = StageProfiler(enabled=args.profile, trace_memory=args.profile_memory)
+    # Kein Fenster öffnen, Plots nur in Dateien schreiben (gilt auch für Worker-Prozesse)
+    os.environ["MPLBACKEND"] = "Agg"
+    
+    analysis_options = {
+        "max_embedding_length": args.max_embedding,
+        "perform_bootstrap": args.bootstrap > 0,
+        "perform_anova": args.anova,
+        "bootstrap_samples": args.bootstrap if args.bootstrap > 0 else 1000,
+        "anova_target_size": args.anova_target_size,
+        "create_statistical_plots": not args.no_statistical_plots,
+        "jobs": args.jobs,
+        "curve_decimation": None if args.decimation == "none" else args.decimation,
+        "decimation_pixels": args.decimation_pixels,
+        "export_decimated_curves": args.export_curves,
+        "excel_export_mode": args.excel,
+        "columnar_export": args.columnar,
+        "curve_archive": args.archive.resolve() if args.archive is not None else None,
+        "work_interval_count": args.intervals,
+        "modulus_lower_fraction": args.modulus_window[0],
+        "modulus_upper_fraction": args.modulus_window[1],
+        "modulus_fit": args.modulus_fit,
+        "kernel_backend": args.kernels,
+        "read_workers": args.read_workers,
+        "use_result_cache": args.cache,
+        "cache_folder": args.cache_dir.resolve() if args.cache_dir is not None else None,
+        "profile_stages": args.profile,
+        "profile_memory": args.profile_memory
+    }
+    logger.info(f"Analyseoptionen (Kommandozeile): {analysis_options}")
+    try:
+        ModulusSettings(*args.modulus_window, args.modulus_fit)
+    except ValueError as e:
+        logger.error(str(e))
+        return
+    quick_test_config, full_analysis_config = build_configs(analysis_options)
+    
+    root = args.root.resolve()
+    if not root.is_dir():
+        logger.error(f"Ordner existiert nicht: {root}")
+        return
+    
+    if args.build_archive is not None:
+        build_curve_archive(root, args.build_archive.resolve(), args.mode, args.max_embedding,
+                            args.archive_dtype, logger)
+        return
+    
+    if args.mode == "single":
+        analyzer = process_single_series(logger, DebugPrinter(), root, config=quick_test_config, profiler=profiler)
+        if analyzer:
+            results_folder = root / "SFPO_Ergebnisse"
+            results_folder.mkdir(exist_ok=True)
+            with profiler.stage('Plots', 1):
+                curves = plot_single_series(analyzer, quick_test_config.max_embedding_length,
+                                            quick_test_config.curve_decimation, quick_test_config.decimation_pixels)
+                import matplotlib.pyplot as plt
+                plot_path = results_folder / "kraft_weg_plot.png"
+                plt.savefig(plot_path, dpi=150, bbox_inches='tight')
+                plt.close()
+            if quick_test_config.export_decimated_curves:
+                from src.core.curve_decimation import export_curves_csv
+                export_curves_csv(curves, results_folder / "kraft_weg_curves.csv")
+            logger.info(f"Einzelanalyse erfolgreich abgeschlossen, Plot gespeichert: {plot_path}")
+            if profiler.enabled:
+                for path in profiler.save_report(results_folder):
+                    logger.info(f"Laufzeitbericht gespeichert in: {path}")
+        else:
+            logger.warning("Einzelanalyse fehlgeschlagen")
+    elif args.mode == "watch":
+        from src.core.watch_mode import SeriesWatcher
+        SeriesWatcher(root, full_analysis_config, poll_interval=args.interval,
+                      export_delay=args.export_delay).run()
+    else:
+        run_multi_series(root, full_analysis_config, logger, profiler)
+
+
+def log_stage_summary(profiler: StageProfiler, logger) -> None:
+    """Schreibt die Übersicht der gemessenen Schritte ins Log (nur mit --profile)."""
+    if profiler.enabled and profiler.records:
+        logger.info("Laufzeiten der Verarbeitungsschritte:\n" + profiler.summary_table())
+
+
+def main(argv: Optional[list[str]] = None):
+    args = build_arg_parser().parse_args(argv)
+    
+    # Setup logging
+    logger = LoggerSetup.setup_logger(getattr(logging, args.log_level))
+    logger.info("Starting SFPO Analysis")
+    
+    # Laufzeitmessung der Schritte, Übersicht am Ende im Log
+    profiler = StageProfiler(enabled=args.profile, trace_memory=args.profile_memory)
+    
+    if args.root is not None:
+        run_headless(args, logger, profiler)
+        log_stage_summary(profiler, logger)
+        logger.info("Analysis completed")
+        return
+    
+    debug_printer = DebugPrinter()
+    
+    # Analysetyp wählen
+    analysis_type = FileHandler.select_analysis_type()
+    
+    # Dictionary für Analyseoptionen initialisieren - immer ein gültiges Standardwerte-Dictionary
+    analysis_options = {
+        "max_embedding_length": 1000.0,
+        "perform_bootstrap": False,
+        "perform_anova": False,
+        "bootstrap_samples": 1000,
+        "anova_target_size": 10,
+        "create_statistical_plots": True,
+        "profile_stages": args.profile,
+        "profile_memory": args.profile_memory
+    }
+    
+    # Statistische Optionen wählen
+    if analysis_type == '2':  # Nur für Mehrfachanalyse statistische Optionen anbieten
+        logger.info("Analyseoptionen auswählen")
+        user_options = FileHandler.select_statistical_options()  # Verwende FileHandler
+        
+        # Aktualisiere Optionen nur, wenn gültige Werte zurückgegeben wurden
+        if user_options:
+            analysis_options.update(user_options)
+        
+        logger.info(f"Gewählte Analyseoptionen: {analysis_options}")
+        logger.info(f"Gewählte maximale Einbetttiefe: {analysis_options['max_embedding_length']} µm")
+    
+    # Konfigurationen definieren
+    quick_test_config, full_analysis_config = build_configs(analysis_options)
     
     if analysis_type == '1':
         # Einzelanalyse mit Schnelltest-Konfiguration
         analyzer = process_single_series(
             logger,
             debug_printer,
-            config=quick_test_config
+            config=quick_test_config,
+            profiler=profiler
         )
         if analyzer:
             # Erstelle und zeige den Plot für die einzelne Messreihe
-            plt.figure(figsize=(10, 7))
-            colors = plt.cm.plasma(np.linspace(0, 1, len(analyzer.measurements_data)))
-            
-            for i, (measurement, color) in enumerate(zip(analyzer.measurements_data, colors)):
-                distances, forces = zip(*measurement)
-                plt.plot(distances, forces, color=color, label=f'Messung {i + 1}')
-            
-            # Verwende die konfigurierte maximale Einbetttiefe
-            plt.xlim(0, quick_test_config.max_embedding_length)
-            plt.ylim(0, 0.3)
-            plt.xticks(
-                np.arange(0, quick_test_config.max_embedding_length + 1, quick_test_config.max_embedding_length / 5),
-                fontsize=26, fontweight='bold')
-            plt.yticks(np.arange(0, 0.31, 0.05), fontsize=26, fontweight='bold')
-            
-            plt.xlabel('Displacement [µm]', fontsize=30, fontweight='bold')
-            plt.ylabel('Force [N]', fontsize=30, fontweight='bold')
-            plt.grid(True)
-            
-            # Zeige den Plot an
+            plot_single_series(analyzer, quick_test_config.max_embedding_length,
+                               quick_test_config.curve_decimation, quick_test_config.decimation_pixels)
+            import matplotlib.pyplot as plt
             plt.show()
             
             logger.info("Einzelanalyse erfolgreich abgeschlossen")
@@ -347,144 +929,11 @@ def main():
         if not parent_folder:
             logger.warning("Kein Ordner ausgewählt")
             return
-        
-        # Erstelle einen Ergebnisordner innerhalb des ausgewählten Ordners
-        results_folder = parent_folder / "SFPO_Ergebnisse"
-        results_folder.mkdir(exist_ok=True)
-        logger.info(f"Ergebnisse werden in {results_folder} gespeichert")
-        
-        # Exporter mit dem Ergebnisordner initialisieren
-        exporter = ExcelExporter(output_folder=results_folder)
-        series_folders = FileHandler.get_measurement_series_folders(parent_folder)
-        analyzers_dict = {}
-        last_successful_analyzer = None
-        
-        for folder in series_folders:
-            logger.info(f"\nAnalysiere Messreihe: {folder.name}")
-            analyzer = process_single_series(
-                logger,
-                debug_printer,
-                folder,
-                config=full_analysis_config
-            )
-            if analyzer:
-                name = folder.name
-                exporter.add_measurement_series(name, analyzer)
-                analyzers_dict[name] = analyzer
-                last_successful_analyzer = analyzer
-            else:
-                logger.warning(f"Überspringe Messreihe {folder.name} - Analyse fehlgeschlagen")
-        
-        if analyzers_dict:
-            # Export und Plot-Erstellung basierend auf Konfiguration
-            if full_analysis_config.export_to_excel:
-                # Speichere alle Excel-Dateien automatisch im Ergebnisordner
-                save_path = exporter.save_to_excel()
-                
-                if save_path and isinstance(save_path, Path):
-                    # Erstelle den Hauptordner für alle Plots
-                    plots_base_folder = results_folder / "plots-auswertung"
-                    plots_base_folder.mkdir(exist_ok=True)
-                    
-                    # Speichere Arbeitsintervalle wenn aktiviert
-                    if full_analysis_config.calculate_work_intervals:
-                        intervals_path = exporter.save_work_intervals_to_excel()
-                        exporter.save_boxplot_data_to_excel()
-                        
-                        # Neue separate Excel-Datei für flächennormierte Arbeit
-                        area_norm_path = exporter.save_area_normalized_work_to_excel()
-                        if area_norm_path:
-                            logger.info(f"Flächennormierte Arbeitsdaten gespeichert in: {area_norm_path}")
-                        
-                        # Neue Excel-Datei für Arbeitssegmente speichern
-                        work_segments_path = exporter.save_work_segments_to_excel()
-                        if work_segments_path:
-                            logger.info(f"Arbeitssegmente gespeichert in: {work_segments_path}")
-                    
-                    # Erstelle verschiedene Plots basierend auf Konfiguration
-                    if full_analysis_config.create_standard_plots:
-                        standard_plots_folder = plots_base_folder / "kraft_weg-plots"
-                        standard_plots_folder.mkdir(exist_ok=True)
-                        # Übergebe die maximale Einbetttiefe an die Plot-Funktion
-                        DataPlotter.save_plots_for_series(
-                            analyzers_dict,
-                            standard_plots_folder,
-                            max_embedding_length=full_analysis_config.max_embedding_length
-                        )
-                    
-                    if full_analysis_config.create_boxplots:
-                        boxplots_folder = plots_base_folder / "box_plots"
-                        boxplots_folder.mkdir(exist_ok=True)
-                        DataPlotter.create_boxplots(analyzers_dict, boxplots_folder)
-                        
-                        # Neuer Aufruf für den flächennormierten Arbeits-Boxplot
-                        DataPlotter.create_area_normalized_work_boxplot(analyzers_dict, boxplots_folder)
-                    
-                    # Erstelle einen eigenen Ordner für die flächennormierten Arbeitsplots
-                    area_norm_plots_folder = plots_base_folder / "flaechennormierte_arbeit_plots"
-                    area_norm_plots_folder.mkdir(exist_ok=True)
-                    
-                    # Erstelle die neuen Visualisierungen
-                    DataPlotter.create_area_normalized_work_plot(analyzers_dict, area_norm_plots_folder)
-                    
-                    # Erstelle einen eigenen Ordner für die Arbeitssegmente
-                    work_segments_folder = plots_base_folder / "arbeitssegmente_plots"
-                    work_segments_folder.mkdir(exist_ok=True)
-                    
-                    # Erstelle Boxplots für Arbeitssegmente
-                    DataPlotter.create_work_segment_boxplots(analyzers_dict, work_segments_folder)
-                    # Erstelle Balkendiagramme für Vergleich der Arbeitssegmente
-                    DataPlotter.create_work_segment_comparison_plot(analyzers_dict, work_segments_folder)
-                    
-                    # Erstelle Boxplots für flächennormierte Arbeitssegmente
-                    DataPlotter.create_area_normalized_work_segment_boxplots(analyzers_dict, work_segments_folder)
-                    # Erstelle Balkendiagramme für Vergleich der flächennormierten Arbeitssegmente
-                    DataPlotter.create_area_normalized_work_segment_comparison_plot(analyzers_dict,
-                                                                                    work_segments_folder)
-                    
-                    if full_analysis_config.create_work_interval_plots:
-                        work_intervals_folder = plots_base_folder / "arbeitsintervalle"
-                        work_intervals_folder.mkdir(exist_ok=True)
-                        DataPlotter.create_work_interval_plots(analyzers_dict, work_intervals_folder)
-                    
-                    if full_analysis_config.create_normalized_plots:
-                        normalized_folder = plots_base_folder / "normierte_arbeit"
-                        normalized_folder.mkdir(exist_ok=True)
-                        DataPlotter.create_normalized_plots(analyzers_dict, normalized_folder)
-                        
-                        # Methode für gemeinsamen Plot aller normierten Arbeitsintervalle
-                        DataPlotter.create_combined_normalized_plots(analyzers_dict, normalized_folder)
-                    
-                    if full_analysis_config.create_normalized_plots:
-                        mean_normalized_folder = plots_base_folder / "mittlere_normierte_arbeit"
-                        mean_normalized_folder.mkdir(exist_ok=True)
-                        DataPlotter.create_mean_normalized_plots(analyzers_dict, mean_normalized_folder)
-                    
-                    if full_analysis_config.create_violin_plots:
-                        violin_folder = plots_base_folder / "violin_plots"
-                        violin_folder.mkdir(exist_ok=True)
-                        DataPlotter.create_violin_plots(analyzers_dict, violin_folder)
-                    
-                    if full_analysis_config.create_zscore_plots and full_analysis_config.calculate_zscores:
-                        zscore_folder = plots_base_folder / "zscore_plots"
-                        zscore_folder.mkdir(exist_ok=True)
-                        DataPlotter.create_z_score_plots(analyzers_dict, zscore_folder)
-                    
-                    # Statistische Analysen (Bootstrap und ANOVA)
-                    if full_analysis_config.perform_bootstrap or full_analysis_config.perform_anova:
-                        perform_statistical_analysis(
-                            analyzers_dict=analyzers_dict,
-                            config=full_analysis_config,
-                            output_folder=results_folder,
-                            logger=logger
-                        )
-                    
-                    logger.info(f"Alle Ergebnisse gespeichert in: {results_folder}")
-        else:
-            logger.warning("Keine erfolgreichen Analysen durchgeführt")
+        run_multi_series(parent_folder, full_analysis_config, logger, profiler)
     
+    log_stage_summary(profiler, logger)
     logger.info("Analysis completed")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,39 +3,42 @@ this code was made with the help of chatgpt, claude, gemini, stackoverflow ....
 """
 # src/utils/debug_printer.py
 import logging
-from src.config.settings import naming_storage, sort_storage
+from src.config.settings import naming_storage, sort_storage, NamingInTheNameOf, SortOf
 from src.config.config_manager import app_config
 
 
 class DebugPrinter:
-    def __init__(self):
+    def __init__(self, naming: NamingInTheNameOf = None, sorting: SortOf = None):
         # Wir holen uns eine Referenz auf unseren bestehenden Logger
         self.logger = logging.getLogger('SFPO_Analyzer')
+        # Zustand der Messreihe, die ausgegeben wird (Standard: globale Instanzen)
+        self.naming = naming if naming is not None else naming_storage
+        self.sorting = sorting if sorting is not None else sort_storage
 
     def print_file_handling_results(self):
         # Detaillierte Ausgabe der Dateisystem-Informationen
         self.logger.info("\n=== Datei-Verarbeitung ===")
-        self.logger.info(f"Ausgewählter Pfad: {naming_storage.root_path}")
-        self.logger.info(f"Hauptordner: {naming_storage.main_folder}")
-        self.logger.info(f"Anzahl gefundener Dateien: {len(naming_storage.filenames)}")
+        self.logger.info(f"Ausgewählter Pfad: {self.naming.root_path}")
+        self.logger.info(f"Hauptordner: {self.naming.main_folder}")
+        self.logger.info(f"Anzahl gefundener Dateien: {len(self.naming.filenames)}")
         # Detaillierte Dateiliste auf Debug-Level für weniger wichtige Details
-        self.logger.debug(f"Vollständige Dateiliste: {naming_storage.filenames}")
+        self.logger.debug(f"Vollständige Dateiliste: {self.naming.filenames}")
 
     def print_sorting_results(self):
         # Ausgabe der Sortierungsergebnisse
         self.logger.info("\n=== Sortierungsergebnisse ===")
-        self.logger.info(f"Erfolgreiche Messungen: {sort_storage.good_ones_nr}")
-        self.logger.info(f"Fehlgeschlagene Messungen: {sort_storage.bad_ones_nr}")
+        self.logger.info(f"Erfolgreiche Messungen: {self.sorting.good_ones_nr}")
+        self.logger.info(f"Fehlgeschlagene Messungen: {self.sorting.bad_ones_nr}")
 
         # Gesamtanzahl der Messungen
-        total = sort_storage.good_ones_nr + sort_storage.bad_ones_nr
+        total = self.sorting.good_ones_nr + self.sorting.bad_ones_nr
         self.logger.info(f"Gesamtanzahl der Messungen: {total}")
 
         # Detaillierte Listen auf Debug-Level
         self.logger.debug("Erfolgreiche Messungen Details:")
-        self.logger.debug(f"Dateien Erfolg: {sort_storage.good_ones}")
+        self.logger.debug(f"Dateien Erfolg: {self.sorting.good_ones}")
         self.logger.debug("Fehlgeschlagene Messungen Details:")
-        self.logger.debug(f"Dateien Abbruch: {sort_storage.bad_ones}")
+        self.logger.debug(f"Dateien Abbruch: {self.sorting.bad_ones}")
 
     def print_plot_config(self):
         """Gibt die aktuellen Plot-Konfigurationseinstellungen aus."""
@@ -2,25 +2,42 @@
 this code was made with the help of chatgpt, claude, gemini, stackoverflow .... u name it
 """
 # src/utils/logger_setup.py
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 
 class LoggerSetup:
+    # Hintergrund-Thread, der Konsole und Log-Datei bedient (siehe setup_logger)
+    _listener: Optional[logging.handlers.QueueListener] = None
+
     @staticmethod
-    def setup_logger():
+    def setup_logger(level: int = logging.INFO):
+        """
+        Richtet den Logger 'SFPO_Analyzer' mit Konsolenausgabe und Log-Datei ein.
+
+        Der Logger selbst hat nur einen QueueHandler; Konsole und Datei werden von
+        einem QueueListener in einem Hintergrund-Thread geschrieben, damit die
+        Ausgabe die Berechnung nicht blockiert. Nachrichten unterhalb von level
+        (Standard: INFO, Einzelwerte je Messung liegen auf DEBUG) werden gar nicht
+        erst erzeugt.
+        """
         try:
             # Logger Grundkonfiguration
             logger = logging.getLogger('SFPO_Analyzer')
-            logger.setLevel(logging.DEBUG)
+            logger.setLevel(level)
 
             # Wichtig: Stelle sicher, dass der Logger Nachrichten weiterleitet
             logger.propagate = True
 
             # Setze Handler zurück, um Doppelausgaben zu vermeiden
+            LoggerSetup.shutdown()
             logger.handlers = []
 
             # Konsolenausgabe einrichten
@@ -28,7 +45,7 @@ class LoggerSetup:
             console_handler.setLevel(logging.DEBUG)
             formatter = logging.Formatter('%(message)s')
             console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers = [console_handler]
 
             # Log-Verzeichnis einrichten mit Fehlerprüfung
             try:
@@ -38,7 +55,7 @@ class LoggerSetup:
                 # Überprüfe Schreibrechte
                 if not os.access(log_dir, os.W_OK):
                     print(f"Warnung: Keine Schreibrechte im Verzeichnis {log_dir}")
-                    return logger
+                    return LoggerSetup._start_listener(logger, handlers)
 
                 # Hier die Verwaltung der Log-Dateien aufrufen
                 LoggerSetup.manage_log_files(log_dir)
@@ -52,22 +69,23 @@ class LoggerSetup:
                     log_file.touch()
                 except Exception as e:
                     print(f"Warnung: Konnte Log-Datei nicht erstellen: {e}")
-                    return logger
+                    return LoggerSetup._start_listener(logger, handlers)
 
                 # Wenn alles funktioniert, füge den File Handler hinzu
                 file_handler = logging.FileHandler(log_file, encoding='utf-8')
                 file_handler.setLevel(logging.DEBUG)
                 file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                handlers.append(file_handler)
 
                 # Bestätige erfolgreiche Einrichtung
                 print(f"Log-Datei erfolgreich erstellt: {log_file}")
-                logger.info("Logging gestartet")
 
             except Exception as e:
                 print(f"Fehler beim Einrichten des File-Loggings: {e}")
                 # Gebe Logger mit nur Console Handler zurück
 
+            LoggerSetup._start_listener(logger, handlers)
+            logger.info("Logging gestartet")
             return logger
 
         except Exception as e:
@@ -77,6 +95,49 @@ class LoggerSetup:
             basic_logger.addHandler(logging.StreamHandler(sys.stdout))
             return basic_logger
 
+    @staticmethod
+    def _start_listener(logger: logging.Logger, handlers: list) -> logging.Logger:
+        """Hängt einen QueueHandler an den Logger und startet den QueueListener für die Handler."""
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        LoggerSetup._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        LoggerSetup._listener.start()
+        return logger
+
+    @staticmethod
+    def shutdown() -> None:
+        """Schreibt alle wartenden Nachrichten und beendet den QueueListener."""
+        listener, LoggerSetup._listener = LoggerSetup._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    @staticmethod
+    def _pause_listener() -> None:
+        """
+        Vor einem fork: Listener-Thread anhalten, damit er im Kindprozess keine
+        Sperre (z.B. von sys.stdout) hält, die dort nie mehr freigegeben würde.
+        """
+        if LoggerSetup._listener is not None:
+            LoggerSetup._listener.stop()
+
+    @staticmethod
+    def _resume_listener() -> None:
+        if LoggerSetup._listener is not None:
+            LoggerSetup._listener.start()
+
+    @staticmethod
+    def _use_direct_handlers() -> None:
+        """
+        In geforkten Worker-Prozessen läuft der Listener-Thread nicht mit; dort
+        schreibt der Logger direkt (synchron) in die geerbten Handler.
+        """
+        listener = LoggerSetup._listener
+        if listener is not None:
+            LoggerSetup._listener = None
+            logging.getLogger('SFPO_Analyzer').handlers = list(listener.handlers)
+
     # src/utils/logger_setup.py
     @staticmethod
     def manage_log_files(log_dir: Path, max_files: int = 5):
@@ -107,4 +168,10 @@ class LoggerSetup:
                 except Exception as e:
                     print(f"  ✗ Fehler beim Löschen: {e}")
 
-            print("=== Log Management Ende ===\n")
\ No newline at end of file
+            print("=== Log Management Ende ===\n")
+
+
+atexit.register(LoggerSetup.shutdown)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=LoggerSetup._pause_listener, after_in_parent=LoggerSetup._resume_listener,
+                        after_in_child=LoggerSetup._use_direct_handlers)
@@ -0,0 +1,202 @@
+"""
+stage_profiler.py - Laufzeitmessung der Verarbeitungsschritte je Messreihe
+
+Ein StageProfiler misst mit stage() als Kontextmanager (oder profiled() als
+Dekorator) je Schritt und Messreihe:
+
+- Wanduhrzeit und CPU-Zeit des Prozesses (alle Threads)
+- Höchststand des Arbeitsspeichers des Prozesses (RSS, wo verfügbar)
+- optional den Spitzenwert der Python/NumPy-Allokationen innerhalb des
+  Schritts (tracemalloc, verlangsamt die Auswertung merklich)
+- die Anzahl verarbeiteter Elemente (Dateien, Messungen, Plots, ...)
+
+Ein deaktivierter Profiler misst nichts, die Aufrufe bleiben im Code stehen.
+Worker-Prozesse geben ihre Einträge (picklebare StageRecords) mit dem
+Ergebnis zurück, der Hauptprozess führt sie mit merge() zusammen und schreibt
+den Bericht als JSON und Excel sowie eine Übersichtstabelle ins Log.
+"""
+
+# src/utils/stage_profiler.py
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource  # Nur Unix, unter Windows kein RSS-Höchststand
+except ImportError:
+    resource = None
+
+REPORT_NAME = "SFPO_Laufzeiten"
+
+# Offene Schritte aller Profiler des Prozesses, damit verschachtelte Schritte
+# (auch aus verschiedenen Profilern) den Spitzenwert der Allokationen weitergeben
+_open_stages: list['StageHandle'] = []
+_tracing_started = False  # tracemalloc wurde von einem Profiler gestartet
+
+
+def _max_rss_mb() -> Optional[float]:
+    """Höchststand des Arbeitsspeichers des Prozesses bisher in MB (Linux: KB, macOS: Byte)."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+
+@dataclass
+class StageRecord:
+    """Messwerte eines Schritts"""
+    stage: str
+    series: Optional[str]  # Messreihe, None für Schritte über alle Messreihen
+    wall_s: float
+    cpu_s: float
+    items: Optional[int] = None  # Anzahl verarbeiteter Elemente
+    max_rss_mb: Optional[float] = None  # Höchststand des Prozesses am Ende des Schritts
+    peak_alloc_mb: Optional[float] = None  # Spitzenwert der Allokationen im Schritt (nur mit trace_memory)
+    pid: int = 0
+
+
+class StageHandle:
+    """Wird von stage() zurückgegeben, damit der Schritt seine Elementanzahl nachtragen kann."""
+
+    def __init__(self, items: Optional[int] = None):
+        self.items = items
+        self.peak_alloc = 0  # Spitzenwert der Allokationen in Byte (inkl. verschachtelter Schritte)
+
+
+class StageProfiler:
+    """Sammelt StageRecords für die Schritte eines Laufs."""
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        """
+        Args:
+            enabled: False: stage() und profiled() messen nichts
+            trace_memory: Spitzenwert der Allokationen je Schritt mit tracemalloc messen
+        """
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.records: list[StageRecord] = []
+        self.series: Optional[str] = None  # Messreihe, der neue Schritte zugeordnet werden
+
+    @contextmanager
+    def stage(self, name: str, items: Optional[int] = None, series: Optional[str] = None):
+        """
+        Misst den umschlossenen Block als Schritt name.
+
+        Args:
+            name: Name des Schritts
+            items: Anzahl der Elemente, kann auch später über handle.items gesetzt werden
+            series: Messreihe (Standard: self.series)
+        """
+        handle = StageHandle(items)
+        if not self.enabled:
+            yield handle
+            return
+
+        global _tracing_started
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracing_started = True
+            elif _open_stages:
+                # Bisherigen Spitzenwert des äußeren Schritts sichern, bevor er zurückgesetzt wird
+                _open_stages[-1].peak_alloc = max(_open_stages[-1].peak_alloc, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        _open_stages.append(handle)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield handle
+        finally:
+            wall_s, cpu_s = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            _open_stages.remove(handle)
+            peak_alloc_mb = None
+            if self.trace_memory and tracemalloc.is_tracing():
+                handle.peak_alloc = max(handle.peak_alloc, tracemalloc.get_traced_memory()[1])
+                peak_alloc_mb = handle.peak_alloc / 1e6
+                if _open_stages:
+                    _open_stages[-1].peak_alloc = max(_open_stages[-1].peak_alloc, handle.peak_alloc)
+                elif _tracing_started:
+                    tracemalloc.stop()
+                    _tracing_started = False
+            self.records.append(StageRecord(
+                stage=name, series=series if series is not None else self.series,
+                wall_s=wall_s, cpu_s=cpu_s, items=handle.items,
+                max_rss_mb=_max_rss_mb(), peak_alloc_mb=peak_alloc_mb, pid=os.getpid()))
+
+    def profiled(self, name: str):
+        """Dekorator: misst jeden Aufruf der Funktion als Schritt name."""
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def merge(self, records: Optional[list[StageRecord]]) -> None:
+        """Übernimmt die Einträge eines Worker-Prozesses."""
+        if self.enabled and records:
+            self.records.extend(records)
+
+    def totals(self) -> list[dict]:
+        """Summen je Schritt über alle Messreihen, in der Reihenfolge des ersten Auftretens."""
+        totals: dict[str, dict] = {}
+        for record in self.records:
+            entry = totals.setdefault(record.stage, {'stage': record.stage, 'calls': 0, 'wall_s': 0.0,
+                                                     'cpu_s': 0.0, 'items': 0, 'max_rss_mb': None,
+                                                     'peak_alloc_mb': None})
+            entry['calls'] += 1
+            entry['wall_s'] += record.wall_s
+            entry['cpu_s'] += record.cpu_s
+            entry['items'] += record.items or 0
+            for key in ('max_rss_mb', 'peak_alloc_mb'):
+                value = getattr(record, key)
+                if value is not None:
+                    entry[key] = value if entry[key] is None else max(entry[key], value)
+        return list(totals.values())
+
+    def summary_table(self) -> str:
+        """Übersicht je Schritt als Text (Zeiten summiert über Messreihen und Worker)."""
+        lines = [f"{'Schritt':<28} {'Aufrufe':>7} {'Wand [s]':>9} {'CPU [s]':>9} {'Elemente':>9} "
+                 f"{'RSS [MB]':>9} {'Alloc [MB]':>10}",
+                 "-" * 87]
+        for entry in self.totals():
+            rss = f"{entry['max_rss_mb']:.0f}" if entry['max_rss_mb'] is not None else "-"
+            alloc = f"{entry['peak_alloc_mb']:.1f}" if entry['peak_alloc_mb'] is not None else "-"
+            lines.append(f"{entry['stage']:<28} {entry['calls']:>7} {entry['wall_s']:>9.3f} {entry['cpu_s']:>9.3f} "
+                         f"{entry['items'] or '-':>9} {rss:>9} {alloc:>10}")
+        return "\n".join(lines)
+
+    def save_report(self, folder: Path) -> list[Path]:
+        """
+        Schreibt den Bericht als JSON (immer) und Excel (Blätter 'Schritte' und
+        'Summen', wenn pandas verfügbar ist) in den Ordner.
+
+        Returns:
+            Pfade der geschriebenen Dateien
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        records = [asdict(record) for record in self.records]
+        json_path = folder / f"{REPORT_NAME}.json"
+        with open(json_path, 'w', encoding='utf-8') as json_file:
+            json.dump({'stages': records, 'totals': self.totals()}, json_file, ensure_ascii=False, indent=2)
+        written = [json_path]
+
+        try:
+            import pandas as pd
+        except ImportError:
+            return written
+        excel_path = folder / f"{REPORT_NAME}.xlsx"
+        with pd.ExcelWriter(excel_path) as writer:
+            pd.DataFrame(records, columns=list(StageRecord.__dataclass_fields__)).to_excel(
+                writer, sheet_name='Schritte', index=False)
+            pd.DataFrame(self.totals()).to_excel(writer, sheet_name='Summen', index=False)
+        written.append(excel_path)
+        return written
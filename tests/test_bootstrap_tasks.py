@@ -0,0 +1,92 @@
+"""
+test_bootstrap_tasks.py - Reproduzierbarkeit und Speicherbudget der parallelen Bootstrap-Aufgaben
+
+Jeder Schlüssel (Messgröße, Messreihe) muss unabhängig von der Anzahl der Threads,
+von wiederholten Aufrufen und von den übrigen Aufgaben dieselben Stichproben liefern.
+"""
+
+# tests/test_bootstrap_tasks.py
+from unittest import mock
+import numpy as np
+import pytest
+from src.core import statistical_analysis
+from src.core.statistical_analysis import StatisticalAnalyzer
+
+N_BOOTSTRAP = 200
+SEED = 1
+
+
+def group_data(seed: int, n: int = 12) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0.5, 0.1, n)
+
+
+TASKS = [
+    (('F_max', 'A'), group_data(1)),
+    (('F_max', 'B'), group_data(2)),
+    (('Arbeit', 'A'), group_data(3, 20)),
+    (('Arbeit', 'B'), group_data(4, 8)),
+    (('IFSS', 'C'), group_data(5, 15)),
+]
+
+
+def run(tasks, n_workers: int = 1, memory_budget_mb: float = 256.0, analyzer: StatisticalAnalyzer = None):
+    analyzer = analyzer or StatisticalAnalyzer(seed=SEED, n_workers=n_workers, memory_budget_mb=memory_budget_mb)
+    return analyzer.run_bootstrap_tasks(tasks, N_BOOTSTRAP)
+
+
+def assert_same_results(results, reference):
+    for key, result in results.items():
+        for field in ('means', 'medians', 'stds'):
+            np.testing.assert_array_equal(result[field], reference[key][field], err_msg=f"{key} {field}")
+
+
+def test_independent_of_worker_count():
+    reference = run(TASKS, n_workers=1)
+    assert list(reference) == [key for key, _ in TASKS]
+    assert_same_results(run(TASKS, n_workers=8), reference)
+
+
+def test_independent_of_block_size():
+    # Bei kleinem Budget wird blockweise gezogen, der Zufallsstrom bleibt derselbe
+    reference = run(TASKS)
+    assert_same_results(run(TASKS, n_workers=8, memory_budget_mb=0.01), reference)
+
+
+def test_repeated_calls_on_same_analyzer():
+    analyzer = StatisticalAnalyzer(seed=SEED, n_workers=4)
+    first = run(TASKS, analyzer=analyzer)
+    assert_same_results(run(TASKS, analyzer=analyzer), first)
+
+
+@pytest.mark.parametrize('tasks', [
+    TASKS[1:],  # Gruppe entfernt
+    [(('F_max', 'A'), np.array([]))] + TASKS[1:],  # Gruppe ohne Daten
+    list(reversed(TASKS)),  # andere Reihenfolge
+    TASKS + [(('F_max', 'D'), group_data(6))],  # Gruppe hinzugefügt
+], ids=['entfernt', 'leer', 'umgekehrt', 'hinzugefuegt'])
+def test_independent_of_other_tasks(tasks):
+    reference = run(TASKS)
+    results = run(tasks)
+    shared = {key: result for key, result in results.items() if key in reference}
+    assert len(shared) >= len(TASKS) - 1
+    assert_same_results(shared, reference)
+
+
+def test_seed_changes_streams():
+    other = StatisticalAnalyzer(seed=SEED + 1).run_bootstrap_tasks(TASKS, N_BOOTSTRAP)
+    reference = run(TASKS)
+    assert not np.array_equal(other[('F_max', 'A')]['means'], reference[('F_max', 'A')]['means'])
+
+
+def test_memory_budget_shared_between_workers():
+    budgets = []
+    original = statistical_analysis.bootstrap_statistics
+
+    def record_budget(data, n_bootstrap, rng, memory_budget_mb):
+        budgets.append(memory_budget_mb)
+        return original(data, n_bootstrap, rng, memory_budget_mb)
+
+    with mock.patch.object(statistical_analysis, 'bootstrap_statistics', side_effect=record_budget):
+        run(TASKS, n_workers=4, memory_budget_mb=100.0)
+        run(TASKS[:2], n_workers=8, memory_budget_mb=100.0)
+    assert budgets == [25.0] * len(TASKS) + [50.0] * 2
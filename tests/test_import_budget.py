@@ -0,0 +1,27 @@
+"""
+test_import_budget.py - Importzeit-Budget des Einstiegsmoduls
+
+Misst den Import von src.main in einem frischen Interpreter mit -X importtime
+(siehe src/benchmarks/import_budget.py). Verbindlich geprüft wird, dass keine
+schweren Bibliotheken beim Start geladen werden. Die absolute Importzeit hängt
+von der Last des Rechners ab und wird nur mit SFPO_CHECK_IMPORT_TIME=1 geprüft.
+"""
+
+# tests/test_import_budget.py
+import os
+import pytest
+from src.benchmarks.import_budget import FORBIDDEN_AT_STARTUP, check_budget, measure_import
+
+MODULE = 'src.main'
+BUDGET_MS = 400.0
+
+
+def test_no_heavy_modules_at_startup():
+    loaded = {name.split('.')[0] for name in measure_import(MODULE)}
+    assert not loaded & set(FORBIDDEN_AT_STARTUP)
+
+
+@pytest.mark.skipif(os.environ.get('SFPO_CHECK_IMPORT_TIME') != '1',
+                    reason="Zeitmessung nur mit SFPO_CHECK_IMPORT_TIME=1")
+def test_import_within_budget():
+    assert check_budget(MODULE, BUDGET_MS), f"Import von {MODULE} überschreitet {BUDGET_MS:.0f} ms"
@@ -0,0 +1,100 @@
+"""
+test_kernel_backends.py - Kernel-Backends gegen die Einzelberechnung je Kurve
+
+batch_kernels.compute_series_metrics muss für jedes Backend dieselben Kennwerte
+liefern wie metric_kernels.compute_curve_metrics: gerundete Kennwerte identisch,
+laufende Arbeit an den Intervallgrenzen bis auf die Rundung der Gleitkommaaddition.
+Das numba-Backend wird nur geprüft, wenn numba installiert ist.
+"""
+
+# tests/test_kernel_backends.py
+import numpy as np
+import pytest
+from src.benchmarks.synthetic_corpus import synthetic_curve
+from src.core import modulus_engine
+from src.core.batch_kernels import compute_series_metrics, resolve_kernel_backend
+from src.core.measurement_store import MeasurementStore
+from src.core.metric_kernels import compute_curve_metrics
+from src.core.modulus_engine import ModulusSettings
+
+MAX_LENGTH = 1000.0
+TOLERANCE = 1e-9  # µJ
+ROUNDED_FIELDS = ('max_force', 'max_force_index', 'embedding_length', 'work', 'work_before_fmax',
+                  'work_after_fmax', 'work_intervals')
+MODULUS_FIELDS = ('force_modulus', 'modulus_point_low', 'modulus_point_high')
+SETTINGS = [ModulusSettings(), ModulusSettings(0.1, 0.5), ModulusSettings(fit='lstsq')]
+
+
+def edge_case_store(n_specimens: int = 200, n_samples: int = 120, seed: int = 42) -> MeasurementStore:
+    """Synthetische Messreihe mit Sonderfällen am Anfang."""
+    rng = np.random.default_rng(seed)
+    curves = [(np.array([1.0]), np.array([0.1])),  # Einzelner Messpunkt
+              (np.array([0.0, 2.0, 1.0, 3.0]), np.array([0.0, 0.1, 0.3, 0.2])),  # Weg läuft zurück
+              (np.array([0.0, 2.0, 2.0, 3.0]), np.array([0.0, 0.3, 0.3, 0.2])),  # Doppeltes Maximum
+              (np.array([0.0, 1.0, 2.0]), np.array([0.0, 0.1, 0.2])),  # F_max am Kurvenende
+              (np.array([0.0, 1.0, 2.0]), np.array([0.3, 0.2, 0.1]))]  # F_max am Kurvenanfang
+    distances, forces = synthetic_curve(rng, n_samples)[1:]
+    curves.append((distances * 5.0, forces))  # Reicht über die max. Einbetttiefe hinaus
+    sizes = rng.integers(max(n_samples // 2, 2), n_samples * 3 // 2 + 1, size=n_specimens)
+    curves.extend(synthetic_curve(rng, int(size))[1:] for size in sizes)
+    return MeasurementStore.from_curves(curves)
+
+
+@pytest.fixture(scope='module')
+def store() -> MeasurementStore:
+    return edge_case_store()
+
+
+@pytest.fixture(params=['numpy', 'numba'])
+def backend(request) -> str:
+    if request.param == 'numba':
+        pytest.importorskip('numba')
+    # Kein stiller Rückfall auf NumPy
+    assert resolve_kernel_backend(request.param) == request.param
+    return request.param
+
+
+def reference(store: MeasurementStore, n_intervals: int):
+    return [compute_curve_metrics(distances, forces, MAX_LENGTH, n_intervals) for distances, forces in store]
+
+
+@pytest.mark.parametrize('n_intervals', [10, 7])
+def test_rounded_metrics_identical(store, backend, n_intervals):
+    batch = compute_series_metrics(store, MAX_LENGTH, n_intervals, backend=backend)
+    for i, (expected, actual) in enumerate(zip(reference(store, n_intervals), batch, strict=True)):
+        for name in ROUNDED_FIELDS + MODULUS_FIELDS:
+            assert getattr(actual, name) == getattr(expected, name), f"Kurve {i}, {name}"
+
+
+@pytest.mark.parametrize('n_intervals', [10, 7])
+def test_cumulative_work_within_tolerance(store, backend, n_intervals):
+    batch = compute_series_metrics(store, MAX_LENGTH, n_intervals, backend=backend)
+    for i, (expected, actual) in enumerate(zip(reference(store, n_intervals), batch, strict=True)):
+        assert len(actual.cumulative_work) == n_intervals + 1
+        np.testing.assert_allclose(actual.cumulative_work, expected.cumulative_work, rtol=0, atol=TOLERANCE,
+                                   err_msg=f"Kurve {i}")
+
+
+@pytest.mark.parametrize('settings', SETTINGS, ids=lambda settings: f"{settings.fit}-{settings.lower_fraction}")
+def test_moduli_match_numpy_backend(store, backend, settings):
+    expected = compute_series_metrics(store, MAX_LENGTH, modulus_settings=settings, backend='numpy')
+    actual = compute_series_metrics(store, MAX_LENGTH, modulus_settings=settings, backend=backend)
+    for i, (a, b) in enumerate(zip(expected, actual, strict=True)):
+        for name in MODULUS_FIELDS:
+            assert getattr(b, name) == getattr(a, name), f"Kurve {i}, {name}"
+
+
+@pytest.mark.parametrize('settings', SETTINGS, ids=lambda settings: f"{settings.fit}-{settings.lower_fraction}")
+def test_numba_moduli_identical(store, settings):
+    pytest.importorskip('numba')
+    from src.core import numba_kernels
+    expected = modulus_engine.compute_moduli(store, settings)
+    actual = numba_kernels.compute_moduli(store, settings)
+    for name in ('moduli', 'max_force_index', 'index_low', 'index_high', 'valid'):
+        np.testing.assert_array_equal(getattr(actual, name), getattr(expected, name), err_msg=name)
+
+
+def test_empty_curve_rejected(backend):
+    store = MeasurementStore.from_curves([(np.array([0.0, 1.0]), np.array([0.0, 0.1])), (np.array([]), np.array([]))])
+    with pytest.raises(ValueError):
+        compute_series_metrics(store, MAX_LENGTH, backend=backend)
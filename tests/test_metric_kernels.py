@@ -0,0 +1,112 @@
+"""
+test_metric_kernels.py - Gemeinsamer Durchlauf gegen die Einzelberechnung je Kennwert
+
+compute_curve_metrics hat die Einzelmethoden von MeasurementAnalyzer
+(find_all_max_forces, find_all_embeddinglengths, calculate_all_works,
+calculate_all_work_segments) ersetzt und muss exakt dieselben gerundeten Werte
+liefern. legacy_metrics rechnet wie diese Methoden mit np.trapezoid je Kennwert,
+legacy_cumulative_work die Arbeit bis zu den Intervallgrenzen Punkt für Punkt.
+"""
+
+# tests/test_metric_kernels.py
+import numpy as np
+import pytest
+from src.benchmarks.synthetic_corpus import synthetic_curve
+from src.core.metric_kernels import compute_curve_metrics, interval_bounds
+
+MAX_LENGTH = 1000.0
+TOLERANCE = 1e-9  # µJ
+
+
+def _synthetic(seed: int, scale: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
+    distances, forces = synthetic_curve(np.random.default_rng(seed), 400)[1:]
+    return distances * scale, forces
+
+
+CURVES = {
+    'monoton': _synthetic(1),
+    'monoton_kurz': _synthetic(2),
+    'weg_laeuft_zurueck': (np.array([0.0, 2.0, 1.0, 3.0, 2.5, 4.0]), np.array([0.0, 0.1, 0.3, 0.2, 0.25, 0.1])),
+    'einzelner_punkt': (np.array([1.0]), np.array([0.1])),
+    'doppeltes_maximum': (np.array([0.0, 2.0, 2.0, 3.0]), np.array([0.0, 0.3, 0.3, 0.2])),
+    'fmax_am_anfang': (np.array([0.0, 1.0, 2.0]), np.array([0.3, 0.2, 0.1])),
+    'fmax_am_ende': (np.array([0.0, 1.0, 2.0]), np.array([0.0, 0.1, 0.2])),
+    'ueber_max_einbetttiefe': _synthetic(3, scale=5.0),
+    'nicht_monoton_ueber_max': (np.array([0.0, 600.0, 1200.0, 900.0, 1500.0, 800.0]),
+                                np.array([0.0, 0.2, 0.1, 0.15, 0.05, 0.02])),
+}
+
+
+def legacy_metrics(distances: np.ndarray, forces: np.ndarray, max_allowed_length: float) -> dict:
+    """Kennwerte wie in den früheren Einzelmethoden von MeasurementAnalyzer."""
+    max_force_index = int(np.argmax(forces))
+    embedding_length = min(float(np.max(distances)), max_allowed_length)
+    mask = distances <= embedding_length
+    work = round(np.trapezoid(forces[mask], distances[mask]), 3)
+
+    if max_force_index <= 0:
+        work_before = 0.0
+    else:
+        work_before = round(np.trapezoid(forces[:max_force_index + 1], distances[:max_force_index + 1]), 3)
+    if max_force_index >= len(forces) - 1:
+        work_after = 0.0
+    else:
+        after_mask = distances[max_force_index:] <= embedding_length
+        work_after = round(np.trapezoid(forces[max_force_index:][after_mask],
+                                        distances[max_force_index:][after_mask]), 3)
+    return {'max_force': float(np.max(forces)), 'max_force_index': max_force_index,
+            'embedding_length': embedding_length, 'work': work,
+            'work_before_fmax': work_before, 'work_after_fmax': work_after}
+
+
+def legacy_cumulative_work(distances: np.ndarray, forces: np.ndarray, positions: np.ndarray) -> list[float]:
+    """
+    Arbeit bis zu jeder Position: Trapeze bis zum ersten Erreichen der Position,
+    das letzte Trapez bis zur linear interpolierten Kraft an der Position.
+    """
+    result = []
+    for position in positions:
+        work, reached = 0.0, distances[0]
+        if len(distances) < 2 or position <= reached:
+            result.append(0.0)
+            continue
+        for i in range(1, len(distances)):
+            x0, x1, f0, f1 = distances[i - 1], distances[i], forces[i - 1], forces[i]
+            if reached < position <= x1:
+                f_position = f0 + (position - x0) / (x1 - x0) * (f1 - f0)
+                work += (position - x0) * (f0 + f_position) / 2.0
+                break
+            work += (x1 - x0) * (f0 + f1) / 2.0
+            reached = max(reached, x1)
+        else:
+            # Position nie erreicht: Arbeit bis zum ersten Erreichen des größten Wegs
+            peak = int(np.argmax(distances))
+            work = float(np.trapezoid(forces[:peak + 1], distances[:peak + 1]))
+        result.append(work)
+    return result
+
+
+@pytest.mark.parametrize('name', list(CURVES))
+def test_matches_legacy_methods(name):
+    distances, forces = CURVES[name]
+    metrics = compute_curve_metrics(distances, forces, MAX_LENGTH)
+    for field, expected in legacy_metrics(distances, forces, MAX_LENGTH).items():
+        assert getattr(metrics, field) == expected, field
+
+
+@pytest.mark.parametrize('n_intervals', [10, 7])
+@pytest.mark.parametrize('name', list(CURVES))
+def test_interval_work(name, n_intervals):
+    distances, forces = CURVES[name]
+    metrics = compute_curve_metrics(distances, forces, MAX_LENGTH, n_intervals)
+    embedding_length = min(float(np.max(distances)), MAX_LENGTH)
+    mask = distances <= embedding_length
+    expected = legacy_cumulative_work(distances[mask], forces[mask], interval_bounds(embedding_length, n_intervals))
+
+    np.testing.assert_allclose(metrics.cumulative_work, expected, rtol=0, atol=TOLERANCE)
+    assert metrics.work_intervals == [round(value, 3) for value in np.diff(metrics.cumulative_work).tolist()]
+
+
+def test_empty_curve_rejected():
+    with pytest.raises(ValueError):
+        compute_curve_metrics(np.array([]), np.array([]), MAX_LENGTH)
@@ -0,0 +1,130 @@
+"""
+test_result_cache.py - Schlüssel, Einträge und LRU-Verdrängung des MetricsCache
+
+Geänderte Dateien und geänderte Analyseparameter (max. Einbetttiefe, Anzahl der
+Intervalle, Modulfenster) müssen einen neuen Schlüssel ergeben, beschädigte
+Einträge werden verworfen und die Verdrängung hält max_size_mb ein.
+"""
+
+# tests/test_result_cache.py
+import os
+import numpy as np
+import pytest
+from src.core.measurement_store import Curve
+from src.core.metric_kernels import compute_curve_metrics
+from src.core.modulus_engine import ModulusSettings
+from src.core.result_cache import CachedSpecimen, MetricsCache
+from src.core.specimen_parser import SpecimenHeader
+
+MAX_LENGTH = 1000.0
+N_INTERVALS = 10
+
+
+def specimen(n: int = 200, seed: int = 1) -> CachedSpecimen:
+    displacement = np.linspace(0.5, 400.0, n)
+    force = np.abs(np.sin(displacement / 150.0)) * 0.1 + np.random.default_rng(seed).normal(0.0, 0.001, n) ** 2
+    curve = Curve(displacement, force)
+    header = SpecimenHeader(fiber_diameter=7.25, fields={'Prüfer': 'Müller'}, lines=['Prüfer\tMüller'])
+    return CachedSpecimen(curve, header, compute_curve_metrics(displacement, force, MAX_LENGTH, N_INTERVALS))
+
+
+@pytest.fixture
+def measurement(tmp_path):
+    path = tmp_path / "daten" / "Probe01a.txt"
+    path.parent.mkdir()
+    path.write_bytes(b"Kopf\n" + b"0.1\t1.0\t0.01\n" * 50)
+    return path
+
+
+@pytest.mark.parametrize('key_mode', ['content', 'stat'])
+def test_changed_file_gives_new_key(tmp_path, measurement, key_mode):
+    cache = MetricsCache(tmp_path / "cache", key_mode=key_mode)
+    key = cache.make_key(measurement, MAX_LENGTH, N_INTERVALS)
+    assert cache.make_key(measurement, MAX_LENGTH, N_INTERVALS) == key
+
+    mtime_ns = measurement.stat().st_mtime_ns
+    measurement.write_bytes(measurement.read_bytes().replace(b"0.01", b"0.02"))
+    os.utime(measurement, ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+    assert cache.make_key(measurement, MAX_LENGTH, N_INTERVALS) != key
+
+
+def test_content_key_ignores_mtime(tmp_path, measurement):
+    cache = MetricsCache(tmp_path / "cache", key_mode='content')
+    key = cache.make_key(measurement, MAX_LENGTH, N_INTERVALS)
+    os.utime(measurement, ns=(0, 0))
+    assert cache.make_key(measurement, MAX_LENGTH, N_INTERVALS) == key
+
+
+@pytest.mark.parametrize('changed', [
+    {'max_allowed_length': 800.0},
+    {'n_intervals': 7},
+    {'modulus_settings': ModulusSettings(lower_fraction=0.1)},
+    {'modulus_settings': ModulusSettings(upper_fraction=0.5)},
+    {'modulus_settings': ModulusSettings(fit='lstsq')},
+], ids=['einbetttiefe', 'intervalle', 'modul_unten', 'modul_oben', 'modul_verfahren'])
+def test_changed_parameters_give_new_key(tmp_path, measurement, changed):
+    cache = MetricsCache(tmp_path / "cache")
+    parameters = {'max_allowed_length': MAX_LENGTH, 'n_intervals': N_INTERVALS, 'modulus_settings': None}
+    key = cache.make_key(measurement, **parameters)
+    assert cache.make_key(measurement, **(parameters | {'modulus_settings': ModulusSettings()})) == key
+    assert cache.make_key(measurement, **(parameters | changed)) != key
+
+
+def test_round_trip(tmp_path):
+    cache = MetricsCache(tmp_path / "cache")
+    stored = specimen()
+    assert cache.get('a' * 40) is None
+    cache.put('a' * 40, stored)
+
+    loaded = cache.get('a' * 40)
+    np.testing.assert_array_equal(loaded.curve.displacement, stored.curve.displacement)
+    np.testing.assert_array_equal(loaded.curve.force, stored.curve.force)
+    assert loaded.header == stored.header
+    assert loaded.metrics == stored.metrics
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (1, 1, 1)
+
+
+@pytest.mark.parametrize('content', [b"", b"kein npz", b"PK\x03\x04abgeschnitten"], ids=['leer', 'text', 'zip'])
+def test_corrupt_entry_discarded(tmp_path, content):
+    cache = MetricsCache(tmp_path / "cache")
+    cache.put('b' * 40, specimen())
+    entry_path = cache.cache_folder / f"{'b' * 40}.npz"
+    entry_path.write_bytes(content)
+
+    assert cache.get('b' * 40) is None
+    assert not entry_path.exists()
+    assert cache.stats.misses == 1
+
+
+def test_eviction_respects_max_size(tmp_path):
+    cache = MetricsCache(tmp_path / "cache")
+    keys = [f"{nr:040d}" for nr in range(6)]
+    for nr, key in enumerate(keys):
+        cache.put(key, specimen(seed=nr))
+        entry_path = cache.cache_folder / f"{key}.npz"
+        os.utime(entry_path, ns=(nr * 10 ** 9, nr * 10 ** 9))  # Eintrag 0 ist der älteste
+    entry_size = (cache.cache_folder / f"{keys[0]}.npz").stat().st_size
+
+    # Ohne Überschreitung wird nichts gelöscht
+    assert cache.evict() == 0
+
+    # Zugriff auf den ältesten Eintrag macht ihn zum zuletzt genutzten
+    assert cache.get(keys[0]) is not None
+    cache.max_size_bytes = int(3.5 * entry_size)
+    assert cache.evict() == 3
+    assert cache.size_bytes() <= cache.max_size_bytes
+    remaining = sorted(path.stem for path in cache.cache_folder.glob('*.npz'))
+    assert remaining == sorted([keys[0], keys[4], keys[5]])
+    assert cache.stats.evictions == 3
+
+
+def test_temporary_files_not_counted(tmp_path):
+    cache = MetricsCache(tmp_path / "cache", max_size_mb=0.0)
+    (cache.cache_folder / f"{'c' * 40}.123.456.tmp.npz").write_bytes(b"x" * 1000)
+    assert cache.size_bytes() == 0
+    assert cache.evict() == 0
+
+
+def test_unknown_key_mode(tmp_path):
+    with pytest.raises(ValueError):
+        MetricsCache(tmp_path / "cache", key_mode='mtime')
@@ -0,0 +1,137 @@
+"""
+test_specimen_parser.py - SpecimenParser gegen das bisherige Einlesen mit pandas
+
+Vergleichsbasis ist pd.read_csv(skiprows=40) mit anschließender Bereinigung, wie
+es MeasurementAnalyzer.read_single_measurement vor dem SpecimenParser tat.
+Unregelmäßige Datenblöcke müssen über den pandas-Rückfall gelesen werden.
+"""
+
+# tests/test_specimen_parser.py
+from pathlib import Path
+from unittest import mock
+import numpy as np
+import pandas as pd
+import pytest
+from src.core.specimen_parser import DIAMETER_LINE, HEADER_LINES, SpecimenParser
+
+MAX_LENGTH = 1000.0
+DIAMETER = 7.25
+
+
+def header_bytes(encoding: str = 'ascii', unit: str = 'um') -> bytes:
+    lines = []
+    for line_nr in range(1, HEADER_LINES + 1):
+        if line_nr == DIAMETER_LINE:
+            lines.append(f"Faserdurchmesser [{unit}]\t{DIAMETER}")
+        elif line_nr == 3:
+            lines.append("Pruefer\tMueller" if encoding == 'ascii' else "Prüfer\tMüller")
+        else:
+            lines.append(f"Parameter {line_nr}\tWert {line_nr}")
+    return ("\n".join(lines) + "\n").encode(encoding)
+
+
+def data_bytes(rows: int = 200, seed: int = 1, newline: str = "\n") -> bytes:
+    rng = np.random.default_rng(seed)
+    displacement = np.linspace(-2.0, 1100.0, rows)  # Enthält Punkte vor 0 und hinter der max. Einbetttiefe
+    force = np.abs(np.sin(displacement / 200.0)) * 0.2 + rng.normal(0.0, 0.01, rows)
+    time = np.linspace(0.0, 100.0, rows)
+    return "".join(f"{t:.4f}\t{d:.4f}\t{f:.6f}{newline}"
+                   for t, d, f in zip(time, displacement, force)).encode('ascii')
+
+
+def old_pandas_curve(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """Bisheriges Einlesen der Kurve (pd.read_csv, Bereinigung wie im Parser)."""
+    df = pd.read_csv(path, delimiter="\t", header=None, skiprows=40, encoding='unicode_escape',
+                     names=["Time", "Displacement", "Force"], usecols=["Displacement", "Force"])
+    df = df[(df["Displacement"] > 0) & (df["Displacement"] < MAX_LENGTH) & (df["Force"] >= 0)]
+    return df["Displacement"].to_numpy(), df["Force"].to_numpy()
+
+
+def parse(path: Path):
+    """Liest die Datei mit dem Parser und meldet, ob der pandas-Rückfall verwendet wurde."""
+    with mock.patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+        specimen = SpecimenParser(MAX_LENGTH).parse(path)
+    return specimen, read_csv.called
+
+
+def assert_same_curve(specimen, path: Path):
+    displacement, force = old_pandas_curve(path)
+    np.testing.assert_array_equal(specimen.curve.displacement, displacement)
+    np.testing.assert_array_equal(specimen.curve.force, force)
+
+
+@pytest.mark.parametrize('newline', ["\n", "\r\n"], ids=['lf', 'crlf'])
+def test_clean_file_uses_fast_path(tmp_path, newline):
+    path = tmp_path / "01a_probe.txt"
+    path.write_bytes(header_bytes() + data_bytes(newline=newline))
+
+    specimen, fallback = parse(path)
+    assert not fallback
+    assert specimen.header.fiber_diameter == DIAMETER
+    assert len(specimen.curve.displacement) > 0
+    assert_same_curve(specimen, path)
+
+
+@pytest.mark.parametrize('malformed', [
+    b"50.0\t12.5\n",  # Kraft fehlt
+    b"\n",  # Leerzeile im Datenblock
+    b"50.0\t12.5\t0.1\t9.9\n",  # Vierter Wert (wird ignoriert)
+], ids=['fehlender_wert', 'leerzeile', 'zusaetzlicher_wert'])
+def test_malformed_rows_use_pandas_fallback(tmp_path, malformed):
+    rows = data_bytes().split(b"\n")
+    path = tmp_path / "02a_probe.txt"
+    path.write_bytes(header_bytes() + b"\n".join(rows[:50]) + b"\n" + malformed + b"\n".join(rows[50:]))
+
+    specimen, fallback = parse(path)
+    assert fallback
+    assert_same_curve(specimen, path)
+
+
+def test_offsetting_field_counts_use_pandas_fallback(tmp_path):
+    # Ein fehlender und ein überzähliger Wert ergeben zusammen 3 Werte je Zeile,
+    # die Spalten dürfen trotzdem nicht verschoben werden
+    block = b"0\t1\n1\t2\t3\t4\n2\t3\t4\n"
+    np.testing.assert_array_equal(SpecimenParser.parse_numeric_block(block),
+                                  [[0.0, 1.0, np.nan], [1.0, 2.0, 3.0], [2.0, 3.0, 4.0]])
+
+    rows = data_bytes().split(b"\n")
+    path = tmp_path / "02b_probe.txt"
+    path.write_bytes(header_bytes() + b"\n".join(rows[:50]) + b"\n50.0\t12.5\n50.1\t12.6\t0.1\t9.9\n"
+                     + b"\n".join(rows[50:]))
+
+    specimen, fallback = parse(path)
+    assert fallback
+    assert_same_curve(specimen, path)
+
+
+def test_non_utf8_header(tmp_path):
+    path = tmp_path / "03a_probe.txt"
+    path.write_bytes(header_bytes('latin-1', unit='µm') + data_bytes())
+    with pytest.raises(UnicodeDecodeError):
+        path.read_bytes().decode('utf-8')
+
+    specimen, fallback = parse(path)
+    assert not fallback
+    assert specimen.header.fiber_diameter == DIAMETER
+    assert specimen.header.fields['Prüfer'] == 'Müller'
+    assert specimen.header.lines[DIAMETER_LINE - 1] == f"Faserdurchmesser [µm]\t{DIAMETER}"
+    assert_same_curve(specimen, path)
+
+
+@pytest.mark.parametrize('block', [b"", b"\n\n"], ids=['leer', 'nur_leerzeilen'])
+def test_empty_data_block_rejected(tmp_path, block):
+    path = tmp_path / "04a_probe.txt"
+    path.write_bytes(header_bytes() + block)
+
+    # Bisher entstand eine leere Kurve; der Parser lehnt die Datei ab, damit sie als
+    # Lesefehler übersprungen wird statt die Kennwertberechnung der Messreihe abzubrechen
+    assert len(old_pandas_curve(path)[0]) == 0
+    with pytest.raises(ValueError):
+        SpecimenParser(MAX_LENGTH).parse(path)
+
+
+def test_too_few_header_lines(tmp_path):
+    path = tmp_path / "05a_probe.txt"
+    path.write_bytes(b"Parameter 1\tWert 1\n")
+    with pytest.raises(ValueError):
+        SpecimenParser(MAX_LENGTH).parse(path)
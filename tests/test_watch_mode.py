@@ -0,0 +1,97 @@
+"""
+test_watch_mode.py - Gebündelter Excel-Export des Watch-Modus unter festen Dateinamen
+
+Geänderte Messdateien lösen keinen sofortigen Export aus: geschrieben wird erst,
+wenn export_delay Sekunden lang keine weitere Änderung aufgetreten ist, und
+immer in dieselben Dateien ohne Zeitstempel.
+"""
+
+# tests/test_watch_mode.py
+import os
+from unittest import mock
+import numpy as np
+from src.core.data_statistics import AnalysisConfig
+from src.core.specimen_parser import DIAMETER_LINE, HEADER_LINES
+from src.core.watch_mode import SeriesWatcher
+
+
+def write_specimen(path, seed: int) -> None:
+    lines = [f"Faserdurchmesser [um]\t7.{seed}" if line_nr == DIAMETER_LINE else f"Parameter {line_nr}\tWert"
+             for line_nr in range(1, HEADER_LINES + 1)]
+    displacement = np.linspace(0.0, 400.0, 120)
+    force = np.abs(np.sin(displacement / 150.0)) * 0.1 * (1 + seed / 10)
+    time = np.linspace(0.0, 60.0, 120)
+    rows = [f"{t:.4f}\t{d:.4f}\t{f:.6f}" for t, d, f in zip(time, displacement, force)]
+    path.write_text("\n".join(lines + rows) + "\n", encoding='ascii')
+
+
+def make_root(tmp_path):
+    for series in ('Serie_1', 'Serie_2'):
+        folder = tmp_path / series
+        folder.mkdir()
+        for nr in range(3):
+            write_specimen(folder / f"Probe0{nr}a.txt", nr)
+    return tmp_path
+
+
+def watcher(root, export_delay: float) -> SeriesWatcher:
+    return SeriesWatcher(root, AnalysisConfig(use_result_cache=False), export_delay=export_delay)
+
+
+def exported_names(watcher: SeriesWatcher) -> list[str]:
+    return sorted(path.name for path in watcher.output_folder.glob('*.xlsx'))
+
+
+def touch_specimen(path, seed: int) -> None:
+    write_specimen(path, seed)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # Änderung auch bei grober mtime
+
+
+def test_stable_filenames(tmp_path):
+    watch = watcher(make_root(tmp_path), export_delay=0.0)
+    assert watch.poll_once() == ['Serie_1', 'Serie_2']
+    names = exported_names(watch)
+    assert 'SFPO_Ergebnisse.xlsx' in names
+    assert not any(char.isdigit() for name in names for char in name)
+
+    touch_specimen(tmp_path / 'Serie_1' / 'Probe01a.txt', 7)
+    assert watch.poll_once() == ['Serie_1']
+    assert exported_names(watch) == names
+
+
+def test_export_waits_for_quiet_period(tmp_path):
+    watch = watcher(make_root(tmp_path), export_delay=60.0)
+    with mock.patch.object(watch, 'export', wraps=watch.export) as export:
+        watch.poll_once()
+        touch_specimen(tmp_path / 'Serie_2' / 'Probe00a.txt', 5)
+        watch.poll_once()
+        assert not export.called
+        assert watch.export_pending
+
+        # Nach der Ruhezeit genau ein Export für beide Änderungen
+        watch.last_change -= 60.0
+        watch.poll_once()
+        watch.poll_once()
+        assert export.call_count == 1
+    assert not watch.export_pending
+    assert 'SFPO_Ergebnisse.xlsx' in exported_names(watch)
+
+
+def test_locked_file_retried(tmp_path):
+    watch = watcher(make_root(tmp_path), export_delay=0.0)
+    with mock.patch.object(watch, 'export', side_effect=PermissionError("gesperrt")):
+        watch.poll_once()
+    assert watch.export_pending
+
+    watch.poll_once()
+    assert not watch.export_pending
+    assert 'SFPO_Ergebnisse.xlsx' in exported_names(watch)
+
+
+def test_run_flushes_pending_export(tmp_path):
+    watch = watcher(make_root(tmp_path), export_delay=60.0)
+    watch.poll_interval = 0.0
+    watch.run(max_polls=1)
+    assert not watch.export_pending
+    assert 'SFPO_Ergebnisse.xlsx' in exported_names(watch)